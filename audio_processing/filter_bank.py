@@ -0,0 +1,128 @@
+"""
+Uniform DFT filter bank for frequency-domain equalization
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# FFTW-backed drop-in for numpy.fft, when pyfftw is installed
+try:
+    import pyfftw
+    from pyfftw.interfaces import numpy_fft as _fft
+except Exception:
+    pyfftw = None
+    _fft = np.fft
+
+
+def enable_fft_plan_cache(keepalive_sec=30):
+    """
+    Keep FFTW plans alive between calls so blocks reuse them.
+
+    Without the cache every pyfftw interface call plans again; with it the
+    per-block transform is a dictionary lookup plus the FFT. Does nothing
+    when pyfftw is not installed.
+
+    Returns:
+        bool: True if the cache was enabled.
+    """
+    if pyfftw is None:
+        return False
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(keepalive_sec)
+    return True
+
+
+class DFTFilterBank:
+    """
+    Non-maximally decimated DFT analysis/synthesis filter bank.
+
+    The prototype is a sqrt-Hann window of length M, so each of the M/2+1
+    subbands is computed once every M/2 samples (2x oversampled) and the
+    synthesis overlap-add reconstructs the input exactly when every gain is
+    1. Per-bin gains are applied as real (zero-phase) weights.
+
+    Blocks of any length are accepted; output is delayed by `latency`
+    samples. All frames that complete within a block are transformed with
+    one batched rfft/irfft call rather than one FFT per hop.
+
+    Attributes:
+        fft_size (int): Prototype/DFT length M.
+        hop (int): Decimation factor M/2.
+        gains (np.ndarray): Linear gain per rfft bin (M/2+1 values).
+    """
+
+    def __init__(self, fft_size=1024):
+        self.fft_size = int(fft_size)
+        self.hop = self.fft_size // 2
+        n = np.arange(self.fft_size)
+        # Periodic Hann squared-root: analysis * synthesis sums to 1 at M/2 hop
+        self._window = np.sqrt(0.5 - 0.5 * np.cos(2 * np.pi * n / self.fft_size))
+        self.gains = np.ones(self.hop + 1)
+        self._channels = None
+
+    @property
+    def latency(self):
+        """Delay in samples between input and output."""
+        return self.fft_size
+
+    def bin_frequencies(self, sample_rate):
+        """Center frequency in Hz of each subband."""
+        return np.fft.rfftfreq(self.fft_size, d=1.0 / sample_rate)
+
+    def reset(self):
+        """Drop all buffered audio; the next block starts a fresh stream."""
+        self._channels = None
+
+    def _init_state(self, channels):
+        self._channels = channels
+        # Previous hop of input (first half of the next frame) and the
+        # second half of the last synthesized frame awaiting its overlap
+        self._tail = np.zeros((self.hop, channels))
+        self._carry = np.zeros((channels, self.hop))
+        self._in_fifo = np.zeros((0, channels))
+        # Preloaded so every call can return as many samples as it received
+        self._out_fifo = np.zeros((self.hop, channels))
+
+    def process(self, data):
+        """
+        Filter a block through the bank.
+
+        Args:
+            data (np.ndarray): Block shaped (frames,) or (frames, channels).
+
+        Returns:
+            np.ndarray: Filtered block with the same shape as data.
+        """
+        x = data if data.ndim > 1 else data[:, np.newaxis]
+        if self._channels != x.shape[1]:
+            self._init_state(x.shape[1])
+
+        hop = self.hop
+        channels = x.shape[1]
+        pending = np.concatenate((self._in_fifo, x))
+        n_hops = len(pending) // hop
+        out_chunks = [self._out_fifo]
+        if n_hops:
+            # Every frame spans two hops: the previous one and a new one
+            signal = np.concatenate((self._tail, pending[:n_hops * hop]))
+            frames = sliding_window_view(signal, self.fft_size, axis=0)[::hop]
+
+            # (n_hops, channels, fft_size), transformed in one call
+            spectrum = _fft.rfft(frames * self._window, axis=-1)
+            spectrum *= self.gains
+            synth = _fft.irfft(spectrum, n=self.fft_size, axis=-1)
+            synth *= self._window
+
+            # With 50% overlap each output hop is one frame's first half
+            # plus the previous frame's second half
+            overlap = np.concatenate((self._carry[np.newaxis], synth[:-1, :, hop:]))
+            hops = synth[:, :, :hop] + overlap
+            out_chunks.append(hops.transpose(0, 2, 1).reshape(-1, channels))
+
+            self._carry = synth[-1, :, hop:].copy()
+            self._tail = signal[-hop:].copy()
+
+        self._in_fifo = pending[n_hops * hop:]
+        out = np.concatenate(out_chunks)
+        frames = x.shape[0]
+        self._out_fifo = out[frames:]
+        return out[:frames].reshape(data.shape)
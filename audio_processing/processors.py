@@ -1,24 +1,174 @@
 """
 Audio processors for enhancing audio quality
 """
+import threading
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
 
+from core.buffer_pool import AlignedPool
+
+from . import _dsp_kernels
+from .filter_bank import DFTFilterBank
+
 # Try to import native DSP backend (Rust via pyo3)
 try:
     import native_dsp
+    # The crate's source folder also imports as an empty namespace package
+    if not hasattr(native_dsp, 'EqualizerEngine'):
+        native_dsp = None
 except Exception:
     native_dsp = None
 
+# Compiled SOS cascade from the native crate, when the build provides it
+_native_apply_sos = getattr(native_dsp, 'apply_sos', None)
+
+
+@lru_cache(maxsize=256)
+def _design_band(kind, freq, gain_db, sample_rate, q=1.0):
+    """
+    Design one EQ band as a normalized second-order section.
+
+    Uses the RBJ audio-EQ cookbook shelf/peaking biquads, which are unity
+    at 0 dB so any number of them can be cascaded without colouring the
+    signal. Designs are memoized: moving one slider redesigns every band,
+    but all the others come straight from the cache.
+
+    Args:
+        kind (str): 'lowshelf', 'highshelf' or 'peak'.
+        freq (float): Center/corner frequency in Hz.
+        gain_db (float): Band gain in dB.
+        sample_rate (float): Sample rate in Hz.
+        q (float): Quality factor for peaking bands.
+
+    Returns:
+        tuple: SOS row (b0, b1, b2, 1, a1, a2).
+    """
+    # Keep the band strictly below Nyquist
+    freq = min(float(freq), 0.49 * float(sample_rate))
+    A = 10 ** (float(gain_db) / 40)
+    w0 = 2 * np.pi * freq / float(sample_rate)
+    cos_w = np.cos(w0)
+
+    if kind == 'peak':
+        alpha = np.sin(w0) / (2 * q)
+        b = [1 + alpha * A, -2 * cos_w, 1 - alpha * A]
+        a = [1 + alpha / A, -2 * cos_w, 1 - alpha / A]
+    else:
+        # Shelf slope S=1
+        two_sqrt_a_alpha = 2 * np.sqrt(A) * np.sin(w0) / np.sqrt(2)
+        if kind == 'lowshelf':
+            b = [A * ((A + 1) - (A - 1) * cos_w + two_sqrt_a_alpha),
+                 2 * A * ((A - 1) - (A + 1) * cos_w),
+                 A * ((A + 1) - (A - 1) * cos_w - two_sqrt_a_alpha)]
+            a = [(A + 1) + (A - 1) * cos_w + two_sqrt_a_alpha,
+                 -2 * ((A - 1) + (A + 1) * cos_w),
+                 (A + 1) + (A - 1) * cos_w - two_sqrt_a_alpha]
+        else:
+            b = [A * ((A + 1) + (A - 1) * cos_w + two_sqrt_a_alpha),
+                 -2 * A * ((A - 1) + (A + 1) * cos_w),
+                 A * ((A + 1) + (A - 1) * cos_w - two_sqrt_a_alpha)]
+            a = [(A + 1) - (A - 1) * cos_w + two_sqrt_a_alpha,
+                 2 * ((A - 1) - (A + 1) * cos_w),
+                 (A + 1) - (A - 1) * cos_w - two_sqrt_a_alpha]
+
+    return tuple(float(c / a[0]) for c in (b[0], b[1], b[2], a[0], a[1], a[2]))
+
+
+def _specialized_kernel(blocksize, channels, sections):
+    """Shape-specialized cascade for the negotiated format, or None."""
+    if not blocksize or not channels or _dsp_kernels.biquad_cascade is None:
+        return None
+    try:
+        return _dsp_kernels.specialized_biquad_cascade(int(blocksize), int(channels), int(sections))
+    except Exception as e:
+        print(f"Failed to compile specialized filter kernel: {e}")
+        return None
+
+
+def _run_sos(sos, x, zi, out=None, kernel=None):
+    """
+    Filter a (frames, channels) block through an SOS cascade.
+
+    Uses the numba kernel when available, then the native crate's
+    apply_sos for float32 blocks, otherwise signal.sosfilt.
+    The output has x's dtype whatever the precision of sos and zi. `out` is
+    an optional preallocated output for the compiled kernel, of x's shape
+    and dtype; sosfilt allocates its own. `kernel` is a cascade specialized
+    for x's exact shape (see _specialized_kernel); it is used for
+    C-contiguous float32 blocks.
+
+    Returns:
+        tuple: (filtered block, updated state shaped (sections, 2, channels)).
+    """
+    if (kernel is not None and out is not None and x.dtype == np.float32
+            and x.flags.c_contiguous):
+        kernel(x, sos, zi, out)
+        return out, zi
+    if _dsp_kernels.biquad_cascade is not None:
+        y = out if out is not None else np.empty_like(x)
+        _dsp_kernels.biquad_cascade(x, sos, zi, y)
+        return y, zi
+    if _native_apply_sos is not None and x.dtype == np.float32 and x.flags.c_contiguous:
+        return _native_apply_sos(x, sos, zi), zi
+    y, zi = signal.sosfilt(sos, x, axis=0, zi=zi)
+    return y.astype(x.dtype, copy=False), zi
+
+
+def _frozen(array):
+    """Mark an array read-only so it can be shared without copying."""
+    array.flags.writeable = False
+    return array
+
+
+def to_planar(data):
+    """Convert an interleaved (frames, channels) block to planar (channels, frames)."""
+    return np.ascontiguousarray(data.T)
+
+
+def to_interleaved(data):
+    """Convert a planar (channels, frames) block to interleaved (frames, channels)."""
+    return np.ascontiguousarray(data.T)
+
+
 class AudioProcessor:
     """Base class for all audio processors"""
     def __init__(self):
-        self.enabled = True
+        # Called with the processor whenever `enabled` changes
+        self._listeners = []
+        self._enabled = True
         # Processing format (optional; set by host)
         self.sample_rate = None
         self.channels = None
         self.blocksize = None
+        # Block layout: 'interleaved' (frames, channels) or 'planar' (channels, frames)
+        self.layout = 'interleaved'
+        # Scratch buffers for the audio thread (see _scratch)
+        self._pool = None
         
+    @property
+    def enabled(self):
+        """Whether the processor is applied"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        value = bool(value)
+        if value != self._enabled:
+            self._enabled = value
+            for listener in self._listeners:
+                listener(self)
+
+    def add_listener(self, callback):
+        """Register callback(processor), called when `enabled` changes"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a callback added with add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
     def process(self, data):
         """Process audio data"""
         if not self.enabled:
@@ -29,6 +179,20 @@ class AudioProcessor:
         """Implementation of the processing algorithm"""
         # Base class does nothing
         return data
+
+    def export_coeffs(self):
+        """
+        Current filter as an SOS array shaped (sections, 6), or None.
+
+        Processors that are a pure biquad cascade return their coefficients
+        so a ProcessorChain can run several of them in one fused pass;
+        None means the processor must be run through process().
+        """
+        return None
+
+    def reset(self):
+        """Forget state carried between blocks (filter history, buffers)"""
+        # Base class keeps no state
         
     def enable(self):
         """Enable the processor"""
@@ -42,15 +206,54 @@ class AudioProcessor:
         """Toggle the processor state"""
         self.enabled = not self.enabled
 
-    def set_format(self, sample_rate=None, channels=None, blocksize=None):
-        """Configure processing format (sample rate, channels, blocksize)."""
+    def set_format(self, sample_rate=None, channels=None, blocksize=None, layout=None):
+        """Configure processing format (sample rate, channels, blocksize, layout)."""
         # Base implementation stores values; subclasses may override.
+        if layout is not None:
+            self.set_layout(layout)
         if sample_rate is not None:
             self.sample_rate = int(sample_rate)
         if channels is not None:
             self.channels = int(channels)
         if blocksize is not None:
             self.blocksize = int(blocksize)
+        if self.blocksize and self.channels:
+            # Room for a float64 block so no dtype forces a regrow
+            self._pool = AlignedPool(self.blocksize * self.channels * 8)
+
+    def set_layout(self, layout):
+        """
+        Select the block layout the host delivers.
+
+        Planar blocks keep each channel contiguous, so per-channel math runs
+        on unit-stride arrays instead of stride-`channels` column views.
+        """
+        if layout not in ('interleaved', 'planar'):
+            raise ValueError(f"Unknown layout: {layout}")
+        self.layout = layout
+
+    def _as_frames(self, data):
+        """View a block as (frames, channels) regardless of layout."""
+        if data.ndim == 1:
+            return data[:, np.newaxis]
+        return data.T if self.layout == 'planar' else data
+
+    def _from_frames(self, y, data):
+        """Return a (frames, channels) result in the layout of `data`."""
+        if data.ndim > 1 and self.layout == 'planar':
+            return y.T
+        return y.reshape(data.shape)
+
+    def _scratch(self, shape, dtype):
+        """
+        Get a preallocated buffer from this processor's pool.
+
+        The buffer is reused after a few more requests, so it must not be
+        held beyond the next call to process.
+        """
+        if self._pool is None:
+            self._pool = AlignedPool(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return self._pool.acquire(shape, dtype)
 
 
 class Equalizer(AudioProcessor):
@@ -63,6 +266,9 @@ class Equalizer(AudioProcessor):
         _native (Optional[EqualizerEngine]): Native DSP backend for processing.
     """
 
+    # Smallest band count for which the DFT filter bank path is used
+    FILTER_BANK_MIN_BANDS = 8
+
     def __init__(self, sample_rate=48000, bands=10):
         """
         Initialize the Equalizer.
@@ -84,42 +290,69 @@ class Equalizer(AudioProcessor):
                 print(f"Failed to initialize native DSP backend: {e}")
                 self._native = None
 
-        # Ensure _native is always defined
-        self._native = None
-
         # Initialize band frequencies (logarithmically spaced)
         self.min_freq = 20
         self.max_freq = 20000
         self.frequencies = np.logspace(
             np.log10(self.min_freq),
             np.log10(self.max_freq),
-            bands
+            bands,
+            dtype=np.float32
         )
 
         # Initialize gains (in dB)
-        # Target gains set by UI
-        self.gains = np.zeros(bands)
+        # Float32 arrays so they can be handed to the native backend as-is
+        # Target gains set by UI; read-only and replaced on write, so the
+        # native side can borrow the buffer without a copy
+        self.gains = _frozen(np.zeros(bands, dtype=np.float32))
         # Smoothed gains used for filter design to avoid clicks
-        self._smoothed_gains = np.zeros(bands)
+        self._smoothed_gains = np.zeros(bands, dtype=np.float32)
         # Smoothing parameters
         self._smoothing_tau_sec = 0.03  # ~30ms smoothing
         self._alpha = 0.2               # fallback alpha if format unknown
         self._epsilon_db = 0.05         # threshold for filter update
         self._needs_update = True
+        # Smoothed gains the current cascade was designed from, and the
+        # (sample_rate, bands) and output gain it was built for
+        self._last_designed = np.zeros(bands, dtype=np.float32)
+        self._sos_key = None
+        self._folded_gain_db = 0.0
+        self._gain_delta = np.zeros(bands, dtype=np.float32)
+        # True while every band is flat and there is no output gain
+        self._identity = True
 
         # Output gain (master volume boost in dB)
         self.output_gain_db = 0.0
 
+        # Per-section filter state, shaped (sections, 2, channels)
+        self._zi = None
+        # Cascade compiled for the negotiated block shape (see set_format)
+        self._kernel = None
+
+        # Optional frequency-domain path (see set_filter_bank)
+        self._filter_bank = None
+
         # Initialize filters
         self.update_filters()
 
-    def set_format(self, sample_rate=None, channels=None, blocksize=None):
+        # Compile the JIT kernels now rather than on the first audio block
+        _dsp_kernels.warm_up()
+
+    def set_format(self, sample_rate=None, channels=None, blocksize=None, layout=None):
         """Update processing format and recompute filters when sample rate changes."""
-        super().set_format(sample_rate, channels, blocksize)
+        super().set_format(sample_rate, channels, blocksize, layout)
+        # Filter state is only valid for the format it was built with
+        self._zi = None
+        self._kernel = _specialized_kernel(self.blocksize, self.channels, self.bands)
+        if self._filter_bank is not None:
+            self._filter_bank.reset()
+        self._update_alpha()
         if sample_rate is not None:
+            # Designs for the previous rate will not be requested again
+            _design_band.cache_clear()
             # Recompute filters for new sample rate
             try:
-                self.update_filters()
+                self.update_filters(self._smoothed_gains)
             except Exception:
                 pass
         # Propagate to native backend
@@ -132,66 +365,122 @@ class Equalizer(AudioProcessor):
                 pass
         
     def update_filters(self, gains=None):
-        """Update filter coefficients based on provided gains (in dB)."""
-        self.filters = []
+        """Rebuild the stacked second-order-section cascade from gains (in dB)."""
         if gains is None:
             gains = self.gains
-        
-        for i, freq in enumerate(self.frequencies):
-            if abs(gains[i]) < 0.1:  # Skip if gain is close to 0 dB
-                continue
-                
-            # Convert from dB to linear gain
-            gain = 10 ** (gains[i] / 20)
-            
-            # Create a peaking EQ filter
-            Q = 1.0  # Filter quality factor
-            
-            if i == 0:  # Lowest band - use low shelf
-                b, a = signal.butter(2, freq / (self.sample_rate/2), 'low')
-                if gains[i] > 0:
-                    b = b * gain
-                else:
-                    a = a * gain
-            elif i == self.bands - 1:  # Highest band - use high shelf
-                b, a = signal.butter(2, freq / (self.sample_rate/2), 'high')
-                if gains[i] > 0:
-                    b = b * gain
-                else:
-                    a = a * gain
-            else:  # Mid bands - use peaking EQ
-                bandwidth = freq / Q
-                b, a = signal.butter(2, [
-                    (freq - bandwidth/2) / (self.sample_rate/2),
-                    (freq + bandwidth/2) / (self.sample_rate/2)
-                ], 'band')
-                if gains[i] > 0:
-                    b = b * gain
-                else:
-                    a = a * gain
-                
-            self.filters.append((b, a))
+
+        # One biquad per band: low shelf, peaking mids, high shelf. A 0 dB
+        # band designs to an exact identity section, so the section count
+        # stays fixed and the filter state carries over when gains move.
+        gains = np.asarray(gains, dtype=np.float32)
+        if self._sos_key == (self.sample_rate, self.bands) and len(self._last_designed) == self.bands:
+            # Only the bands whose gain moved need a new row
+            rows = np.flatnonzero(gains != self._last_designed)
+            if self._folded_gain_db != self.output_gain_db:
+                rows = np.union1d(rows, [self.bands - 1])
+            sos = self.sos.copy()
+        else:
+            rows = range(self.bands)
+            sos = np.empty((self.bands, 6))
+        fs = float(self.sample_rate)
+        for i in rows:
+            if i == 0:
+                kind = 'lowshelf'
+            elif i == self.bands - 1:
+                kind = 'highshelf'
+            else:
+                kind = 'peak'
+            sos[i] = _design_band(kind, float(self.frequencies[i]), float(gains[i]), fs)
+            # Fold the output gain into the last section so the block is
+            # traversed once instead of once more for a separate multiply
+            if i == self.bands - 1 and self.output_gain_db:
+                sos[i, 0:3] *= 10 ** (self.output_gain_db / 20)
+        # Published as a new array so readers never see a half-updated cascade
+        self.sos = sos
+        self._sos_key = (self.sample_rate, self.bands)
+        self._folded_gain_db = self.output_gain_db
+        self._identity = (not self.output_gain_db
+                          and bool(np.all(np.abs(gains) < self._epsilon_db)))
+        self._last_designed = np.array(gains, dtype=np.float32)
+        self._needs_update = False
+        if self._filter_bank is not None:
+            self._update_filter_bank_gains()
         # Propagate to native backend
         if self._native is not None:
             try:
-                self._native.set_gains([float(g) for g in gains])
+                self._native.set_gains(np.ascontiguousarray(gains, dtype=np.float32))
             except Exception:
                 pass
         
+    def reset(self):
+        """Clear filter history and land the smoothed gains on their targets"""
+        self._zi = None
+        if self._filter_bank is not None:
+            self._filter_bank.reset()
+        # A fresh stream has no previous output to glide from
+        self._smoothed_gains[:] = self.gains
+        self.update_filters(self._smoothed_gains)
+        if self._native is not None:
+            try:
+                # Re-applying the format rebuilds the native filters empty
+                self._native.set_format(float(self.sample_rate), int(self.channels or 2))
+            except Exception:
+                pass
+
+    def _update_filter_bank_gains(self):
+        """Sample the cascade's magnitude response at the filter bank bins."""
+        bins = self._filter_bank.bin_frequencies(self.sample_rate)
+        _, response = signal.sosfreqz(self.sos, worN=bins, fs=self.sample_rate)
+        self._filter_bank.gains = np.abs(response)
+
+    def _uses_filter_bank(self):
+        return self._filter_bank is not None and self.bands >= self.FILTER_BANK_MIN_BANDS
+
+    def set_filter_bank(self, enabled, fft_size=1024):
+        """
+        Switch between the IIR cascade and a DFT filter bank.
+
+        The filter bank applies the same magnitude response with zero phase
+        distortion and a per-block cost independent of the band count, at the
+        price of `fft_size` samples of latency. It is only used when the
+        equalizer has at least FILTER_BANK_MIN_BANDS bands.
+
+        Args:
+            enabled (bool): Use the filter bank when True.
+            fft_size (int): Filter bank length; sets resolution and latency.
+        """
+        if enabled:
+            self._filter_bank = DFTFilterBank(fft_size)
+            self._update_filter_bank_gains()
+        else:
+            self._filter_bank = None
+            self._zi = None
+
     def set_gain(self, band, gain_db):
         """Set the gain for a specific frequency band"""
         if band < 0 or band >= self.bands:
             raise ValueError(f"Band index {band} out of range")
             
-        # Update target gain; defer filter recompute to process for smoothing
-        self.gains[band] = gain_db
+        # Copy on write: the previous array may still be borrowed
+        gains = self.gains.copy()
+        gains[band] = gain_db
+        self._store_gains(gains)
+
+    def set_gains(self, gains):
+        """Set the gains of the first len(gains) bands at once (in dB)"""
+        gains = np.asarray(gains, dtype=np.float32)
+        if len(gains) > self.bands:
+            raise ValueError(f"Got {len(gains)} gains for {self.bands} bands")
+        new_gains = self.gains.copy()
+        new_gains[:len(gains)] = gains
+        self._store_gains(new_gains)
+
+    def _store_gains(self, gains):
+        """Publish a new target gains array"""
+        # Update target gain; process() glides the filters towards it and
+        # passes the smoothed gains on to the native backend
+        self.gains = _frozen(gains)
         self._needs_update = True
-        # Propagate to native backend using full gains vector (smoothed applied in process)
-        if self._native is not None:
-            try:
-                self._native.set_gains([float(g) for g in self.gains])
-            except Exception:
-                pass
 
     def set_bands(self, bands):
         """Change the number of bands and rebuild filters"""
@@ -202,32 +491,37 @@ class Equalizer(AudioProcessor):
         self.frequencies = np.logspace(
             np.log10(self.min_freq),
             np.log10(self.max_freq),
-            bands
+            bands,
+            dtype=np.float32
         )
-        new_gains = np.zeros(bands)
+        new_gains = np.zeros(bands, dtype=np.float32)
         copy_count = min(len(old_gains), bands)
         if copy_count > 0:
             new_gains[:copy_count] = old_gains[:copy_count]
-        self.gains = new_gains
+        self.gains = _frozen(new_gains)
         self._smoothed_gains = np.array(new_gains)
+        self._gain_delta = np.zeros(bands, dtype=np.float32)
+        self._kernel = _specialized_kernel(self.blocksize, self.channels, self.bands)
         self.update_filters(self._smoothed_gains)
         if self._native is not None:
             try:
                 self._native.set_bands(int(self.bands))
-                self._native.set_gains([float(g) for g in self._smoothed_gains])
+                self._native.set_gains(self._smoothed_gains)
             except Exception:
                 pass
 
     def set_output_gain(self, gain_db):
-        """Set master output gain in dB (applied post EQ)"""
+        """Set master output gain in dB (folded into the last EQ section)"""
         try:
             self.output_gain_db = float(gain_db)
         except Exception:
             self.output_gain_db = 0.0
+        # Refold the gain into the cascade on the next block
+        self._needs_update = True
         # Native backend output gain
         if self._native is not None:
             try:
-                self._native.set_output_gain(float(self.output_gain_db))
+                self._native.set_output_gain(np.float32(self.output_gain_db))
             except Exception:
                 pass
 
@@ -237,7 +531,38 @@ class Equalizer(AudioProcessor):
             self._smoothing_tau_sec = max(0.0, float(tau_seconds))
         except Exception:
             pass
+        self._update_alpha()
+
+    def _update_alpha(self):
+        """Derive the per-block smoothing factor from tau and the format."""
+        if self._smoothing_tau_sec <= 0:
+            self._alpha = 1.0
+        elif self.blocksize and self.sample_rate:
+            self._alpha = 1.0 - np.exp(-self.blocksize / (self.sample_rate * self._smoothing_tau_sec))
+
+    def _advance_smoothing(self):
+        """Move the smoothed gains one block towards the targets."""
+        delta = np.subtract(self.gains, self._smoothed_gains, out=self._gain_delta)
+        if np.max(np.abs(delta)) <= self._epsilon_db:
+            # Close enough: land exactly on the targets and stop smoothing
+            self._smoothed_gains[:] = self.gains
+            self.update_filters(self._smoothed_gains)
+            return
+        delta *= self._alpha
+        self._smoothed_gains += delta
+        # Only redesign once the gains have moved audibly
+        if np.max(np.abs(self._smoothed_gains - self._last_designed)) > self._epsilon_db:
+            self.update_filters(self._smoothed_gains)
+        self._needs_update = True
         
+    def export_coeffs(self):
+        """Current cascade for fused chain processing (see AudioProcessor)."""
+        if self._native is not None or self._uses_filter_bank() or self.bands == 0:
+            return None
+        if self._needs_update:
+            self._advance_smoothing()
+        return self.sos
+
     def process(self, data):
         """
         Process audio data.
@@ -252,7 +577,21 @@ class Equalizer(AudioProcessor):
             return data
 
         try:
-            if self._native:
+            if self._needs_update:
+                self._advance_smoothing()
+            # A flat EQ is a no-op; the filter bank still runs so its
+            # latency stays constant
+            if self._identity and not self._uses_filter_bank():
+                self._zi = None
+                return data
+            if self._native is not None:
+                # The native kernel reads the buffer directly; hand it a
+                # C-contiguous float32 block so pyo3 does not have to copy
+                if self.layout == 'planar' and data.ndim > 1:
+                    # The native engine expects interleaved samples
+                    return to_planar(self._native.process(
+                        to_interleaved(data.astype(np.float32, copy=False))))
+                data = np.ascontiguousarray(data, dtype=np.float32)
                 return self._native.process(data)
             else:
                 return self._process_impl(data)
@@ -262,27 +601,36 @@ class Equalizer(AudioProcessor):
 
     def _process_impl(self, data):
         """
-        Optimized processing implementation.
+        Run the band cascade over one block with a single sosfilt call.
 
         Args:
-            data (np.ndarray): The audio data to process.
+            data (np.ndarray): The audio data to process, shaped (frames,)
+                or (frames, channels).
 
         Returns:
             np.ndarray: The processed audio data.
         """
-        # Use NumPy for efficient batch processing
         if self.bands == 0 or data.size == 0:
             return data
 
-        try:
-            # Apply each band filter in sequence
-            for band in range(self.bands):
-                # Example: Apply a simple gain adjustment per band
-                data *= self.gains[band]
-        except Exception as e:
-            print(f"Error in processing chain: {e}")
+        # Filter along time; mono blocks are treated as a single channel
+        x = self._as_frames(data)
+        if self._uses_filter_bank():
+            return self._from_frames(self._filter_bank.process(x), data)
 
-        return data
+        # Blocks stay float32 end to end; only the small coefficient and
+        # state arrays are double, which keeps low-frequency poles stable
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        x = self._as_frames(data)
+        zi_shape = (self.sos.shape[0], 2, x.shape[1])
+        if self._zi is None or self._zi.shape != zi_shape:
+            self._zi = np.zeros(zi_shape)
+
+        # Output gain is already folded into the last section
+        out = self._scratch(x.shape, x.dtype)
+        kernel = self._kernel if x.shape == (self.blocksize, self.channels) else None
+        y, self._zi = _run_sos(self.sos, x, self._zi, out, kernel)
+        return self._from_frames(y, data)
 
 
 class BassBoost(AudioProcessor):
@@ -292,11 +640,18 @@ class BassBoost(AudioProcessor):
         self.sample_rate = sample_rate
         self.cutoff = cutoff
         self.gain_db = gain_db
+        # Filter state carried across blocks, shaped (sections, 2, channels)
+        self._zi = None
+        # Cascade compiled for the negotiated block shape (see set_format)
+        self._kernel = None
         self.update_filter()
+        _dsp_kernels.warm_up()
 
-    def set_format(self, sample_rate=None, channels=None, blocksize=None):
+    def set_format(self, sample_rate=None, channels=None, blocksize=None, layout=None):
         """Update processing format and recompute filter when sample rate changes."""
-        super().set_format(sample_rate, channels, blocksize)
+        super().set_format(sample_rate, channels, blocksize, layout)
+        self._zi = None
+        self._kernel = _specialized_kernel(self.blocksize, self.channels, self._sos.shape[0])
         if sample_rate is not None:
             try:
                 self.update_filter()
@@ -306,15 +661,16 @@ class BassBoost(AudioProcessor):
     def update_filter(self):
         """Update filter coefficients"""
         # Create a low-shelf filter
-        self.b, self.a = signal.butter(
+        sos = signal.butter(
             2, 
             self.cutoff / (self.sample_rate/2),
-            'low'
+            'low',
+            output='sos'
         )
         
-        # Apply gain
+        # Apply gain to the numerator
         gain = 10 ** (self.gain_db / 20)
-        self.b = self.b * gain
+        self._sos = sos * np.array([[gain, gain, gain, 1, 1, 1]])
         
     def set_gain(self, gain_db):
         """Set the bass boost gain"""
@@ -326,9 +682,27 @@ class BassBoost(AudioProcessor):
         self.cutoff = cutoff
         self.update_filter()
         
+    def export_coeffs(self):
+        """Current filter for fused chain processing (see AudioProcessor)."""
+        return self._sos
+
+    def reset(self):
+        """Clear the filter history"""
+        self._zi = None
+
     def _process_impl(self, data):
         """Apply bass boost to audio data"""
-        return signal.lfilter(self.b, self.a, data, axis=0)
+        if data.size == 0:
+            return data
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        x = self._as_frames(data)
+        zi_shape = (self._sos.shape[0], 2, x.shape[1])
+        if self._zi is None or self._zi.shape != zi_shape:
+            self._zi = np.zeros(zi_shape)
+        out = self._scratch(x.shape, x.dtype)
+        kernel = self._kernel if x.shape == (self.blocksize, self.channels) else None
+        y, self._zi = _run_sos(self._sos, x, self._zi, out, kernel)
+        return self._from_frames(y, data)
 
 
 class SpatialEnhancer(AudioProcessor):
@@ -341,34 +715,47 @@ class SpatialEnhancer(AudioProcessor):
         """Set the stereo width"""
         self.width = max(0, min(1, width))
 
-    def set_format(self, sample_rate=None, channels=None, blocksize=None):
-        """Store format; can be used to validate stereo channel count."""
-        super().set_format(sample_rate, channels, blocksize)
-        
     def _process_impl(self, data):
-        """Apply spatial enhancement to audio data"""
-        if data.shape[1] != 2:  # Only works with stereo
+        """Apply spatial enhancement to audio data.
+
+        Works entirely in pooled buffers; the returned array is reused by a
+        later call, so callers must consume it before processing again.
+        """
+        planar = self.layout == 'planar'
+        if data.ndim != 2 or data.shape[0 if planar else 1] != 2:  # Only works with stereo
             return data
-            
-        # Simple stereo widening
-        mid = (data[:, 0] + data[:, 1]) / 2
-        side = (data[:, 0] - data[:, 1]) / 2
-        
-        # Enhance the side signal
-        side = side * (1 + self.width)
-        
-        # Recombine
-        left = mid + side
-        right = mid - side
-        
-        result = np.column_stack((left, right))
-        
+
+        frames = data.shape[1 if planar else 0]
+        out = self._scratch(data.shape, data.dtype)
+        side = self._scratch(frames, data.dtype)
+        # Planar channels are contiguous rows; interleaved ones are strided columns
+        if planar:
+            left, right = data[0], data[1]
+            out_left, out_right = out[0], out[1]
+        else:
+            left, right = data[:, 0], data[:, 1]
+            out_left, out_right = out[:, 0], out[:, 1]
+
+        # Enhanced side signal: (L - R) / 2 * (1 + width)
+        np.subtract(left, right, out=side)
+        side *= 0.5 * (1 + self.width)
+
+        # Mid signal straight into the left channel, then recombine
+        mid = out_left
+        np.add(left, right, out=mid)
+        mid *= 0.5
+        np.subtract(mid, side, out=out_right)
+        mid += side
+
         # Normalize to prevent clipping
-        max_val = np.max(np.abs(result))
+        if _dsp_kernels.absmax is not None:
+            max_val = _dsp_kernels.absmax(out)
+        else:
+            max_val = np.abs(out, out=self._scratch(data.shape, data.dtype)).max()
         if max_val > 1.0:
-            result = result / max_val
+            out /= max_val
             
-        return result
+        return out
 
 
 class NoiseReducer(AudioProcessor):
@@ -376,6 +763,7 @@ class NoiseReducer(AudioProcessor):
     def __init__(self, threshold=0.1):
         super().__init__()
         self.threshold = threshold
+        _dsp_kernels.warm_up()
         
     def set_threshold(self, threshold):
         """Set the noise threshold"""
@@ -383,14 +771,164 @@ class NoiseReducer(AudioProcessor):
         
     def _process_impl(self, data):
         """Apply noise reduction to audio data"""
-        # Simple noise gate
-        magnitude = np.abs(data)
-        mask = magnitude > self.threshold
-        
-        # Apply soft mask
-        soft_mask = np.clip((magnitude - self.threshold) / self.threshold, 0, 1)
-        
-        # Apply the mask
-        result = data * soft_mask[:, np.newaxis] if len(data.shape) > 1 else data * soft_mask
-        
-        return result
+        if self.threshold <= 0 or data.size == 0:
+            return data
+
+        # Gate into a pooled buffer; the caller's block is left untouched
+        out = self._scratch(data.shape, data.dtype)
+        # Soft noise gate: gain ramps 0..1 over [threshold, 2*threshold]
+        if _dsp_kernels.soft_gate is not None:
+            np.copyto(out, data)
+            _dsp_kernels.soft_gate(out if out.ndim > 1 else out[:, np.newaxis], self.threshold)
+            return out
+
+        gain = np.abs(data, out=self._scratch(data.shape, data.dtype))
+        gain -= self.threshold
+        gain /= self.threshold
+        np.clip(gain, 0, 1, out=gain)
+        return np.multiply(data, gain, out=out)
+
+
+class _FusedCascade:
+    """
+    Consecutive biquad-only processors run as one compiled cascade.
+
+    The stacked coefficients are rebuilt only when a member hands out a new
+    coefficient array, and the fused filter state survives as long as the
+    total section count does not change.
+    """
+    def __init__(self, processors):
+        self.processors = processors
+        self._coeffs = ()
+        self._sos = None
+        self._zi = None
+        self._out = None
+
+    def reset(self):
+        self._zi = None
+
+    def process(self, data):
+        coeffs = tuple(p.export_coeffs() for p in self.processors)
+        if (any(c is None for c in coeffs) or data.dtype != np.float32
+                or data.ndim != 2 or not data.flags.c_contiguous
+                or any(p.layout != 'interleaved' for p in self.processors)):
+            for processor in self.processors:
+                data = processor.process(data)
+            return data
+
+        if len(coeffs) != len(self._coeffs) or any(a is not b for a, b in zip(coeffs, self._coeffs)):
+            self._coeffs = coeffs
+            self._sos = np.ascontiguousarray(np.vstack(coeffs), dtype=np.float64)
+        zi_shape = (self._sos.shape[0], 2, data.shape[1])
+        if self._zi is None or self._zi.shape != zi_shape:
+            self._zi = np.zeros(zi_shape)
+        if self._out is None or self._out.shape != data.shape:
+            self._out = np.empty_like(data)
+
+        if self._sos.shape[0] == 0:
+            return data
+        _dsp_kernels.biquad_cascade(data, self._sos, self._zi, self._out)
+        return self._out
+
+
+class ProcessorChain:
+    """
+    Ordered list of processors applied one after another.
+
+    The chain keeps a snapshot of its enabled processors and rebuilds it only
+    when a processor is added, removed, enabled or disabled, so disabled
+    processors cost nothing per block. When the compiled kernels are
+    available, runs of adjacent processors that export biquad coefficients
+    (Equalizer, BassBoost) are fused into a single cascade pass.
+
+    Both the processor list and the snapshot are immutable tuples that
+    writers replace wholesale under a lock. process() only reads the current
+    snapshot reference, so the audio thread never takes a lock and never
+    sees a list being mutated under it.
+    """
+    def __init__(self, processors=()):
+        self._lock = threading.Lock()
+        self._processors = ()
+        self._active = ()  # Steps to run: processors or fused cascades
+        for processor in processors:
+            self.append(processor)
+
+    @staticmethod
+    def _fusable(processor):
+        return (_dsp_kernels.biquad_cascade is not None
+                and type(processor).export_coeffs is not AudioProcessor.export_coeffs)
+
+    def _invalidate(self, processor=None):
+        """Rebuild the enabled snapshot (on the thread making the change)"""
+        with self._lock:
+            steps = []
+            run = []
+            for p in self._processors:
+                if not p.enabled:
+                    continue
+                if self._fusable(p):
+                    run.append(p)
+                    continue
+                steps.extend(self._close_run(run))
+                run = []
+                steps.append(p)
+            steps.extend(self._close_run(run))
+            self._active = tuple(steps)
+
+    @staticmethod
+    def _close_run(run):
+        if len(run) > 1:
+            return [_FusedCascade(tuple(run))]
+        return run
+
+    def append(self, processor):
+        """Add a processor at the end of the chain"""
+        with self._lock:
+            self._processors = self._processors + (processor,)
+        processor.add_listener(self._invalidate)
+        self._invalidate()
+
+    def remove(self, processor):
+        """Remove a processor from the chain"""
+        with self._lock:
+            if processor not in self._processors:
+                raise ValueError("processor is not in the chain")
+            self._processors = tuple(p for p in self._processors if p is not processor)
+        processor.remove_listener(self._invalidate)
+        self._invalidate()
+
+    def clear(self):
+        """Remove all processors"""
+        with self._lock:
+            processors, self._processors = self._processors, ()
+        for processor in processors:
+            processor.remove_listener(self._invalidate)
+        self._invalidate()
+
+    def __iter__(self):
+        return iter(self._processors)
+
+    def __len__(self):
+        return len(self._processors)
+
+    def __contains__(self, processor):
+        return processor in self._processors
+
+    def reset(self):
+        """Reset every processor, and fused filter state, to a fresh stream"""
+        for processor in self._processors:
+            processor.reset()
+        for step in self._active:
+            if isinstance(step, _FusedCascade):
+                step.reset()
+
+    @property
+    def idle(self):
+        """True when no enabled processor would touch a block"""
+        return not self._active
+
+    def process(self, data):
+        """Run a block through every enabled processor in order"""
+        for step in self._active:
+            data = step.process(data)
+        return data
@@ -5,9 +5,52 @@ import pyaudio
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume, ISimpleAudioVolume
 from comtypes import CLSCTX_ALL, cast, POINTER
 import numpy as np
+import queue
 import threading
 import time
 
+# Endpoint change notifications (Windows); fall back to polling without them
+try:
+    from comtypes import COMObject
+    from pycaw.api.mmdeviceapi import IMMNotificationClient
+except Exception:
+    COMObject = None
+    IMMNotificationClient = None
+
+
+if IMMNotificationClient is not None:
+    class _DeviceNotifier(COMObject):
+        """
+        IMMNotificationClient that forwards endpoint changes to a queue.
+
+        Windows calls these methods on its own thread, so they only enqueue
+        the event; the manager's monitor thread does the actual work.
+        """
+        _com_interfaces_ = [IMMNotificationClient]
+
+        def __init__(self, events):
+            super().__init__()
+            self._events = events
+
+        def OnDeviceStateChanged(self, device_id, new_state):
+            self._events.put(('state', device_id))
+
+        def OnDeviceAdded(self, device_id):
+            self._events.put(('added', device_id))
+
+        def OnDeviceRemoved(self, device_id):
+            self._events.put(('removed', device_id))
+
+        def OnDefaultDeviceChanged(self, flow, role, device_id):
+            self._events.put(('default', device_id))
+
+        def OnPropertyValueChanged(self, device_id, key):
+            # Property changes do not alter the device list
+            pass
+else:
+    _DeviceNotifier = None
+
+
 class AudioDeviceManager:
     """
     Manages audio devices, providing functionality to enumerate, select,
@@ -15,70 +58,109 @@ class AudioDeviceManager:
     """
     def __init__(self):
         self.pyaudio = pyaudio.PyAudio()
+        # Guards self.pyaudio, which refresh_devices replaces
+        self._pyaudio_lock = threading.Lock()
+        # Set by the monitor thread; the next device query rescans
+        self._devices_dirty = False
         self.devices = self._enumerate_devices()
         self.active_devices = {}  # Maps audio type to device
         self.device_volumes = {}  # Maps device index to volume level (0-100)
         self.device_settings = {}  # Maps device index to settings dict
+        self._session_index = None  # Maps pid to audio sessions; built lazily
         self.audio_types = ["game", "others", "system", "chat", "microphone"]
         self.monitoring = False
         self.monitor_thread = None
+        # Endpoint notification registration (see start_device_monitoring)
+        self._device_events = queue.Queue()
+        self._device_enumerator = None
+        self._device_notifier = None
+        # Called (on the monitor thread) after the device list changed
+        self._change_listeners = []
         
     def _enumerate_devices(self):
-        """Get all available audio devices"""
-        devices = []
+        """Get all available audio devices in a single pass over PyAudio"""
+        output_devices = []
+        input_devices = []
         
-        # Get output devices
-        output_devices = AudioUtilities.GetSpeakers()
-        for i in range(self.pyaudio.get_device_count()):
-            device_info = self.pyaudio.get_device_info_by_index(i)
+        with self._pyaudio_lock:
+            infos = [self.pyaudio.get_device_info_by_index(i)
+                     for i in range(self.pyaudio.get_device_count())]
+        for i, device_info in enumerate(infos):
+            sample_rate = int(device_info['defaultSampleRate'])
+            # A device may expose both output and input channels
             if device_info['maxOutputChannels'] > 0:
-                devices.append({
+                output_devices.append({
                     'index': i,
                     'name': device_info['name'],
                     'channels': device_info['maxOutputChannels'],
                     'type': 'output',
-                    'sample_rate': int(device_info['defaultSampleRate'])
+                    'sample_rate': sample_rate
                 })
-                
-        # Get input devices (microphones)
-        for i in range(self.pyaudio.get_device_count()):
-            device_info = self.pyaudio.get_device_info_by_index(i)
             if device_info['maxInputChannels'] > 0:
-                devices.append({
+                input_devices.append({
                     'index': i,
                     'name': device_info['name'],
                     'channels': device_info['maxInputChannels'],
                     'type': 'input',
-                    'sample_rate': int(device_info['defaultSampleRate'])
+                    'sample_rate': sample_rate
                 })
-                
-        return devices
+        
+        self._output_devices = output_devices
+        self._input_devices = input_devices
+        return output_devices + input_devices
+
+    def _ensure_devices(self):
+        """Rescan devices if the monitor flagged a change since the last scan"""
+        if self._devices_dirty:
+            self.refresh_devices()
     
     def get_output_devices(self):
         """Return list of output devices only"""
-        return [d for d in self.devices if d['type'] == 'output']
+        self._ensure_devices()
+        return list(self._output_devices)
     
     def get_input_devices(self):
         """Return list of input devices only"""
-        return [d for d in self.devices if d['type'] == 'input']
+        self._ensure_devices()
+        return list(self._input_devices)
     
     def set_device_for_audio_type(self, audio_type, device_index):
         """Assign a device to a specific audio type"""
-        if audio_type not in self.audio_types:
-            raise ValueError(f"Unknown audio type: {audio_type}")
-            
-        # Find the device with the given index
-        device = next((d for d in self.devices if d['index'] == device_index), None)
-        if not device:
-            raise ValueError(f"No device found with index {device_index}")
-            
-        # Check if device type matches audio type requirements
-        if audio_type == "microphone" and device['type'] != 'input':
-            raise ValueError("Microphone audio type requires an input device")
-        elif audio_type != "microphone" and device['type'] != 'output':
-            raise ValueError(f"{audio_type} audio type requires an output device")
+        return self.set_devices_for_audio_types({audio_type: device_index})
+
+    def set_devices_for_audio_types(self, mapping):
+        """
+        Assign devices to several audio types at once.
+
+        The device list is indexed once for the whole batch, and nothing is
+        assigned unless every entry is valid.
+
+        Args:
+            mapping (dict): Maps audio type to device index.
+        """
+        by_index = {}
+        for device in self.devices:
+            # Keep the first entry per index, as a single lookup would
+            by_index.setdefault(device['index'], device)
+
+        assignments = {}
+        for audio_type, device_index in mapping.items():
+            if audio_type not in self.audio_types:
+                raise ValueError(f"Unknown audio type: {audio_type}")
+                
+            # Find the device with the given index
+            device = by_index.get(device_index)
+            if not device:
+                raise ValueError(f"No device found with index {device_index}")
+                
+            # Check if device type matches audio type requirements
+            if audio_type == "microphone" and device['type'] != 'input':
+                raise ValueError("Microphone audio type requires an input device")
+            elif audio_type != "microphone" and device['type'] != 'output':
+                raise ValueError(f"{audio_type} audio type requires an output device")
+            assignments[audio_type] = device
             
-        self.active_devices[audio_type] = device
+        self.active_devices.update(assignments)
         return True
     
     def get_device_for_audio_type(self, audio_type):
@@ -90,14 +172,54 @@ class AudioDeviceManager:
     
     def refresh_devices(self):
         """Refresh the list of available devices"""
+        self._devices_dirty = False
+        # PortAudio snapshots the device list when it is initialized, so
+        # restart this enumeration-only instance to see hot-plugged devices.
+        # Streams run through sounddevice and are not affected.
+        with self._pyaudio_lock:
+            try:
+                self.pyaudio.terminate()
+            except Exception:
+                pass
+            self.pyaudio = pyaudio.PyAudio()
         self.devices = self._enumerate_devices()
         
+        self._session_index = None
+        
         # Remove any active devices that are no longer available
         device_indices = [d['index'] for d in self.devices]
         for audio_type in list(self.active_devices.keys()):
             if self.active_devices[audio_type]['index'] not in device_indices:
                 del self.active_devices[audio_type]
                 
+    def _index_sessions(self, sessions):
+        """Build the pid -> [sessions] index from an enumeration"""
+        index = {}
+        for session in sessions:
+            try:
+                proc = session.Process
+                pid = proc.pid if proc else -1
+            except Exception:
+                pid = -1
+            index.setdefault(pid, []).append(session)
+        self._session_index = index
+        return index
+
+    def _get_session_index(self):
+        """Return the cached session index, enumerating sessions on first use"""
+        if self._session_index is None:
+            return self._index_sessions(AudioUtilities.GetAllSessions())
+        return self._session_index
+
+    def _find_session(self, pid):
+        """Look up the first session for a pid, re-enumerating once on a miss"""
+        sessions = self._get_session_index().get(pid)
+        if not sessions:
+            # The program may have started since the index was built
+            self._session_index = None
+            sessions = self._get_session_index().get(pid)
+        return sessions[0] if sessions else None
+
     def get_device_volume(self, device_index):
         """Get the current volume level for a device (0-100)"""
         # Check if we have the volume cached
@@ -111,12 +233,12 @@ class AudioDeviceManager:
                 return 0
                 
             if device['type'] == 'output':
-                sessions = AudioUtilities.GetAllSessions()
-                for session in sessions:
-                    volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                for sessions in self._get_session_index().values():
+                    volume = sessions[0]._ctl.QueryInterface(ISimpleAudioVolume)
                     level = volume.GetMasterVolume() * 100
                     self.device_volumes[device_index] = level
                     return level
+                return 0
             else:
                 # For input devices
                 devices = AudioUtilities.GetMicrophone()
@@ -139,10 +261,10 @@ class AudioDeviceManager:
             if not device:
                 return False
             if device['type'] == 'output':
-                sessions = AudioUtilities.GetAllSessions()
-                for session in sessions:
-                    volume = session._ctl.QueryInterface(ISimpleAudioVolume)
-                    volume.SetMasterVolume(volume_level / 100, None)
+                for sessions in self._get_session_index().values():
+                    for session in sessions:
+                        volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                        volume.SetMasterVolume(volume_level / 100, None)
             else:
                 devices = AudioUtilities.GetMicrophone()
                 interface = devices.Activate(
@@ -169,31 +291,114 @@ class AudioDeviceManager:
             
         self.device_settings[device_index][setting_name] = value
     
-    def start_device_monitoring(self):
-        """Start monitoring audio devices for changes"""
+    def start_device_monitoring(self, poll=True):
+        """
+        Start monitoring audio devices for changes.
+
+        Args:
+            poll (bool): Fall back to polling the device count when endpoint
+                notifications are unavailable. Pass False if the caller
+                watches for device changes itself.
+        """
         if self.monitoring:
             return
             
+        # Let Windows push endpoint changes; poll only if that is unavailable
+        if self._register_device_notifications():
+            target = self._handle_device_events
+        elif poll:
+            target = self._monitor_devices
+        else:
+            # Nothing started, so a later call may still start polling
+            return
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_devices)
+        self.monitor_thread = threading.Thread(target=target)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
     
     def stop_device_monitoring(self):
         """Stop monitoring audio devices"""
         self.monitoring = False
+        self._unregister_device_notifications()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1.0)
             self.monitor_thread = None
+
+    def add_device_change_listener(self, callback):
+        """
+        Register callback(), called when monitoring sees devices change.
+
+        The callback runs on the monitor thread; UI code should hand the
+        event over to its own thread (e.g. through a queued Qt signal).
+        """
+        self._change_listeners.append(callback)
+
+    def remove_device_change_listener(self, callback):
+        """Unregister a callback added with add_device_change_listener"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _devices_changed(self):
+        """Mark the device list stale and tell the listeners"""
+        # Rescan lazily on the next query instead of on this thread
+        self._devices_dirty = True
+        for callback in list(self._change_listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in device change listener: {e}")
+
+    def _register_device_notifications(self):
+        """Register an IMMNotificationClient; returns False if not possible"""
+        if _DeviceNotifier is None:
+            return False
+        try:
+            enumerator = AudioUtilities.GetDeviceEnumerator()
+            notifier = _DeviceNotifier(self._device_events)
+            enumerator.RegisterEndpointNotificationCallback(notifier)
+        except Exception as e:
+            print(f"Device notifications unavailable, polling instead: {e}")
+            return False
+        self._device_enumerator = enumerator
+        self._device_notifier = notifier
+        return True
+
+    def _unregister_device_notifications(self):
+        """Drop the endpoint notification callback, if registered"""
+        if self._device_notifier is None:
+            return
+        try:
+            self._device_enumerator.UnregisterEndpointNotificationCallback(self._device_notifier)
+        except Exception:
+            pass
+        self._device_enumerator = None
+        self._device_notifier = None
+
+    def _handle_device_events(self):
+        """Monitor thread that waits for endpoint notifications"""
+        while self.monitoring:
+            try:
+                self._device_events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            # One plug-in fires several notifications; report them once
+            try:
+                while True:
+                    self._device_events.get_nowait()
+            except queue.Empty:
+                pass
+            self._devices_changed()
     
     def _monitor_devices(self):
-        """Monitor thread that checks for device changes"""
-        last_device_count = self.pyaudio.get_device_count()
+        """Fallback monitor thread that polls the device count"""
+        with self._pyaudio_lock:
+            last_device_count = self.pyaudio.get_device_count()
         
         while self.monitoring:
-            current_count = self.pyaudio.get_device_count()
+            with self._pyaudio_lock:
+                current_count = self.pyaudio.get_device_count()
             if current_count != last_device_count:
-                self.refresh_devices()
+                self._devices_changed()
                 last_device_count = current_count
                 
             # Check every 2 seconds
@@ -206,10 +411,18 @@ class AudioDeviceManager:
             self.pyaudio.terminate()
 
     def get_active_audio_sessions(self):
-        """List active audio sessions (programs producing sound)"""
+        """
+        List active audio sessions (programs producing sound).
+
+        Returns:
+            list: Dicts with 'pid' (always an int, -1 for sessions without a
+                process), 'name' and 'volume' (0-100 or None).
+        """
         sessions_info = []
         try:
             sessions = AudioUtilities.GetAllSessions()
+            # Refresh the pid index from this enumeration for later lookups
+            self._index_sessions(sessions)
             for session in sessions:
                 try:
                     proc = session.Process
@@ -256,15 +469,14 @@ class AudioDeviceManager:
     def set_session_volume(self, pid, volume_level):
         """Set volume for a specific audio session by process id"""
         try:
-            sessions = AudioUtilities.GetAllSessions()
-            for session in sessions:
-                proc = session.Process
-                spid = proc.pid if proc else -1
-                if spid == pid:
-                    vol = session._ctl.QueryInterface(ISimpleAudioVolume)
-                    vol.SetMasterVolume(volume_level / 100, None)
-                    return True
+            session = self._find_session(pid)
+            if session is not None:
+                vol = session._ctl.QueryInterface(ISimpleAudioVolume)
+                vol.SetMasterVolume(volume_level / 100, None)
+                return True
         except Exception as e:
+            # A cached session may have expired; rebuild on the next call
+            self._session_index = None
             print(f"Error setting session volume: {e}")
         return False
 
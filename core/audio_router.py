@@ -1,21 +1,36 @@
 """
 Audio routing system for connecting physical and virtual audio devices
 """
+import threading
+from types import MappingProxyType
+
 from .audio_devices import AudioDeviceManager
 from .virtual_devices import VirtualAudioRouter
 
 class AudioRoutingSystem:
     """
     Manages routing between physical audio devices and virtual audio devices
+
+    Concurrency: methods that change routes or session categories may be
+    called from several threads (UI, device monitor) and serialize on
+    `_writer_lock`. Readers never take it: `routes` is an immutable mapping
+    replaced wholesale on every change, and the remaining lookups are single
+    dict/set reads, which are atomic under the GIL. Nothing here should be
+    called from an audio callback while holding a lock.
     """
     def __init__(self):
+        self._writer_lock = threading.Lock()
         self.device_manager = AudioDeviceManager()
         self.virtual_router = VirtualAudioRouter()
-        self.routes = {}  # Maps audio_type to (source, destination) tuples
+        # Maps audio_type to (source, destination) tuples. Read-only view,
+        # replaced wholesale on every change so readers can keep it
+        self.routes = MappingProxyType({})
+        self._device_to_types = {}  # Reverse index: physical device -> {audio_type}
         self.unified_device_mode = False
         self.unified_output_device = None
         self.unified_input_device = None
         self.session_categories = {}
+        self._category_to_pids = {}  # Reverse index: category -> {pid}
         
     def set_unified_device_mode(self, enabled, output_device_id=None, input_device_id=None):
         """
@@ -30,12 +45,15 @@ class AudioRoutingSystem:
         if enabled:
             self.unified_output_device = output_device_id
             self.unified_input_device = input_device_id
-            # Apply unified device to all audio types
+            # Apply unified device to all audio types in one batch
+            mapping = {}
             if output_device_id:
                 for audio_type in ['game', 'others', 'system', 'chat']:
-                    self.device_manager.set_device_for_audio_type(audio_type, output_device_id)
+                    mapping[audio_type] = output_device_id
             if input_device_id:
-                self.device_manager.set_device_for_audio_type('microphone', input_device_id)
+                mapping['microphone'] = input_device_id
+            if mapping:
+                self.device_manager.set_devices_for_audio_types(mapping)
     
     def get_unified_device_config(self):
         """Get the current unified device configuration"""
@@ -69,24 +87,48 @@ class AudioRoutingSystem:
             self.virtual_router.create_virtual_device(virtual_device_name)
             
         # Store the route
-        self.routes[audio_type] = (physical_device_id, virtual_device_name)
+        with self._writer_lock:
+            self._unindex_route(audio_type)
+            routes = dict(self.routes)
+            routes[audio_type] = (physical_device_id, virtual_device_name)
+            self.routes = MappingProxyType(routes)
+            self._device_to_types.setdefault(physical_device_id, set()).add(audio_type)
         
         return True
         
     def remove_route(self, audio_type):
         """Remove a route for an audio type"""
-        if audio_type in self.routes:
-            del self.routes[audio_type]
-            return True
-        return False
+        with self._writer_lock:
+            if audio_type not in self.routes:
+                return False
+            self._unindex_route(audio_type)
+            routes = dict(self.routes)
+            del routes[audio_type]
+            self.routes = MappingProxyType(routes)
+        return True
+
+    def _unindex_route(self, audio_type):
+        """Drop an existing route for audio_type from the device index (caller holds _writer_lock)"""
+        route = self.routes.get(audio_type)
+        if route is None:
+            return
+        types = self._device_to_types.get(route[0])
+        if types is not None:
+            types.discard(audio_type)
+            if not types:
+                del self._device_to_types[route[0]]
+
+    def get_audio_types_for_device(self, physical_device_id):
+        """Get the audio types currently routed from a physical device"""
+        return set(self._device_to_types.get(physical_device_id, ()))
         
     def get_route(self, audio_type):
         """Get the route for an audio type"""
         return self.routes.get(audio_type)
         
     def get_all_routes(self):
-        """Get all audio routes"""
-        return self.routes.copy()
+        """Get all audio routes as a read-only snapshot (not copied)"""
+        return self.routes
         
     def apply_audio_processing(self, audio_type, processor):
         """
@@ -134,6 +176,22 @@ class AudioRoutingSystem:
         """Refresh the list of physical audio devices"""
         self.device_manager.refresh_devices()
         
+    def start_device_monitoring(self, poll=True):
+        """Start watching for audio devices being added or removed"""
+        self.device_manager.start_device_monitoring(poll=poll)
+
+    def stop_device_monitoring(self):
+        """Stop watching for audio device changes"""
+        self.device_manager.stop_device_monitoring()
+
+    def add_device_change_listener(self, callback):
+        """Register callback(), called from a background thread on device changes"""
+        self.device_manager.add_device_change_listener(callback)
+
+    def remove_device_change_listener(self, callback):
+        """Unregister a device change callback"""
+        self.device_manager.remove_device_change_listener(callback)
+
     def get_input_devices(self):
         """Get all input devices"""
         return self.device_manager.get_input_devices()
@@ -155,7 +213,23 @@ class AudioRoutingSystem:
 
     def list_active_sessions(self):
         """List active audio sessions (programs producing sound)"""
-        return self.device_manager.get_active_audio_sessions()
+        sessions = self.device_manager.get_active_audio_sessions()
+        # An empty list is also what a failed enumeration returns, so only
+        # reap categories when there is something to compare against
+        if sessions:
+            self._reap_sessions({s.get('pid') for s in sessions})
+        return sessions
+
+    def _reap_sessions(self, active_pids):
+        """Forget categories of sessions whose process has gone away"""
+        with self._writer_lock:
+            for pid in self.session_categories.keys() - active_pids:
+                category = self.session_categories.pop(pid)
+                pids = self._category_to_pids.get(category)
+                if pids is not None:
+                    pids.discard(pid)
+                    if not pids:
+                        del self._category_to_pids[category]
 
     def set_session_volume(self, pid, volume_level):
         """Set volume for a specific audio session by process id"""
@@ -173,7 +247,12 @@ class AudioRoutingSystem:
         """Assign a session to a logical category (game, others, system, chat)."""
         if category not in ['game', 'others', 'system', 'chat']:
             return False
-        self.session_categories[pid] = category
+        with self._writer_lock:
+            previous = self.session_categories.get(pid)
+            if previous is not None and previous != category:
+                self._category_to_pids.get(previous, set()).discard(pid)
+            self.session_categories[pid] = category
+            self._category_to_pids.setdefault(category, set()).add(pid)
         # Immediately route to the device for this category if available
         return self.route_session_to_category(pid, category)
 
@@ -202,17 +281,12 @@ class AudioRoutingSystem:
                 if dev and dev.get('index') is not None:
                     return self.device_manager.set_device_volume(dev.get('index'), volume_level)
                 return False
-            # For output categories, change session volumes only
+            # For output categories, change session volumes only; the reverse
+            # index gives the category's sessions without scanning them all
             changed = False
-            sessions = self.device_manager.get_active_audio_sessions() or []
-            for sess in sessions:
-                pid = sess.get('pid') or sess.get('process_id')
-                if pid is None:
-                    continue
-                if self.session_categories.get(pid) == category:
-                    ok = self.device_manager.set_session_volume(pid, volume_level)
-                    if ok:
-                        changed = True
+            for pid in tuple(self._category_to_pids.get(category, ())):
+                if self.device_manager.set_session_volume(pid, volume_level):
+                    changed = True
             return changed
         except Exception:
             return False
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Preallocated, cache-line aligned scratch buffers for the audio thread
+"""
+import numpy as np
+
+
+class AlignedPool:
+    """
+    Ring of equally sized, aligned byte slots carved from one arena.
+
+    acquire() hands out the slots round-robin as typed NumPy views, so a
+    buffer stays valid until `n` further acquires have been made. Steady
+    state processing therefore never touches the allocator; a request larger
+    than a slot grows the arena geometrically once and then stays there.
+
+    Attributes:
+        slot_bytes (int): Usable size of each slot in bytes.
+        n (int): Number of slots in the ring.
+        alignment (int): Byte alignment of every slot.
+    """
+
+    def __init__(self, slot_bytes, n=4, alignment=64):
+        self.n = int(n)
+        self.alignment = int(alignment)
+        self._next = 0
+        self._allocate(int(slot_bytes))
+
+    def _allocate(self, slot_bytes):
+        """(Re)build the arena for slots of at least `slot_bytes`."""
+        align = self.alignment
+        # Round slots up so every one of them starts on an aligned address
+        self.slot_bytes = max(align, -(-slot_bytes // align) * align)
+        raw = np.empty(self.slot_bytes * self.n + align, dtype=np.uint8)
+        offset = -raw.ctypes.data % align
+        self._arena = raw[offset:offset + self.slot_bytes * self.n]
+        self._next = 0
+
+    def acquire(self, shape, dtype):
+        """
+        Return the next slot viewed as an uninitialized array.
+
+        Args:
+            shape (tuple | int): Array shape.
+            dtype: NumPy dtype of the array.
+
+        Returns:
+            np.ndarray: C-contiguous, aligned array backed by the pool.
+        """
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        nbytes = count * dtype.itemsize
+        if nbytes > self.slot_bytes:
+            self._allocate(max(nbytes, 2 * self.slot_bytes))
+
+        start = self._next * self.slot_bytes
+        self._next = (self._next + 1) % self.n
+        return self._arena[start:start + nbytes].view(dtype).reshape(shape)
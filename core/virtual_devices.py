@@ -4,6 +4,8 @@ Virtual audio device management for routing audio between different applications
 import numpy as np
 import sounddevice as sd
 
+from audio_processing.processors import ProcessorChain
+
 class VirtualAudioDevice:
     """
     Creates a virtual audio device for routing audio between applications
@@ -13,31 +15,36 @@ class VirtualAudioDevice:
         self.channels = channels
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
-        self.buffer = np.zeros((buffer_size, channels), dtype=np.float32)
         self.is_active = False
         self.stream = None
-        self.processing_chain = []
+        self.processing_chain = ProcessorChain()
         
     def start(self):
         """Start the virtual audio device"""
         if self.is_active:
             return
+
+        chain = self.processing_chain
             
         def callback(indata, outdata, frames, time, status):
             """Audio callback for processing audio data"""
             if status:
                 print(f"Status: {status}")
                 
-            # Copy input data to our buffer
-            self.buffer[:frames] = indata[:frames]
+            if chain.idle:
+                # Nothing to do: a single copy straight through
+                np.copyto(outdata[:frames], indata[:frames])
+                return
             
-            # Apply processing chain
-            processed_data = self.buffer[:frames].copy()
-            for processor in self.processing_chain:
-                processed_data = processor.process(processed_data)
-                
-            # Copy processed data to output
-            outdata[:frames] = processed_data
+            # indata belongs to PortAudio and must stay read-only: run the
+            # chain on a copy in the output buffer, which is ours to write
+            block = outdata[:frames]
+            np.copyto(block, indata[:frames])
+            processed_data = chain.process(block)
+
+            # Processors return their own pooled buffers; copy the result back
+            if processed_data is not block:
+                np.copyto(block, processed_data)
         
         # Inform processors of format prior to stream start
         try:
@@ -51,10 +58,25 @@ class VirtualAudioDevice:
         except Exception:
             pass
 
+        # Run one silent block through the chain so JIT compilation, scratch
+        # allocation and lazy filter design happen here, not in the first
+        # audio callback; then drop the state it left so the first real
+        # block starts from a clean history
+        try:
+            chain.process(np.zeros((self.buffer_size, self.channels), dtype=np.float32))
+            chain.reset()
+        except Exception as e:
+            print(f"Error warming up processing chain: {e}")
+
         self.stream = sd.Stream(
             channels=self.channels,
             samplerate=self.sample_rate,
             blocksize=self.buffer_size,
+            latency='low',
+            # Match the float32 processing chain so no block is converted
+            dtype='float32',
+            # Let the callback fill the initial output buffers as well
+            prime_output_buffers_using_stream_callback=True,
             callback=callback
         )
         self.stream.start()
@@ -90,7 +112,7 @@ class VirtualAudioDevice:
             
     def clear_processors(self):
         """Clear all processors from the processing chain"""
-        self.processing_chain = []
+        self.processing_chain.clear()
         
     def __del__(self):
         """Clean up resources"""
@@ -2,37 +2,34 @@
 Audio Enhancement Software - Main Application
 """
 import sys
-import json
-import os
 from PyQt5.QtWidgets import QApplication
 from ui.main_window import MainWindow
+from ui.config_store import ConfigStore
 from core.audio_router import AudioRoutingSystem
 from audio_processing.processors import Equalizer, BassBoost, SpatialEnhancer, NoiseReducer
+from audio_processing.filter_bank import enable_fft_plan_cache
 
 def load_config():
     """Load application configuration"""
-    config_file = "config.json"
     default_config = {
         "theme": "Light",
         "unified_device_mode": False,
         "unified_output_device": None,
         "unified_input_device": None
     }
-    
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                default_config.update(config)
-        except Exception as e:
-            print(f"Error loading config: {e}")
-            
+    # Same file, and same parser, as every later read and write
+    default_config.update(ConfigStore.instance().get())
     return default_config
 
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    # Write any debounced settings before exiting
+    app.aboutToQuit.connect(lambda: ConfigStore.instance().flush(blocking=True))
+
+    # Reuse FFTW plans across audio blocks when pyfftw is available
+    enable_fft_plan_cache()
     
     # Load configuration
     config = load_config()
@@ -41,7 +38,8 @@ def main():
     routing_system = AudioRoutingSystem()
     
     # Always apply unified device configuration (no longer optional)
-    # Validate configured device IDs against current enumeration
+    # Validate configured device IDs against current enumeration; the
+    # device list is cached, so the config panel reuses this enumeration
     try:
         output_devices = routing_system.get_output_devices() or []
         input_devices = routing_system.get_input_devices() or []
@@ -57,7 +55,10 @@ def main():
     if in_id not in valid_input_ids:
         in_id = None
     # Always enable unified mode
-    routing_system.set_unified_device_mode(True, out_id, in_id)
+    try:
+        routing_system.set_unified_device_mode(True, out_id, in_id)
+    except Exception as e:
+        print(f"Error applying device configuration: {e}")
     
     # Create main window
     window = MainWindow(routing_system)
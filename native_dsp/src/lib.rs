@@ -1,5 +1,9 @@
 use pyo3::prelude::*;
-use numpy::{PyArray1, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
+use numpy::{
+    PyArray1, PyArray2, PyArrayDyn, PyArrayMethods, PyReadonlyArray1, PyReadonlyArray2,
+    PyReadonlyArrayDyn, PyReadwriteArray3, PyUntypedArrayMethods,
+};
 use std::f32::consts::PI;
 
 #[derive(Clone)]
@@ -43,6 +47,28 @@ impl BiquadFilter {
         self.a2 = a2 / a0;
     }
 
+    fn set_shelf(&mut self, freq: f32, gain_db: f32, sample_rate: f32, high: bool) {
+        let omega = 2.0 * PI * freq / sample_rate;
+        let a = 10.0f32.powf(gain_db / 40.0);
+        let cos_w = omega.cos();
+        // Shelf slope S = 1
+        let two_sqrt_a_alpha = 2.0 * a.sqrt() * omega.sin() / 2.0f32.sqrt();
+        let sign = if high { -1.0 } else { 1.0 };
+
+        let b0 = a * ((a + 1.0) - sign * (a - 1.0) * cos_w + two_sqrt_a_alpha);
+        let b1 = sign * 2.0 * a * ((a - 1.0) - sign * (a + 1.0) * cos_w);
+        let b2 = a * ((a + 1.0) - sign * (a - 1.0) * cos_w - two_sqrt_a_alpha);
+        let a0 = (a + 1.0) + sign * (a - 1.0) * cos_w + two_sqrt_a_alpha;
+        let a1 = -sign * 2.0 * ((a - 1.0) + sign * (a + 1.0) * cos_w);
+        let a2 = (a + 1.0) + sign * (a - 1.0) * cos_w - two_sqrt_a_alpha;
+
+        self.b0 = b0 / a0;
+        self.b1 = b1 / a0;
+        self.b2 = b2 / a0;
+        self.a1 = a1 / a0;
+        self.a2 = a2 / a0;
+    }
+
     fn process(&mut self, input: f32) -> f32 {
         let output = self.b0 * input + self.b1 * self.x1 + self.b2 * self.x2
                     - self.a1 * self.y1 - self.a2 * self.y2;
@@ -65,6 +91,24 @@ struct Equalizer {
     q_values: Vec<f32>,
 }
 
+impl Equalizer {
+    /// Store gains (dB, one per band) and redesign the filters; ignored if
+    /// the band count does not match
+    fn apply_gains(&mut self, gains: &[f32]) {
+        if gains.len() == self.gains.len() {
+            self.gains.copy_from_slice(gains);
+            for i in 0..self.filters.len() {
+                self.filters[i].set_peaking_eq(
+                    self.frequencies[i],
+                    self.q_values[i],
+                    self.gains[i],
+                    self.sample_rate
+                );
+            }
+        }
+    }
+}
+
 #[pymethods]
 impl Equalizer {
     #[new]
@@ -85,18 +129,13 @@ impl Equalizer {
         }
     }
 
-    fn set_gains(&mut self, gains: Vec<f32>) {
-        if gains.len() == self.gains.len() {
-            self.gains = gains;
-            for i in 0..self.filters.len() {
-                self.filters[i].set_peaking_eq(
-                    self.frequencies[i],
-                    self.q_values[i],
-                    self.gains[i],
-                    self.sample_rate
-                );
-            }
-        }
+    fn set_gains(&mut self, gains: PyReadonlyArray1<f32>) -> PyResult<()> {
+        // Borrow the NumPy buffer directly instead of converting a list
+        let gains = gains
+            .as_slice()
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        self.apply_gains(gains);
+        Ok(())
     }
 
     fn process_audio(&mut self, py: Python<'_>, input: PyReadonlyArray1<f32>) -> PyResult<Py<PyArray1<f32>>> {
@@ -119,12 +158,189 @@ impl Equalizer {
         for filter in &mut self.filters {
             *filter = BiquadFilter::new();
         }
-        self.set_gains(vec![0.0; self.gains.len()]);
+        let bands = self.gains.len();
+        self.apply_gains(&vec![0.0; bands]);
+    }
+}
+
+/// Multi-channel EQ engine backing audio_processing.processors.Equalizer.
+///
+/// Mirrors the Python band layout: logarithmically spaced bands from 20 Hz
+/// to 20 kHz, low shelf on the first band, high shelf on the last and
+/// peaking filters in between.
+#[pyclass]
+struct EqualizerEngine {
+    sample_rate: f32,
+    channels: usize,
+    frequencies: Vec<f32>,
+    gains: Vec<f32>,
+    output_gain: f32,
+    // filters[channel][band]
+    filters: Vec<Vec<BiquadFilter>>,
+}
+
+impl EqualizerEngine {
+    fn band_frequencies(bands: usize) -> Vec<f32> {
+        if bands == 1 {
+            return vec![20.0];
+        }
+        (0..bands)
+            .map(|i| 20.0 * 1000.0f32.powf(i as f32 / (bands - 1) as f32))
+            .collect()
+    }
+
+    fn design(&mut self) {
+        let bands = self.frequencies.len();
+        let nyquist_guard = 0.49 * self.sample_rate;
+        for channel in &mut self.filters {
+            for (i, filter) in channel.iter_mut().enumerate() {
+                let freq = self.frequencies[i].min(nyquist_guard);
+                let gain = self.gains[i];
+                if i == 0 {
+                    filter.set_shelf(freq, gain, self.sample_rate, false);
+                } else if i == bands - 1 {
+                    filter.set_shelf(freq, gain, self.sample_rate, true);
+                } else {
+                    filter.set_peaking_eq(freq, 1.0, gain, self.sample_rate);
+                }
+            }
+        }
+    }
+
+    fn rebuild(&mut self) {
+        let bands = self.frequencies.len();
+        self.filters = vec![vec![BiquadFilter::new(); bands]; self.channels];
+        self.design();
+    }
+}
+
+#[pymethods]
+impl EqualizerEngine {
+    #[new]
+    fn new(sample_rate: f32, bands: usize, channels: usize) -> Self {
+        let bands = bands.max(1);
+        let mut engine = EqualizerEngine {
+            sample_rate,
+            channels: channels.max(1),
+            frequencies: Self::band_frequencies(bands),
+            gains: vec![0.0; bands],
+            output_gain: 1.0,
+            filters: Vec::new(),
+        };
+        engine.rebuild();
+        engine
+    }
+
+    fn set_format(&mut self, sample_rate: f32, channels: usize) {
+        self.sample_rate = sample_rate;
+        self.channels = channels.max(1);
+        self.rebuild();
+    }
+
+    fn set_bands(&mut self, bands: usize) {
+        let bands = bands.max(1);
+        self.frequencies = Self::band_frequencies(bands);
+        self.gains.resize(bands, 0.0);
+        self.rebuild();
+    }
+
+    /// Read the band gains (dB) straight from a float32 NumPy array.
+    fn set_gains(&mut self, gains: PyReadonlyArray1<f32>) -> PyResult<()> {
+        let gains = gains
+            .as_slice()
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if gains.len() == self.gains.len() {
+            self.gains.copy_from_slice(gains);
+            self.design();
+        }
+        Ok(())
+    }
+
+    fn set_output_gain(&mut self, gain_db: f32) {
+        self.output_gain = 10.0f32.powf(gain_db / 20.0);
+    }
+
+    /// Process a C-contiguous float32 block shaped (frames,) or (frames, channels).
+    fn process<'py>(&mut self, py: Python<'py>, input: PyReadonlyArrayDyn<'py, f32>) -> PyResult<Bound<'py, PyArrayDyn<f32>>> {
+        let shape = input.shape().to_vec();
+        let channels = if shape.len() > 1 { shape[1] } else { 1 };
+        if channels != self.channels {
+            self.channels = channels.max(1);
+            self.rebuild();
+        }
+        let data = input
+            .as_slice()
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+        let mut output = Vec::with_capacity(data.len());
+        for (n, &sample) in data.iter().enumerate() {
+            let mut processed = sample;
+            for filter in &mut self.filters[n % channels] {
+                processed = filter.process(processed);
+            }
+            output.push(processed * self.output_gain);
+        }
+
+        PyArray1::<f32>::from_vec_bound(py, output).reshape(shape)
+    }
+}
+
+/// Filter a C-contiguous float32 (frames, channels) block through a
+/// normalized SOS cascade, in the same Direct-Form-II-Transposed layout as
+/// scipy.signal.sosfilt.
+///
+/// `sos` is (sections, 6) float64 and `zi` is the (sections, 2, channels)
+/// float64 state, updated in place. Each frame runs all channels through a
+/// section together, so the per-channel recursions sit in adjacent lanes
+/// and the inner loop vectorizes (stereo fills one SSE2/NEON register).
+#[pyfunction]
+fn apply_sos<'py>(
+    py: Python<'py>,
+    x: PyReadonlyArray2<'py, f32>,
+    sos: PyReadonlyArray2<'py, f64>,
+    mut zi: PyReadwriteArray3<'py, f64>,
+) -> PyResult<Bound<'py, PyArray2<f32>>> {
+    let (frames, channels) = (x.shape()[0], x.shape()[1]);
+    let sections = sos.shape()[0];
+    if sos.shape()[1] != 6 || zi.shape() != [sections, 2, channels] {
+        return Err(PyValueError::new_err(
+            "expected sos shaped (sections, 6) and zi shaped (sections, 2, channels)",
+        ));
+    }
+    let input = x.as_slice().map_err(|e| PyValueError::new_err(e.to_string()))?;
+    let coeffs = sos.as_slice().map_err(|e| PyValueError::new_err(e.to_string()))?;
+    let state = zi.as_slice_mut().map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+    let mut output = vec![0.0f32; frames * channels];
+    let mut lanes = vec![0.0f64; channels];
+    for n in 0..frames {
+        let row = n * channels;
+        for c in 0..channels {
+            lanes[c] = input[row + c] as f64;
+        }
+        for s in 0..sections {
+            let k = &coeffs[s * 6..s * 6 + 6];
+            let (b0, b1, b2, a1, a2) = (k[0], k[1], k[2], k[4], k[5]);
+            let (z0, z1) = state[s * 2 * channels..(s + 1) * 2 * channels].split_at_mut(channels);
+            for c in 0..channels {
+                let v = lanes[c];
+                let y = b0 * v + z0[c];
+                z0[c] = b1 * v - a1 * y + z1[c];
+                z1[c] = b2 * v - a2 * y;
+                lanes[c] = y;
+            }
+        }
+        for c in 0..channels {
+            output[row + c] = lanes[c] as f32;
+        }
     }
+    PyArray1::from_vec_bound(py, output).reshape([frames, channels])
 }
 
 #[pymodule]
 fn native_dsp(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Equalizer>()?;
+    m.add_class::<EqualizerEngine>()?;
+    m.add_function(wrap_pyfunction!(apply_sos, m)?)?;
     Ok(())
 }
@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+from core.buffer_pool import AlignedPool
+
+class TestAlignedPool(unittest.TestCase):
+
+    def test_slots_are_aligned(self):
+        pool = AlignedPool(1000, n=4)
+        for _ in range(4):
+            buf = pool.acquire((100, 2), np.float32)
+            self.assertEqual(buf.ctypes.data % 64, 0)
+            self.assertEqual(buf.shape, (100, 2))
+            self.assertEqual(buf.dtype, np.float32)
+
+    def test_ring_reuses_slots(self):
+        pool = AlignedPool(256, n=2)
+        first = pool.acquire(16, np.float64)
+        second = pool.acquire(16, np.float64)
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertTrue(np.shares_memory(first, pool.acquire(16, np.float64)))
+
+    def test_grows_for_large_requests(self):
+        pool = AlignedPool(64, n=2)
+        buf = pool.acquire((1024, 2), np.float64)
+        self.assertEqual(buf.shape, (1024, 2))
+        self.assertGreaterEqual(pool.slot_bytes, buf.nbytes)
+
+if __name__ == "__main__":
+    unittest.main()
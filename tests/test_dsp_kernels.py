@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from scipy import signal
+from audio_processing import _dsp_kernels, processors
+
+@unittest.skipUnless(_dsp_kernels.HAVE_NUMBA, "numba not installed")
+class TestDspKernels(unittest.TestCase):
+
+    def test_biquad_cascade_matches_sosfilt(self):
+        sos = signal.butter(4, 0.1, output='sos')
+        x = np.random.default_rng(0).standard_normal((512, 2))
+        zi = np.zeros((sos.shape[0], 2, 2))
+        expected, expected_zi = signal.sosfilt(sos, x, axis=0, zi=zi.copy())
+        y = np.empty_like(x)
+        _dsp_kernels.biquad_cascade(x, sos, zi, y)
+        np.testing.assert_allclose(y, expected, atol=1e-9)
+        np.testing.assert_allclose(zi, expected_zi, atol=1e-9)
+
+    def test_specialized_cascade_matches_sosfilt(self):
+        sos = signal.butter(4, 0.1, output='sos')
+        x = np.random.default_rng(2).standard_normal((128, 2)).astype(np.float32)
+        zi = np.zeros((sos.shape[0], 2, 2))
+        expected, _ = signal.sosfilt(sos, x, axis=0, zi=zi.copy())
+        kernel = _dsp_kernels.specialized_biquad_cascade(128, 2, sos.shape[0])
+        y = np.empty_like(x)
+        kernel(x, sos, zi, y)
+        np.testing.assert_allclose(y, expected, atol=1e-5)
+
+    def test_absmax(self):
+        data = np.random.default_rng(1).standard_normal((256, 2)).astype(np.float32)
+        self.assertEqual(_dsp_kernels.absmax(data), np.max(np.abs(data)))
+
+@unittest.skipUnless(processors._native_apply_sos is not None, "native_dsp not built")
+class TestNativeApplySos(unittest.TestCase):
+
+    def test_matches_sosfilt(self):
+        sos = signal.butter(4, 0.1, output='sos')
+        x = np.random.default_rng(3).standard_normal((512, 2)).astype(np.float32)
+        zi = np.zeros((sos.shape[0], 2, 2))
+        expected, expected_zi = signal.sosfilt(sos, x, axis=0, zi=zi.copy())
+        y = processors._native_apply_sos(x, sos, zi)
+        np.testing.assert_allclose(y, expected, atol=1e-5)
+        np.testing.assert_allclose(zi, expected_zi, atol=1e-9)
+
+if __name__ == "__main__":
+    unittest.main()
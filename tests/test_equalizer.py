@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
-from audio_processing.processors import Equalizer
+from audio_processing import processors
+from audio_processing.processors import Equalizer, to_planar, to_interleaved
 
 class TestEqualizer(unittest.TestCase):
 
@@ -13,6 +14,8 @@ class TestEqualizer(unittest.TestCase):
         self.assertEqual(self.equalizer.sample_rate, self.sample_rate)
         self.assertEqual(self.equalizer.bands, self.bands)
         self.assertTrue(self.equalizer.enabled)
+        self.assertEqual(self.equalizer.gains.dtype, np.float32)
+        self.assertEqual(self.equalizer.frequencies.dtype, np.float32)
 
     def test_process_disabled(self):
         self.equalizer.disable()
@@ -32,5 +35,125 @@ class TestEqualizer(unittest.TestCase):
         processed = self.equalizer.process(data)
         self.assertEqual(processed.shape, data.shape)
 
+    @unittest.skipUnless(processors.native_dsp is not None, "native_dsp not built")
+    def test_native_backend_used(self):
+        self.assertIsNotNone(self.equalizer._native)
+
+    def test_gains_are_replaced_not_mutated(self):
+        shared = self.equalizer.gains
+        self.assertFalse(shared.flags.writeable)
+        self.equalizer.set_gain(1, 3.0)
+        self.assertEqual(shared[1], 0.0)
+        self.assertEqual(self.equalizer.gains[1], 3.0)
+        self.equalizer.set_gains([1.0, 2.0])
+        np.testing.assert_array_equal(self.equalizer.gains[:3], [1.0, 2.0, 0.0])
+
+    def test_flat_is_transparent(self):
+        self.equalizer._native = None
+        data = np.random.default_rng(0).standard_normal((1024, 2))
+        processed = self.equalizer.process(data.copy())
+        np.testing.assert_allclose(processed, data, atol=1e-6)
+
+    def test_incremental_update_matches_full_design(self):
+        self.equalizer.set_output_gain(3.0)
+        self.equalizer.update_filters(np.linspace(-6, 6, self.bands))
+        self.equalizer.update_filters(np.linspace(6, -6, self.bands))
+        fresh = Equalizer(sample_rate=self.sample_rate, bands=self.bands)
+        fresh.set_output_gain(3.0)
+        fresh.update_filters(np.linspace(6, -6, self.bands))
+        np.testing.assert_allclose(self.equalizer.sos, fresh.sos)
+
+    def test_flat_skips_filtering(self):
+        data = np.random.default_rng(5).standard_normal((1024, 2))
+        self.assertIs(self.equalizer.process(data), data)
+        self.equalizer.set_gain(3, 3.0)
+        self.assertIsNot(self.equalizer.process(data), data)
+
+    def test_boost_changes_output(self):
+        self.equalizer._native = None
+        self.equalizer.set_gain(0, 12.0)
+        data = np.random.default_rng(1).standard_normal((1024, 2))
+        processed = self.equalizer.process(data.copy())
+        self.assertGreater(np.sum(processed ** 2), np.sum(data ** 2))
+
+    def test_state_carries_across_blocks(self):
+        self.equalizer._native = None
+        self.equalizer.set_smoothing_time(0)
+        self.equalizer.set_gain(4, 6.0)
+        data = np.random.default_rng(2).standard_normal((1024, 2))
+        other = Equalizer(sample_rate=self.sample_rate, bands=self.bands)
+        other._native = None
+        other.set_smoothing_time(0)
+        other.set_gain(4, 6.0)
+        whole = self.equalizer.process(data.copy())
+        split = np.concatenate([other.process(data[:512].copy()),
+                                other.process(data[512:].copy())])
+        np.testing.assert_allclose(split, whole, atol=1e-6)
+
+    def test_gain_changes_are_smoothed(self):
+        self.equalizer._native = None
+        self.equalizer.set_format(blocksize=480)
+        self.equalizer.set_gain(4, 6.0)
+        block = np.zeros((480, 2), dtype=np.float32)
+        self.equalizer.process(block)
+        first = self.equalizer._smoothed_gains[4]
+        self.assertGreater(first, 0.0)
+        self.assertLess(first, 6.0)
+        for _ in range(50):
+            self.equalizer.process(block)
+        self.assertEqual(self.equalizer._smoothed_gains[4], 6.0)
+        self.assertFalse(self.equalizer._needs_update)
+
+    def test_output_gain_folded_into_cascade(self):
+        self.equalizer._native = None
+        self.equalizer.set_output_gain(6.0)
+        data = np.random.default_rng(4).standard_normal((1024, 2)).astype(np.float32)
+        processed = self.equalizer.process(data.copy())
+        self.assertEqual(processed.dtype, np.float32)
+        np.testing.assert_allclose(processed, data * 10 ** (6.0 / 20), atol=1e-5)
+
+    def test_planar_layout(self):
+        self.equalizer._native = None
+        self.equalizer.set_gain(2, 6.0)
+        data = np.random.default_rng(6).standard_normal((512, 2))
+        other = Equalizer(sample_rate=self.sample_rate, bands=self.bands)
+        other._native = None
+        other.set_gain(2, 6.0)
+        other.set_layout('planar')
+        expected = self.equalizer.process(data.copy())
+        processed = other.process(to_planar(data))
+        self.assertEqual(processed.shape, (2, 512))
+        np.testing.assert_allclose(to_interleaved(processed), expected, atol=1e-9)
+
+    def test_specialized_format_matches_generic(self):
+        data = np.random.default_rng(7).standard_normal((480, 2)).astype(np.float32)
+        outputs = []
+        for blocksize in (480, None):
+            eq = Equalizer(sample_rate=self.sample_rate, bands=self.bands)
+            eq._native = None
+            eq.set_format(channels=2, blocksize=blocksize)
+            eq.set_smoothing_time(0)
+            eq.set_gain(1, 6.0)
+            outputs.append(eq.process(data.copy()).copy())
+        np.testing.assert_allclose(outputs[0], outputs[1], atol=1e-6)
+
+    def test_filter_bank_flat_is_delayed_input(self):
+        self.equalizer._native = None
+        self.equalizer.set_filter_bank(True, fft_size=256)
+        data = np.random.default_rng(3).standard_normal((2000, 2))
+        blocks = [self.equalizer.process(data[i:i + 300].copy()) for i in range(0, 2000, 300)]
+        processed = np.concatenate(blocks)
+        np.testing.assert_allclose(processed[256:], data[:-256], atol=1e-9)
+
+    def test_filter_bank_follows_gains(self):
+        self.equalizer._native = None
+        self.equalizer.set_filter_bank(True, fft_size=512)
+        self.equalizer.set_gain(9, 12.0)
+        self.equalizer.update_filters()
+        bins = self.equalizer._filter_bank.bin_frequencies(self.sample_rate)
+        gains = self.equalizer._filter_bank.gains
+        self.assertAlmostEqual(gains[0], 1.0, places=3)
+        self.assertGreater(gains[np.searchsorted(bins, 20000)], 1.9)
+
 if __name__ == "__main__":
     unittest.main()
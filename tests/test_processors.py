@@ -0,0 +1,136 @@
+import unittest
+import numpy as np
+from scipy import signal
+from audio_processing.processors import (AudioProcessor, BassBoost, Equalizer,
+                                         SpatialEnhancer, NoiseReducer, ProcessorChain,
+                                         to_planar, to_interleaved)
+
+class TestBassBoost(unittest.TestCase):
+
+    def test_blocks_match_continuous_filter(self):
+        boost = BassBoost(sample_rate=48000, cutoff=200, gain_db=6)
+        data = np.random.default_rng(0).standard_normal((1024, 2))
+        b, a = signal.butter(2, 200 / 24000, 'low')
+        expected = signal.lfilter(b * 10 ** (6 / 20), a, data, axis=0)
+        processed = np.concatenate([boost.process(data[:512]), boost.process(data[512:])])
+        # Blocks come back in float32
+        self.assertEqual(processed.dtype, np.float32)
+        np.testing.assert_allclose(processed, expected, atol=1e-5)
+
+    def test_float32_blocks_stay_float32(self):
+        eq = Equalizer(sample_rate=48000, bands=10)
+        eq._native = None
+        eq.set_gain(4, 3.0)
+        chain = ProcessorChain([eq, BassBoost(sample_rate=48000),
+                                SpatialEnhancer(), NoiseReducer(threshold=0.01)])
+        data = np.random.default_rng(5).uniform(-0.5, 0.5, (256, 2)).astype(np.float32)
+        self.assertEqual(chain.process(data).dtype, np.float32)
+
+class TestSpatialEnhancer(unittest.TestCase):
+
+    def setUp(self):
+        self.enhancer = SpatialEnhancer(width=0.5)
+        self.enhancer.set_format(sample_rate=48000, channels=2, blocksize=256)
+
+    def test_matches_mid_side_widening(self):
+        data = np.random.default_rng(0).uniform(-0.3, 0.3, (256, 2)).astype(np.float32)
+        mid = (data[:, 0] + data[:, 1]) / 2
+        side = (data[:, 0] - data[:, 1]) / 2 * 1.5
+        expected = np.column_stack((mid + side, mid - side))
+        processed = self.enhancer.process(data)
+        np.testing.assert_allclose(processed, expected, atol=1e-6)
+
+    def test_normalizes_clipping(self):
+        data = np.full((256, 2), 0.9, dtype=np.float32)
+        data[:, 1] = -0.9
+        processed = self.enhancer.process(data)
+        self.assertAlmostEqual(float(np.max(np.abs(processed))), 1.0, places=6)
+
+    def test_mono_passthrough(self):
+        data = np.ones(256, dtype=np.float32)
+        self.assertIs(self.enhancer.process(data), data)
+
+    def test_planar_matches_interleaved(self):
+        data = np.random.default_rng(1).uniform(-0.3, 0.3, (256, 2)).astype(np.float32)
+        expected = self.enhancer.process(data).copy()
+        self.enhancer.set_format(layout='planar')
+        processed = self.enhancer.process(to_planar(data))
+        np.testing.assert_allclose(to_interleaved(processed), expected, atol=1e-6)
+
+class TestNoiseReducer(unittest.TestCase):
+
+    def test_soft_gate(self):
+        reducer = NoiseReducer(threshold=0.1)
+        data = np.array([[0.05, -0.15], [0.3, -0.2]])
+        expected = data * np.clip((np.abs(data) - 0.1) / 0.1, 0, 1)
+        processed = reducer.process(data.copy())
+        np.testing.assert_allclose(processed, expected)
+
+    def test_mono_block(self):
+        reducer = NoiseReducer(threshold=0.1)
+        data = np.array([0.05, 0.15, 0.5])
+        processed = reducer.process(data.copy())
+        np.testing.assert_allclose(processed, [0.0, 0.075, 0.5])
+
+    def test_input_left_unchanged(self):
+        reducer = NoiseReducer(threshold=0.1)
+        data = np.array([[0.05, -0.15], [0.3, -0.2]], dtype=np.float32)
+        original = data.copy()
+        reducer.process(data)
+        np.testing.assert_array_equal(data, original)
+
+class _Doubler(AudioProcessor):
+
+    def _process_impl(self, data):
+        return data * 2
+
+class TestProcessorChain(unittest.TestCase):
+
+    def test_skips_disabled_processors(self):
+        first, second = _Doubler(), _Doubler()
+        chain = ProcessorChain([first, second])
+        data = np.ones(4)
+        np.testing.assert_array_equal(chain.process(data), data * 4)
+        second.disable()
+        np.testing.assert_array_equal(chain.process(data), data * 2)
+        second.toggle()
+        np.testing.assert_array_equal(chain.process(data), data * 4)
+
+    def test_removed_processor_stops_notifying(self):
+        processor = _Doubler()
+        chain = ProcessorChain([processor])
+        chain.remove(processor)
+        processor.disable()
+        self.assertEqual(len(chain), 0)
+        self.assertEqual(processor._listeners, [])
+
+    def test_fused_filters_match_sequential(self):
+        def make():
+            eq = Equalizer(sample_rate=48000, bands=10)
+            eq._native = None
+            eq.set_smoothing_time(0)
+            eq.set_gain(2, 6.0)
+            return eq, BassBoost(sample_rate=48000)
+        data = np.random.default_rng(3).standard_normal((2, 256, 2)).astype(np.float32)
+        eq, boost = make()
+        expected = [boost.process(eq.process(block.copy())).copy() for block in data]
+        chain = ProcessorChain(make())
+        processed = [chain.process(block.copy()).copy() for block in data]
+        np.testing.assert_allclose(processed, expected, atol=1e-5)
+
+    def test_reset_forgets_previous_blocks(self):
+        def make():
+            eq = Equalizer(sample_rate=48000, bands=10)
+            eq._native = None
+            eq.set_smoothing_time(0)
+            eq.set_gain(2, 6.0)
+            return eq, BassBoost(sample_rate=48000)
+        data = np.random.default_rng(5).standard_normal((2, 256, 2)).astype(np.float32)
+        expected = ProcessorChain(make()).process(data[1].copy()).copy()
+        chain = ProcessorChain(make())
+        chain.process(data[0].copy())
+        chain.reset()
+        np.testing.assert_allclose(chain.process(data[1].copy()), expected, atol=1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,10 +3,19 @@ Widget for controlling a specific audio type (game, movie, music, chat, micropho
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QComboBox, QSlider, QGroupBox, QPushButton, QCheckBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+import numpy as np
 from ui.equalizer_widget import EqualizerWidget
-import json
-import os
+from ui.config_store import ConfigStore
+
+# Display names for the audio categories
+_DISPLAY_NAMES = {
+    'game': 'Game',
+    'others': 'Others',
+    'system': 'System', 
+    'chat': 'Chat',
+    'microphone': 'Microphone'
+}
 
 class AudioTypeWidget(QWidget):
     """Widget for controlling a specific audio type"""
@@ -21,6 +30,12 @@ class AudioTypeWidget(QWidget):
         self.processors = {}
         self.active_processors = []
         self.equalizer_widget = None
+
+        # Slider drags emit many changes; apply the latest one at most every 50ms
+        self._eq_timer = QTimer(self)
+        self._eq_timer.setSingleShot(True)
+        self._eq_timer.setInterval(50)
+        self._eq_timer.timeout.connect(self._apply_equalizer_changes)
         
         # Set up UI
         self.init_ui()
@@ -55,14 +70,7 @@ class AudioTypeWidget(QWidget):
 
     def get_category_display_name(self):
         """Get display name for the audio category"""
-        display_names = {
-            'game': 'Game',
-            'others': 'Others',
-            'system': 'System', 
-            'chat': 'Chat',
-            'microphone': 'Microphone'
-        }
-        return display_names.get(self.audio_type, self.audio_type.title())
+        return _DISPLAY_NAMES.get(self.audio_type, self.audio_type.title())
 
     def set_processors(self, processors):
         """Set available audio processors"""
@@ -75,24 +83,26 @@ class AudioTypeWidget(QWidget):
     def load_settings(self):
         """Load equalizer settings for this category from config"""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                
-                eq_settings = config.get('equalizer_settings', {})
-                active_profile = eq_settings.get('active_profile', 'Default')
-                profiles = eq_settings.get('profiles', {})
-                
-                if active_profile in profiles and self.audio_type in profiles[active_profile]:
-                    category_settings = profiles[active_profile][self.audio_type]
-                    if self.equalizer_widget:
-                        self.equalizer_widget.load_settings(category_settings)
+            config = ConfigStore.instance().get()
+            
+            eq_settings = config.get('equalizer_settings', {})
+            active_profile = eq_settings.get('active_profile', 'Default')
+            profiles = eq_settings.get('profiles', {})
+            
+            if active_profile in profiles and self.audio_type in profiles[active_profile]:
+                category_settings = profiles[active_profile][self.audio_type]
+                if self.equalizer_widget:
+                    self.equalizer_widget.load_settings(category_settings)
         except Exception as e:
             print(f"Error loading settings for {self.audio_type}: {e}")
 
     def on_equalizer_changed(self):
-        """Handle equalizer settings change"""
+        """Handle equalizer settings change (coalesced, see _eq_timer)"""
+        if not self._eq_timer.isActive():
+            self._eq_timer.start()
+
+    def _apply_equalizer_changes(self):
+        """Save, apply and announce the current equalizer settings"""
         if not self.equalizer_widget:
             return
             
@@ -108,35 +118,20 @@ class AudioTypeWidget(QWidget):
         self.equalizer_changed.emit(self.audio_type, settings)
 
     def save_settings(self, settings):
-        """Save equalizer settings to config file"""
+        """Save equalizer settings to config (written shortly after, coalesced)"""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
-            
-            # Load current config
-            config = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+            store = ConfigStore.instance()
+            config = store.get()
             
             # Ensure structure exists
             if 'equalizer_settings' not in config:
-                config['equalizer_settings'] = {'bands': 10, 'profiles': {}, 'active_profile': 'Default'}
-            
-            eq_settings = config['equalizer_settings']
-            active_profile = eq_settings.get('active_profile', 'Default')
-            
-            if 'profiles' not in eq_settings:
-                eq_settings['profiles'] = {}
-            
-            if active_profile not in eq_settings['profiles']:
-                eq_settings['profiles'][active_profile] = {}
+                store.update(('equalizer_settings',),
+                             {'bands': 10, 'profiles': {}, 'active_profile': 'Default'})
             
-            # Save category settings
-            eq_settings['profiles'][active_profile][self.audio_type] = settings
+            active_profile = store.get()['equalizer_settings'].get('active_profile', 'Default')
             
-            # Write back to file
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Save category settings; missing levels are created
+            store.update(('equalizer_settings', 'profiles', active_profile, self.audio_type), settings)
                 
         except Exception as e:
             print(f"Error saving settings for {self.audio_type}: {e}")
@@ -149,11 +144,10 @@ class AudioTypeWidget(QWidget):
         equalizer = self.processors['equalizer']
         
         if settings.get('enabled', False):
-            # Configure equalizer with current settings using per-band API
+            # Configure all bands at once so the filters are redesigned once
             gains = settings.get('gains', [0.0] * getattr(equalizer, 'bands', 10))
             band_count = min(getattr(equalizer, 'bands', 10), len(gains))
-            for i in range(band_count):
-                equalizer.set_gain(i, gains[i])
+            equalizer.set_gains(np.asarray(gains, dtype=np.float32)[:band_count])
             
             # Apply to this audio type
             self.routing_system.apply_audio_processing(self.audio_type, equalizer)
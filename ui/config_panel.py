@@ -1,17 +1,82 @@
 """
 Embedded settings panel for the Audio Enhancement Software
 """
-import json
-import os
+import copy
+import re
+from types import MappingProxyType
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QComboBox, QCheckBox, QPushButton, QGroupBox,
+    QComboBox, QPushButton, QGroupBox,
     QGridLayout, QMessageBox, QListWidget, QListWidgetItem,
-    QAbstractItemView, QInputDialog
+    QInputDialog, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtCore import QTimer
-from ui.device_notification_dialog import DeviceNotificationDialog
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from ui.device_monitor import DeviceMonitor
+from ui.config_store import ConfigStore
+from ui.mixer_widget import read_session_mime
+
+# Programs auto-categorized as chat, matched against lowercased session names
+_CHAT_RE = re.compile(r"discord|whatsapp|telegram|skype|zoom")
+
+# Entries of the theme selector
+_THEMES = ("Light", "Dark", "Green Matrix", "System")
+_THEME_ROWS = {name: row for row, name in enumerate(_THEMES)}
+
+# Category picker: display name -> category key, in menu order
+_CATEGORY_CHOICES = MappingProxyType({
+    "Game": "game", "Others": "others", "System": "system", "Chat": "chat"
+})
+
+# Categories every equalizer profile holds settings for
+_CATEGORIES = ("game", "others", "system", "chat", "microphone")
+
+
+def _names_by_id(devices):
+    """Map device index to display name"""
+    return {d.get('index'): d.get('name', 'Unknown Device') for d in devices}
+
+
+def fill_device_combo(combo, devices):
+    """
+    Replace a device combo's items in one batch.
+
+    The items are built in a detached model that is swapped in whole, so
+    the view is invalidated once rather than per device. Signals are
+    blocked meanwhile, so no selection change fires for intermediate
+    states, and the previously selected device stays selected if it is
+    still present.
+
+    Returns:
+        dict: Maps each device index to its row in the combo, so callers
+            can select a device without a findData() scan.
+    """
+    previous = combo.currentData()
+    model = QStandardItemModel(combo)
+    rows = {}
+    for row, device in enumerate(devices):
+        item = QStandardItem(device['name'])
+        item.setData(device['index'], Qt.UserRole)
+        model.appendRow(item)
+        rows.setdefault(device['index'], row)
+    combo.setUpdatesEnabled(False)
+    combo.blockSignals(True)
+    try:
+        combo.setModel(model)
+        index = rows.get(previous, -1)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+    finally:
+        combo.blockSignals(False)
+        combo.setUpdatesEnabled(True)
+    return rows
+
+
+def _blank_profile(bands):
+    """Equalizer profile with every category disabled and flat"""
+    flat = [0.0] * bands
+    return {category: {"enabled": False, "preset": "Flat", "gains": flat.copy()}
+            for category in _CATEGORIES}
 
 class ConfigPanel(QWidget):
     """Embedded configuration panel (used as a tab)"""
@@ -25,14 +90,18 @@ class ConfigPanel(QWidget):
     def __init__(self, routing_system, parent=None):
         super().__init__(parent)
         self.routing_system = routing_system
-        self.config_file = "config.json"
         self.config = self.load_config()
-        self.session_overrides = self.config.get("session_overrides_by_name", {})
+        # Overrides are looked up by lowercased session name
+        self.session_overrides = {k.lower(): v for k, v in
+                                  self.config.get("session_overrides_by_name", {}).items()}
+        self.config["session_overrides_by_name"] = self.session_overrides
+        # (output, input) last handed to the routing system, see apply_device_configuration
+        self._applied_devices = None
 
         self.init_ui()
         self.load_settings()
         # Program categorization UI is now in Mixer; no session list here
-        # Initialize device tracking sets and start polling for changes
+        # Initialize device tracking sets and listen for device changes
         try:
             out_devs = self.routing_system.get_output_devices() or []
             in_devs = self.routing_system.get_input_devices() or []
@@ -40,10 +109,9 @@ class ConfigPanel(QWidget):
             out_devs, in_devs = [], []
         self._last_output_ids = {d.get('index') for d in out_devs}
         self._last_input_ids = {d.get('index') for d in in_devs}
-        self._device_timer = QTimer(self)
-        self._device_timer.setInterval(2000)  # 2 seconds
-        self._device_timer.timeout.connect(self.check_device_changes)
-        self._device_timer.start()
+        self._device_monitor = DeviceMonitor(self.routing_system, self)
+        self._device_monitor.devices_changed.connect(self.check_device_changes)
+        QApplication.instance().aboutToQuit.connect(self._device_monitor.stop)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -66,7 +134,12 @@ class ConfigPanel(QWidget):
 
         # Refresh Devices Button
         refresh_btn = QPushButton("Refresh Devices")
-        refresh_btn.clicked.connect(self.refresh_devices)
+        refresh_btn.clicked.connect(self._schedule_refresh)
+        # Each rescan restarts PortAudio; rapid clicks coalesce into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self.refresh_devices)
         device_layout.addWidget(refresh_btn, 2, 0, 1, 2)
 
         device_group.setLayout(device_layout)
@@ -106,7 +179,7 @@ class ConfigPanel(QWidget):
 
         theme_layout.addWidget(QLabel("Theme:"), 0, 0)
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Light", "Dark", "Green Matrix", "System"])
+        self.theme_combo.addItems(_THEMES)
         theme_layout.addWidget(self.theme_combo, 0, 1)
 
         theme_group.setLayout(theme_layout)
@@ -132,23 +205,17 @@ class ConfigPanel(QWidget):
     def _make_drop_handler(self, category):
         def handler(event):
             try:
-                mime = event.mimeData()
-                text = mime.text()
-                # Expect format: pid:<pid>|name:<name>
-                if text.startswith("pid:"):
-                    parts = text.split("|")
-                    pid_part = parts[0].split(":")[1]
-                    name_part = parts[1].split(":")[1] if len(parts) > 1 else "Unknown"
-                    pid = int(pid_part) if pid_part.isdigit() else -1
-                    self.on_session_dropped(pid, name_part, category)
+                session = read_session_mime(event.mimeData())
+                if session is not None:
+                    self.on_session_dropped(*session, category)
             except Exception:
                 pass
             event.accept()
         return handler
 
     def _add_item(self, lst: QListWidget, name: str, pid: int):
-        # Encode PID|NAME in the visible text so drops can parse reliably
-        item = QListWidgetItem(f"pid:{pid}|name:{name}")
+        # Show the name; the session itself travels in UserRole
+        item = QListWidgetItem(name)
         item.setData(Qt.UserRole, {"pid": pid, "name": name})
         item.setFlags(item.flags() | Qt.ItemIsEnabled)
         lst.addItem(item)
@@ -165,9 +232,9 @@ class ConfigPanel(QWidget):
         # Populate All and categories with auto-categorization
         for sess in sessions:
             name = sess.get("name") or sess.get("display_name") or "Unknown"
-            pid = sess.get("pid") or sess.get("process_id") or -1
+            pid = sess["pid"]
             self._add_item(self.session_lists["all"], name, pid)
-            cat = self._determine_category(name, pid)
+            cat = self._determine_category(name.lower(), pid)
             if cat in self.session_lists and cat != "all":
                 self._add_item(self.session_lists[cat], name, pid)
                 try:
@@ -175,15 +242,16 @@ class ConfigPanel(QWidget):
                 except Exception:
                     pass
 
-    def _determine_category(self, name: str, pid: int) -> str:
-        lname = (name or "").lower()
+    def _determine_category(self, lname: str, pid: int) -> str:
+        """Category for a session, given its lowercased name"""
         # Overrides by name take precedence
-        if hasattr(self, "session_overrides") and lname in self.session_overrides:
-            return self.session_overrides[lname]
+        category = self.session_overrides.get(lname)
+        if category is not None:
+            return category
         # Auto rules
         if pid == -1 or "system" in lname:
             return "system"
-        if any(x in lname for x in ["discord", "whatsapp", "telegram", "skype", "zoom"]):
+        if _CHAT_RE.search(lname):
             return "chat"
         # Default bucket
         return "others"
@@ -191,11 +259,9 @@ class ConfigPanel(QWidget):
     def on_session_dropped(self, pid: int, name: str, category: str):
         lname = (name or "").lower()
         # Persist override by name
-        if not hasattr(self, "session_overrides"):
-            self.session_overrides = {}
         self.session_overrides[lname] = category
         self.config["session_overrides_by_name"] = self.session_overrides
-        self.save_config()
+        self._update_config(("session_overrides_by_name", lname), category)
         # Route session
         try:
             self.routing_system.set_session_category(pid, category)
@@ -206,50 +272,66 @@ class ConfigPanel(QWidget):
 
     def on_session_item_clicked(self, item: QListWidgetItem):
         try:
-            text = item.text()
-            pid = -1
-            name = "Unknown"
-            if text.startswith("pid:"):
-                parts = text.split("|")
-                pid_part = parts[0].split(":")[1]
-                name_part = parts[1].split(":")[1] if len(parts) > 1 else "Unknown"
-                pid = int(pid_part) if pid_part.isdigit() else -1
-                name = name_part
+            data = item.data(Qt.UserRole) or {}
+            pid = data.get("pid", -1)
+            name = data.get("name") or "Unknown"
             # Prompt for category selection
-            display_options = ["Game", "Others", "System", "Chat"]
-            key_map = {"Game": "game", "Others": "others", "System": "system", "Chat": "chat"}
-            choice, ok = QInputDialog.getItem(self, "Set Category", f"Choose category for {name}", display_options, 0, False)
-            if ok and choice in key_map:
-                self.on_session_dropped(pid, name, key_map[choice])
+            choice, ok = QInputDialog.getItem(self, "Set Category", f"Choose category for {name}",
+                                              list(_CATEGORY_CHOICES), 0, False)
+            if ok and choice in _CATEGORY_CHOICES:
+                self.on_session_dropped(pid, name, _CATEGORY_CHOICES[choice])
         except Exception:
             pass
 
-    def populate_output_devices(self):
-        """Populate the output device combo box"""
-        self.output_device_combo.clear()
-        devices = self.routing_system.get_output_devices()
-        for device in devices:
-            self.output_device_combo.addItem(device['name'], device['index'])
+    def populate_output_devices(self, devices=None):
+        """Populate the output device combo box (from `devices` if already fetched)"""
+        if devices is None:
+            devices = self.routing_system.get_output_devices()
+        self._output_rows = fill_device_combo(self.output_device_combo, devices)
+
+    def populate_input_devices(self, devices=None):
+        """Populate the input device combo box (from `devices` if already fetched)"""
+        if devices is None:
+            devices = self.routing_system.get_input_devices()
+        self._input_rows = fill_device_combo(self.input_device_combo, devices)
+
+    def output_device_row(self, device_id):
+        """Row of an output device in its combo, or -1 if it is not listed"""
+        return self._output_rows.get(device_id, -1)
+
+    def input_device_row(self, device_id):
+        """Row of an input device in its combo, or -1 if it is not listed"""
+        return self._input_rows.get(device_id, -1)
+
+    @staticmethod
+    def _select_silently(combo, index):
+        """Select an item without firing on_devices_changed (caller applies)"""
+        combo.blockSignals(True)
+        try:
+            combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
 
-    def populate_input_devices(self):
-        """Populate the input device combo box"""
-        self.input_device_combo.clear()
-        devices = self.routing_system.get_input_devices()
-        for device in devices:
-            self.input_device_combo.addItem(device['name'], device['index'])
+    def _schedule_refresh(self):
+        """Refresh the devices once clicks on the refresh button settle"""
+        self._refresh_timer.start()
 
     def refresh_devices(self):
-        """Refresh the device lists and reapply current selections"""
+        """Refresh the device lists and reapply current selections
+
+        Repopulating and restoring the selection happen with the combos'
+        signals blocked, so routing is reconfigured exactly once, at the end.
+        """
         self.routing_system.refresh_devices()
         self.populate_output_devices()
         self.populate_input_devices()
         # Reapply selection from config
         self.load_settings()
         # Apply unified configuration after refresh to keep routing in sync
-        self.apply_device_configuration()
+        self.apply_device_configuration(force=True)
 
     def load_config(self):
-        """Load configuration from file"""
+        """Load configuration (defaults overlaid with the shared config store)"""
         default_config = {
             "theme": "Light",
             "unified_device_mode": False,
@@ -264,44 +346,57 @@ class ConfigPanel(QWidget):
             }
         }
 
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    default_config.update(config)
-                    return default_config
-            except Exception as e:
-                print(f"Error loading config: {e}")
-
+        # Private copy: the panel edits nested values in place
+        default_config.update(copy.deepcopy(ConfigStore.instance().get()))
         return default_config
 
-    def save_config(self):
-        """Save configuration to file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to save configuration: {e}")
+    def _update_config(self, path, value):
+        """
+        Set a config value and schedule a write.
+
+        The shared ConfigStore coalesces bursts of changes into one atomic
+        write and only touches the given key, so settings other widgets
+        saved in the meantime are not overwritten with this panel's copy.
+
+        Args:
+            path (tuple): Keys leading to the value.
+            value: JSON-serializable value.
+        """
+        node = self.config
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+        # The panel keeps editing self.config in place; the store gets its own
+        ConfigStore.instance().update(path, copy.deepcopy(value))
 
     def load_settings(self):
         """Load settings into the UI"""
-        # Theme settings
-        theme_index = self.theme_combo.findText(self.config.get("theme", "Light"))
-        if theme_index >= 0:
-            self.theme_combo.setCurrentIndex(theme_index)
-
-        # Device settings - always use unified mode now
-        output_device = self.config.get("unified_output_device")
-        if output_device is not None:
-            output_index = self.output_device_combo.findData(output_device)
-            if output_index >= 0:
-                self.output_device_combo.setCurrentIndex(output_index)
-
-        input_device = self.config.get("unified_input_device")
-        if input_device is not None:
-            input_index = self.input_device_combo.findData(input_device)
-            if input_index >= 0:
-                self.input_device_combo.setCurrentIndex(input_index)
+        # Showing stored values is not a user change: keep the combos from
+        # re-saving and re-applying them (callers apply explicitly if needed)
+        combos = (self.theme_combo, self.output_device_combo, self.input_device_combo)
+        for combo in combos:
+            combo.blockSignals(True)
+        try:
+            # Theme settings
+            theme_index = _THEME_ROWS.get(self.config.get("theme", "Light"), -1)
+            if theme_index >= 0:
+                self.theme_combo.setCurrentIndex(theme_index)
+
+            # Device settings - always use unified mode now
+            output_device = self.config.get("unified_output_device")
+            if output_device is not None:
+                output_index = self._output_rows.get(output_device, -1)
+                if output_index >= 0:
+                    self.output_device_combo.setCurrentIndex(output_index)
+
+            input_device = self.config.get("unified_input_device")
+            if input_device is not None:
+                input_index = self._input_rows.get(input_device, -1)
+                if input_index >= 0:
+                    self.input_device_combo.setCurrentIndex(input_index)
+        finally:
+            for combo in combos:
+                combo.blockSignals(False)
 
         # Equalizer settings - refresh profiles
         try:
@@ -311,19 +406,30 @@ class ConfigPanel(QWidget):
 
     def on_theme_changed(self, theme_name):
         """Apply theme immediately when changed"""
-        self.config["theme"] = theme_name
-        self.save_config()
+        self._update_config(("theme",), theme_name)
         self.theme_changed.emit(theme_name)
 
     def on_devices_changed(self):
         """Apply device routing when device selections change"""
         self.apply_device_configuration()
 
-    def apply_device_configuration(self):
-        """Apply and emit device routing configuration - always unified mode"""
-        self.config["unified_device_mode"] = True  # Always enabled now
-        self.config["unified_output_device"] = self.output_device_combo.currentData()
-        self.config["unified_input_device"] = self.input_device_combo.currentData()
+    def apply_device_configuration(self, force=False):
+        """
+        Apply and emit device routing configuration - always unified mode
+
+        Args:
+            force (bool): Re-apply even if the selection is the one applied
+                last (e.g. after the devices were re-enumerated).
+        """
+        devices = (self.output_device_combo.currentData(), self.input_device_combo.currentData())
+        # Selecting a device fires the combo signal and callers often apply
+        # explicitly as well; re-routing and notifying twice buys nothing
+        if not force and devices == self._applied_devices:
+            return
+        self._applied_devices = devices
+        self._update_config(("unified_device_mode",), True)  # Always enabled now
+        self._update_config(("unified_output_device",), devices[0])
+        self._update_config(("unified_input_device",), devices[1])
 
         # Apply to routing system
         self.routing_system.set_unified_device_mode(
@@ -332,8 +438,7 @@ class ConfigPanel(QWidget):
             self.config["unified_input_device"]
         )
 
-        # Save and emit signals
-        self.save_config()
+        # Emit signals
         self.unified_device_changed.emit(
             True,  # Always unified
             self.config["unified_output_device"],
@@ -342,18 +447,18 @@ class ConfigPanel(QWidget):
 
     def on_apply_clicked(self):
         # Persist and apply device configuration
-        self.apply_device_configuration()
+        self.apply_device_configuration(force=True)
         # Ensure session overrides are saved and applied to active sessions
-        self.config["session_overrides_by_name"] = getattr(self, "session_overrides", {})
-        self.save_config()
+        # A copy, so later in-place edits are not mistaken for saved values
+        self._update_config(("session_overrides_by_name",), dict(self.session_overrides))
         try:
             sessions = self.routing_system.list_active_sessions() or []
         except Exception:
             sessions = []
-        overrides = getattr(self, "session_overrides", {}) or {}
+        overrides = self.session_overrides
         for sess in sessions:
             name = (sess.get("name") or sess.get("display_name") or "Unknown").lower()
-            pid = sess.get("pid") or sess.get("process_id") or -1
+            pid = sess["pid"]
             if name in overrides:
                 try:
                     self.routing_system.set_session_category(pid, overrides[name])
@@ -366,9 +471,7 @@ class ConfigPanel(QWidget):
     def on_profile_changed(self, profile_name):
         """Handle profile selection change"""
         try:
-            self.config["equalizer_settings"] = self.config.get("equalizer_settings", {})
-            self.config["equalizer_settings"]["active_profile"] = profile_name
-            self.save_config()
+            self._update_config(("equalizer_settings", "active_profile"), profile_name)
             
             # Notify all audio type widgets to reload their equalizer settings
             self.profile_changed.emit(profile_name)
@@ -380,16 +483,12 @@ class ConfigPanel(QWidget):
         """Deprecated: bands are controlled directly in Equalizer tab"""
         try:
             bands = int(bands_str)
-            self.config["equalizer_settings"] = self.config.get("equalizer_settings", {})
-            self.config["equalizer_settings"]["bands"] = bands
-            self.save_config()
+            self._update_config(("equalizer_settings", "bands"), bands)
         except Exception as e:
             print(f"Error changing bands: {e}")
     
     def create_new_profile(self):
         """Create a new equalizer profile"""
-        from PyQt5.QtWidgets import QInputDialog
-        
         profile_name, ok = QInputDialog.getText(self, "New Profile", "Enter profile name:")
         if ok and profile_name.strip():
             try:
@@ -398,17 +497,10 @@ class ConfigPanel(QWidget):
                 
                 # Create new profile with default settings
                 bands = self.config["equalizer_settings"].get("bands", 10)
-                new_profile = {}
-                for category in ["game", "others", "system", "chat", "microphone"]:
-                    new_profile[category] = {
-                        "enabled": False,
-                        "preset": "Flat",
-                        "gains": [0.0] * bands
-                    }
+                new_profile = _blank_profile(bands)
                 
-                self.config["equalizer_settings"]["profiles"][profile_name] = new_profile
-                self.config["equalizer_settings"]["active_profile"] = profile_name
-                self.save_config()
+                self._update_config(("equalizer_settings", "profiles", profile_name), new_profile)
+                self._update_config(("equalizer_settings", "active_profile"), profile_name)
                 
                 self.refresh_profiles()
                 self.profile_combo.setCurrentText(profile_name)
@@ -440,14 +532,13 @@ class ConfigPanel(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                self.config["equalizer_settings"] = self.config.get("equalizer_settings", {})
-                self.config["equalizer_settings"]["profiles"] = self.config["equalizer_settings"].get("profiles", {})
-                
-                if current_profile in self.config["equalizer_settings"]["profiles"]:
-                    del self.config["equalizer_settings"]["profiles"][current_profile]
-                
-                self.config["equalizer_settings"]["active_profile"] = "Default"
-                self.save_config()
+                # Start from the stored profiles so category settings saved
+                # by the equalizer tabs survive the rewrite
+                stored = ConfigStore.instance().get().get("equalizer_settings", {})
+                profiles = copy.deepcopy(stored.get("profiles", {}))
+                profiles.pop(current_profile, None)
+                self._update_config(("equalizer_settings", "profiles"), profiles)
+                self._update_config(("equalizer_settings", "active_profile"), "Default")
                 
                 self.refresh_profiles()
                 self.profile_combo.setCurrentText("Default")
@@ -458,16 +549,25 @@ class ConfigPanel(QWidget):
     def refresh_profiles(self):
         """Refresh the profile combo box"""
         try:
-            self.profile_combo.clear()
+            combo = self.profile_combo
             profiles = self.config.get("equalizer_settings", {}).get("profiles", {"Default": {}})
-            for profile_name in profiles.keys():
-                self.profile_combo.addItem(profile_name)
+            # Rebuild silently, then select the active profile so that
+            # profile_changed fires once rather than for every added item
+            combo.setUpdatesEnabled(False)
+            combo.blockSignals(True)
+            try:
+                combo.clear()
+                combo.addItems(list(profiles.keys()))
+                combo.setCurrentIndex(-1)
+            finally:
+                combo.blockSignals(False)
+                combo.setUpdatesEnabled(True)
             
             # Set current profile
             active_profile = self.config.get("equalizer_settings", {}).get("active_profile", "Default")
-            index = self.profile_combo.findText(active_profile)
+            index = combo.findText(active_profile)
             if index >= 0:
-                self.profile_combo.setCurrentIndex(index)
+                combo.setCurrentIndex(index)
                 
         except Exception as e:
             print(f"Error refreshing profiles: {e}")
@@ -479,74 +579,77 @@ class ConfigPanel(QWidget):
             in_devs = self.routing_system.get_input_devices() or []
         except Exception:
             return
-        current_out_ids = {d.get('index') for d in out_devs}
-        current_in_ids = {d.get('index') for d in in_devs}
+        # One pass per direction gives both the id set (keys) and the names
+        out_by_id = _names_by_id(out_devs)
+        in_by_id = _names_by_id(in_devs)
+        # Fast path: notifications that did not change the device sets
+        if out_by_id.keys() == self._last_output_ids and in_by_id.keys() == self._last_input_ids:
+            return
+        current_out_ids = set(out_by_id)
+        current_in_ids = set(in_by_id)
+
+        # Only needed when a device is plugged in or removed
+        from ui.device_notification_dialog import DeviceNotificationDialog
+
+        # Partition one symmetric difference per direction into added/removed
+        out_diff = current_out_ids ^ self._last_output_ids
+        in_diff = current_in_ids ^ self._last_input_ids
+        new_out_ids = out_diff & current_out_ids
+        removed_out_ids = out_diff - current_out_ids
+        new_in_ids = in_diff & current_in_ids
+        removed_in_ids = in_diff - current_in_ids
 
         # Detect new output devices
-        new_out_ids = current_out_ids - getattr(self, '_last_output_ids', set())
         if new_out_ids:
-            self.populate_output_devices()
+            self.populate_output_devices(out_devs)
             new_out_id = next(iter(new_out_ids))
-            device_name = "Unknown Device"
-            for device in out_devs:
-                if device.get('index') == new_out_id:
-                    device_name = device.get('name', 'Unknown Device')
-                    break
+            device_name = out_by_id.get(new_out_id, "Unknown Device")
             current_device_name = self.output_device_combo.currentText() or "No device selected"
             dialog = DeviceNotificationDialog(device_name, "output", current_device_name, self)
             if dialog.exec_() == dialog.Accepted:
-                for i in range(self.output_device_combo.count()):
-                    if self.output_device_combo.itemData(i) == new_out_id:
-                        self.output_device_combo.setCurrentIndex(i)
-                        break
-                self.apply_device_configuration()
+                index = self._output_rows.get(new_out_id, -1)
+                if index >= 0:
+                    self._select_silently(self.output_device_combo, index)
+                self.apply_device_configuration(force=True)
 
         # Detect new input devices (microphones)
-        new_in_ids = current_in_ids - getattr(self, '_last_input_ids', set())
         if new_in_ids:
-            self.populate_input_devices()
+            self.populate_input_devices(in_devs)
             new_in_id = next(iter(new_in_ids))
-            device_name = "Unknown Device"
-            for device in in_devs:
-                if device.get('index') == new_in_id:
-                    device_name = device.get('name', 'Unknown Device')
-                    break
+            device_name = in_by_id.get(new_in_id, "Unknown Device")
             current_device_name = self.input_device_combo.currentText() or "No device selected"
             dialog = DeviceNotificationDialog(device_name, "input", current_device_name, self)
             if dialog.exec_() == dialog.Accepted:
-                for i in range(self.input_device_combo.count()):
-                    if self.input_device_combo.itemData(i) == new_in_id:
-                        self.input_device_combo.setCurrentIndex(i)
-                        break
-                self.apply_device_configuration()
+                index = self._input_rows.get(new_in_id, -1)
+                if index >= 0:
+                    self._select_silently(self.input_device_combo, index)
+                self.apply_device_configuration(force=True)
 
         # Detect removed output devices; prompt if current selection disappeared
-        removed_out_ids = getattr(self, '_last_output_ids', set()) - current_out_ids
         if removed_out_ids:
             current_sel_id = self.output_device_combo.currentData()
             if current_sel_id in removed_out_ids:
-                self.populate_output_devices()
+                self.populate_output_devices(out_devs)
                 if self.output_device_combo.count() > 0:
                     fallback_name = self.output_device_combo.itemText(0)
                     current_device_name = self.output_device_combo.currentText() or "No device selected"
                     dialog = DeviceNotificationDialog(fallback_name, "output", current_device_name, self)
                     if dialog.exec_() == dialog.Accepted:
-                        self.output_device_combo.setCurrentIndex(0)
-                        self.apply_device_configuration()
+                        self._select_silently(self.output_device_combo, 0)
+                        self.apply_device_configuration(force=True)
 
         # Detect removed input devices; prompt if current selection disappeared
-        removed_in_ids = getattr(self, '_last_input_ids', set()) - current_in_ids
         if removed_in_ids:
             current_sel_id = self.input_device_combo.currentData()
             if current_sel_id in removed_in_ids:
-                self.populate_input_devices()
+                self.populate_input_devices(in_devs)
                 if self.input_device_combo.count() > 0:
                     fallback_name = self.input_device_combo.itemText(0)
                     current_device_name = self.input_device_combo.currentText() or "No device selected"
                     dialog = DeviceNotificationDialog(fallback_name, "input", current_device_name, self)
                     if dialog.exec_() == dialog.Accepted:
-                        self.input_device_combo.setCurrentIndex(0)
-                        self.apply_device_configuration()
+                        self._select_silently(self.input_device_combo, 0)
+                        self.apply_device_configuration(force=True)
 
         # Update last seen sets
         self._last_output_ids = current_out_ids
@@ -0,0 +1,255 @@
+"""
+Shared, debounced access to config.json for the UI
+"""
+import copy
+import json
+import os
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Config is written compactly; set SOUND_DEBUG_CONFIG for an indented file
+_PRETTY = bool(os.environ.get("SOUND_DEBUG_CONFIG"))
+
+# Faster native JSON codec when available
+try:
+    import orjson
+
+    _DUMPS_OPTION = orjson.OPT_INDENT_2 if _PRETTY else 0
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_DUMPS_OPTION)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        if _PRETTY:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    _loads = json.loads
+
+# Version of the config layout, stored as "schema" in every written file.
+# Bump it when keys are renamed or restructured, so loading code can tell
+# which layout a file uses
+CONFIG_SCHEMA = 1
+
+# Marks a key path that does not exist in the config
+_MISSING = object()
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
+
+
+def _read_bytes(path):
+    """Whole file contents in one read, or None if there is no file"""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _get_path(config, path):
+    node = config
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
+
+
+def _set_path(config, path, value):
+    node = config
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    node[path[-1]] = value
+
+
+def _write_updates(path, updates):
+    """
+    Merge updates into the config file and write it atomically.
+
+    Returns:
+        tuple: (merged config dict, file mtime after the write)
+    """
+    raw = _read_bytes(path)
+    config = _loads(raw) if raw is not None else {}
+    for key_path, value in updates.items():
+        _set_path(config, key_path, value)
+    config['schema'] = CONFIG_SCHEMA
+    data = _dumps(config)
+    if data != raw:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            # Make sure the new contents are on disk before they replace
+            # the old file, so a crash leaves one or the other intact
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    return config, os.stat(path).st_mtime_ns
+
+
+class _WriteSignals(QObject):
+    finished = pyqtSignal(object)  # (config, mtime), or None on failure
+
+
+class _WriteTask(QRunnable):
+    """Writes one batch of updates on the thread pool"""
+    def __init__(self, path, updates):
+        super().__init__()
+        self.path = path
+        self.updates = updates
+        self.signals = _WriteSignals()
+
+    def run(self):
+        try:
+            result = _write_updates(self.path, self.updates)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            result = None
+        self.signals.finished.emit(result)
+
+
+class ConfigStore:
+    """
+    In-memory view of config.json with coalesced, atomic writes.
+
+    update() changes the in-memory config immediately and (re)starts a
+    short single-shot timer; when it fires, all pending updates are written
+    in one go on a worker thread, so disk latency never stalls the UI.
+    Writes merge the pending keys into the file's current contents, so
+    settings saved by other parts of the UI are preserved, and go through a
+    temp file + os.replace so the file is never half written. Updates that
+    do not change a value are dropped, and a flush that would write back
+    the file's current bytes skips the write.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the application-wide store"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, path=CONFIG_PATH, delay_ms=200):
+        self.path = path
+        self._config = None
+        self._mtime = None
+        self._pending = {}  # Maps key path tuple to value, in update order
+        self._in_flight = {}  # Updates handed to the running write task
+        self._task = None
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _unsaved(self):
+        """Updates not yet on disk, oldest first"""
+        updates = dict(self._in_flight)
+        updates.update(self._pending)
+        return updates
+
+    def get(self):
+        """Return the current config, re-reading the file if it changed on disk"""
+        mtime = self._file_mtime()
+        if self._config is None or mtime != self._mtime:
+            try:
+                raw = _read_bytes(self.path)
+                config = _loads(raw) if raw is not None else {}
+            except Exception as e:
+                print(f"Error loading config: {e}")
+                config = {}
+            for path, value in self._unsaved().items():
+                _set_path(config, path, value)
+            self._config = config
+            self._mtime = mtime
+        return self._config
+
+    def update(self, path, value):
+        """
+        Set a nested config value and schedule a write.
+
+        Args:
+            path (tuple): Keys leading to the value, e.g.
+                ('equalizer_settings', 'profiles', 'Default', 'game').
+            value: JSON-serializable value.
+        """
+        path = tuple(path)
+        # Keep a private copy: callers go on mutating their own dicts and
+        # lists, which must neither change the store behind its back nor
+        # make a later real change look like a no-op
+        value = copy.deepcopy(value)
+        config = self.get()
+        # Combo boxes re-emit the current value; don't schedule a write for it
+        if path not in self._pending and _get_path(config, path) == value:
+            return
+        _set_path(config, path, value)
+        self._pending[path] = value
+        self._timer.start()
+
+    def flush(self, blocking=False):
+        """
+        Write pending updates to disk.
+
+        Args:
+            blocking (bool): Write on the calling thread and return once the
+                file is saved (used at shutdown). Otherwise the write runs
+                on the global thread pool.
+        """
+        self._timer.stop()
+        if blocking:
+            if self._task is not None:
+                QThreadPool.globalInstance().waitForDone()
+            updates = self._unsaved()
+            self._in_flight = {}
+            self._pending = {}
+            self._task = None
+            if updates:
+                try:
+                    self._written(_write_updates(self.path, updates))
+                except Exception as e:
+                    print(f"Error saving config: {e}")
+            return
+
+        if not self._pending:
+            return
+        if self._task is not None:
+            # One write at a time; pick these up when it has finished
+            self._timer.start()
+            return
+        self._in_flight, self._pending = self._pending, {}
+        self._task = _WriteTask(self.path, self._in_flight)
+        self._task.signals.finished.connect(self._on_task_finished)
+        QThreadPool.globalInstance().start(self._task)
+
+    def _on_task_finished(self, result):
+        if self._task is None:
+            # A blocking flush already took over these updates
+            return
+        self._task = None
+        if result is None:
+            # Keep the failed updates ahead of any newer ones; the next
+            # flush retries them
+            self._pending = self._unsaved()
+            self._in_flight = {}
+            return
+        self._in_flight = {}
+        self._written(result)
+
+    def _written(self, result):
+        config, mtime = result
+        # Updates made while the write was running still apply on top
+        for path, value in self._pending.items():
+            _set_path(config, path, value)
+        self._config = config
+        self._mtime = mtime
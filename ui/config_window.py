@@ -1,13 +1,157 @@
 """
 Configuration window for audio enhancement software
 """
-import json
-import os
+from types import MappingProxyType
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QComboBox, QCheckBox, QPushButton, QGroupBox,
                              QGridLayout, QMessageBox, QTabWidget, QWidget)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor
+from ui.config_store import ConfigStore
+from ui.config_panel import fill_device_combo
+
+# Values for settings missing from the config; never modified
+_DEFAULT_CONFIG = MappingProxyType({
+    "theme": "Light",
+    "unified_device_mode": False,
+    "unified_output_device": None,
+    "unified_input_device": None
+})
+
+# Entries of the theme selector, and their rows
+_THEMES = ("Light", "Dark", "System")
+_THEME_ROWS = {name: row for row, name in enumerate(_THEMES)}
+
+# Stylesheets per theme; anything else falls back to Light
+_THEME_QSS = {
+    "Dark": """
+            QWidget {
+                background-color: #2b2b2b;
+                color: #ffffff;
+            }
+            QGroupBox {
+                font-weight: bold;
+                border: 2px solid #555555;
+                border-radius: 5px;
+                margin-top: 1ex;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+            }
+            QPushButton {
+                background-color: #404040;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+            }
+            QPushButton:hover {
+                background-color: #505050;
+            }
+            QPushButton:pressed {
+                background-color: #353535;
+            }
+            QComboBox {
+                background-color: #404040;
+                border: 1px solid #555555;
+                padding: 3px;
+                border-radius: 3px;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                image: none;
+                border-left: 5px solid transparent;
+                border-right: 5px solid transparent;
+                border-top: 5px solid #ffffff;
+            }
+            QCheckBox::indicator {
+                width: 13px;
+                height: 13px;
+            }
+            QCheckBox::indicator:unchecked {
+                background-color: #404040;
+                border: 1px solid #555555;
+            }
+            QCheckBox::indicator:checked {
+                background-color: #0078d4;
+                border: 1px solid #0078d4;
+            }
+            QTabWidget::pane {
+                border: 1px solid #555555;
+            }
+            QTabBar::tab {
+                background-color: #404040;
+                border: 1px solid #555555;
+                padding: 5px 10px;
+                margin-right: 2px;
+            }
+            QTabBar::tab:selected {
+                background-color: #2b2b2b;
+                border-bottom: 1px solid #2b2b2b;
+            }
+            """,
+    "Light": """
+            QWidget {
+                background-color: #ffffff;
+                color: #000000;
+            }
+            QGroupBox {
+                font-weight: bold;
+                border: 2px solid #cccccc;
+                border-radius: 5px;
+                margin-top: 1ex;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+            }
+            QPushButton {
+                background-color: #f0f0f0;
+                border: 1px solid #cccccc;
+                padding: 5px;
+                border-radius: 3px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+            QPushButton:pressed {
+                background-color: #d0d0d0;
+            }
+            QComboBox {
+                background-color: #ffffff;
+                border: 1px solid #cccccc;
+                padding: 3px;
+                border-radius: 3px;
+            }
+            QTabWidget::pane {
+                border: 1px solid #cccccc;
+            }
+            QTabBar::tab {
+                background-color: #f0f0f0;
+                border: 1px solid #cccccc;
+                padding: 5px 10px;
+                margin-right: 2px;
+            }
+            QTabBar::tab:selected {
+                background-color: #ffffff;
+                border-bottom: 1px solid #ffffff;
+            }
+            """,
+}
+
+
+def _plain_label(text):
+    """QLabel showing text as-is, without rich-text detection"""
+    label = QLabel(text)
+    label.setTextFormat(Qt.PlainText)
+    return label
 
 class ConfigWindow(QDialog):
     """Configuration window for application settings"""
@@ -19,15 +163,29 @@ class ConfigWindow(QDialog):
     def __init__(self, routing_system, parent=None):
         super().__init__(parent)
         self.routing_system = routing_system
-        self.config_file = "config.json"
-        self.config = self.load_config()
+        self._config = None  # Read on first use, see `config`
+        self._settings_loaded = False
+        self.theme_combo = None  # Built with the Appearance tab, see _ensure_tab
         
         self.setWindowTitle("Audio Enhancement Configuration")
         self.setModal(True)
         self.resize(500, 400)
         
         self.init_ui()
-        self.load_settings()
+
+    @property
+    def config(self):
+        """Settings being edited; loaded on first access"""
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
+
+    def showEvent(self, event):
+        """Fill the controls from config once the dialog is being shown"""
+        super().showEvent(event)
+        if not self._settings_loaded:
+            self._settings_loaded = True
+            self.load_settings()
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -40,9 +198,13 @@ class ConfigWindow(QDialog):
         device_tab = self.create_device_tab()
         tab_widget.addTab(device_tab, "Device Settings")
         
-        # Theme Configuration Tab
-        theme_tab = self.create_theme_tab()
-        tab_widget.addTab(theme_tab, "Appearance")
+        # Theme Configuration Tab: an empty page until it is first shown
+        theme_page = QWidget()
+        page_layout = QVBoxLayout(theme_page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        tab_widget.addTab(theme_page, "Appearance")
+        self._tab_builders = {tab_widget.indexOf(theme_page): (theme_page, self.create_theme_tab)}
+        tab_widget.currentChanged.connect(self._ensure_tab)
         
         layout.addWidget(tab_widget)
         
@@ -66,6 +228,16 @@ class ConfigWindow(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
         
+    def _ensure_tab(self, index):
+        """Build a lazily created tab's contents the first time it is shown"""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        page, build = entry
+        page.layout().addWidget(build())
+        if self._settings_loaded:
+            self._load_theme_setting()
+
     def create_device_tab(self):
         """Create the device configuration tab"""
         widget = QWidget()
@@ -76,20 +248,25 @@ class ConfigWindow(QDialog):
         unified_layout = QGridLayout()
         
         # Output Device Selection
-        unified_layout.addWidget(QLabel("Output Device:"), 0, 0)
+        unified_layout.addWidget(_plain_label("Output Device:"), 0, 0)
         self.output_device_combo = QComboBox()
         self.populate_output_devices()
         unified_layout.addWidget(self.output_device_combo, 0, 1)
         
         # Input Device Selection
-        unified_layout.addWidget(QLabel("Input Device:"), 1, 0)
+        unified_layout.addWidget(_plain_label("Input Device:"), 1, 0)
         self.input_device_combo = QComboBox()
         self.populate_input_devices()
         unified_layout.addWidget(self.input_device_combo, 1, 1)
         
         # Refresh Devices Button
         refresh_btn = QPushButton("Refresh Devices")
-        refresh_btn.clicked.connect(self.refresh_devices)
+        refresh_btn.clicked.connect(self._schedule_refresh)
+        # Each rescan restarts PortAudio; rapid clicks coalesce into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self.refresh_devices)
         unified_layout.addWidget(refresh_btn, 2, 0, 1, 2)
         
         unified_group.setLayout(unified_layout)
@@ -108,13 +285,13 @@ class ConfigWindow(QDialog):
         theme_group = QGroupBox("Theme Settings")
         theme_layout = QGridLayout()
         
-        theme_layout.addWidget(QLabel("Theme:"), 0, 0)
+        theme_layout.addWidget(_plain_label("Theme:"), 0, 0)
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Light", "Dark", "System"])
+        self.theme_combo.addItems(_THEMES)
         theme_layout.addWidget(self.theme_combo, 0, 1)
         
         # Preview area
-        preview_label = QLabel("Theme Preview")
+        preview_label = _plain_label("Theme Preview")
         preview_label.setStyleSheet("padding: 20px; border: 1px solid gray; background-color: palette(base);")
         theme_layout.addWidget(preview_label, 1, 0, 1, 2)
         
@@ -125,103 +302,109 @@ class ConfigWindow(QDialog):
         widget.setLayout(layout)
         return widget
         
-    def populate_output_devices(self):
-        """Populate the output device combo box"""
-        self.output_device_combo.clear()
-        devices = self.routing_system.get_output_devices()
+    def populate_output_devices(self, devices=None):
+        """Populate the output device combo box (from `devices` if already fetched)"""
+        if devices is None:
+            devices = self.routing_system.get_output_devices()
         # devices is a list of dicts: {'index': int, 'name': str, 'type': 'output', ...}
-        for device in devices:
-            self.output_device_combo.addItem(device['name'], device['index'])
+        self._output_rows = fill_device_combo(self.output_device_combo, devices)
             
-    def populate_input_devices(self):
-        """Populate the input device combo box"""
-        self.input_device_combo.clear()
-        devices = self.routing_system.get_input_devices()
+    def populate_input_devices(self, devices=None):
+        """Populate the input device combo box (from `devices` if already fetched)"""
+        if devices is None:
+            devices = self.routing_system.get_input_devices()
         # devices is a list of dicts: {'index': int, 'name': str, 'type': 'input', ...}
-        for device in devices:
-            self.input_device_combo.addItem(device['name'], device['index'])
+        self._input_rows = fill_device_combo(self.input_device_combo, devices)
+
+    def _repopulate_all(self, outputs, inputs):
+        """Fill both device combos from lists enumerated together"""
+        self.populate_output_devices(outputs)
+        self.populate_input_devices(inputs)
             
+    def _schedule_refresh(self):
+        """Refresh the devices once clicks on the refresh button settle"""
+        self._refresh_timer.start()
+
     def refresh_devices(self):
         """Refresh the device lists"""
+        # One rescan serves both lists
         self.routing_system.refresh_devices()
-        self.populate_output_devices()
-        self.populate_input_devices()
+        self._repopulate_all(self.routing_system.get_output_devices(),
+                             self.routing_system.get_input_devices())
         
     def load_config(self):
-        """Load configuration from file"""
-        default_config = {
-            "theme": "Light",
-            "unified_device_mode": False,
-            "unified_output_device": None,
-            "unified_input_device": None
-        }
-        
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    default_config.update(config)
-                    return default_config
-            except Exception as e:
-                print(f"Error loading config: {e}")
-                
-        return default_config
+        """Load configuration (defaults overlaid with the shared config store)"""
+        return {**_DEFAULT_CONFIG, **ConfigStore.instance().get()}
         
     def save_config(self):
-        """Save configuration to file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to save configuration: {e}")
+        """Save the settings this dialog edits"""
+        # The store merges these keys into the file and replaces it
+        # atomically, so a failed write never leaves a truncated config
+        store = ConfigStore.instance()
+        for key in ("theme", "unified_device_mode",
+                    "unified_output_device", "unified_input_device"):
+            store.update((key,), self.config[key])
             
     def load_settings(self):
         """Load settings into the UI"""
-        # Theme settings
-        theme_index = self.theme_combo.findText(self.config.get("theme", "Light"))
-        if theme_index >= 0:
-            self.theme_combo.setCurrentIndex(theme_index)
+        self._load_theme_setting()
             
         # Device settings (always unified mode)
         
         # Set device selections if they exist
         output_device = self.config.get("unified_output_device")
         if output_device is not None:
-            output_index = self.output_device_combo.findData(output_device)
+            output_index = self._output_rows.get(output_device, -1)
             if output_index >= 0:
                 self.output_device_combo.setCurrentIndex(output_index)
                 
         input_device = self.config.get("unified_input_device")
         if input_device is not None:
-            input_index = self.input_device_combo.findData(input_device)
+            input_index = self._input_rows.get(input_device, -1)
             if input_index >= 0:
                 self.input_device_combo.setCurrentIndex(input_index)
                 
+    def _load_theme_setting(self):
+        """Select the configured theme, if the Appearance tab has been built"""
+        if self.theme_combo is None:
+            return
+        theme_index = _THEME_ROWS.get(self.config.get("theme", "Light"), -1)
+        if theme_index >= 0:
+            self.theme_combo.setCurrentIndex(theme_index)
+
     def apply_settings(self):
-        """Apply the current settings"""
+        """Apply the current settings (only what changed since the last apply)"""
+        old = dict(self.config)
+
         # Update config
-        self.config["theme"] = self.theme_combo.currentText()
+        # An Appearance tab never opened cannot have changed the theme
+        if self.theme_combo is not None:
+            self.config["theme"] = self.theme_combo.currentText()
         self.config["unified_device_mode"] = True  # Always use unified mode
         
         # Always save device selections
         self.config["unified_output_device"] = self.output_device_combo.currentData()
         self.config["unified_input_device"] = self.input_device_combo.currentData()
-            
-        # Apply to routing system
-        self.routing_system.set_unified_device_mode(
-            self.config["unified_device_mode"],
-            self.config["unified_output_device"],
-            self.config["unified_input_device"]
-        )
-        
-        # Emit signals
-        self.theme_changed.emit(self.config["theme"])
-        self.unified_device_changed.emit(
-            self.config["unified_device_mode"],
-            self.config["unified_output_device"],
-            self.config["unified_input_device"]
-        )
+        if self.config == old:
+            return
+
+        device_keys = ("unified_device_mode", "unified_output_device", "unified_input_device")
+        if any(self.config[key] != old.get(key) for key in device_keys):
+            # Apply to routing system
+            self.routing_system.set_unified_device_mode(
+                self.config["unified_device_mode"],
+                self.config["unified_output_device"],
+                self.config["unified_input_device"]
+            )
+            self.unified_device_changed.emit(
+                self.config["unified_device_mode"],
+                self.config["unified_output_device"],
+                self.config["unified_input_device"]
+            )
+
+        # Re-applying a stylesheet repolishes every widget; skip if unchanged
+        if self.config["theme"] != old.get("theme"):
+            self.theme_changed.emit(self.config["theme"])
         
         # Save config
         self.save_config()
@@ -233,124 +416,4 @@ class ConfigWindow(QDialog):
         
     def get_theme_stylesheet(self, theme_name):
         """Get stylesheet for the specified theme"""
-        if theme_name == "Dark":
-            return """
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            QComboBox {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 3px;
-                border-radius: 3px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-            }
-            QCheckBox::indicator {
-                width: 13px;
-                height: 13px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #404040;
-                border: 1px solid #555555;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border: 1px solid #0078d4;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 5px 10px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #2b2b2b;
-            }
-            """
-        else:  # Light theme
-            return """
-            QWidget {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 1px solid #cccccc;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                border: 1px solid #cccccc;
-                padding: 3px;
-                border-radius: 3px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                border: 1px solid #cccccc;
-                padding: 5px 10px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom: 1px solid #ffffff;
-            }
-            """
\ No newline at end of file
+        return _THEME_QSS.get(theme_name, _THEME_QSS["Light"])
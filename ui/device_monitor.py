@@ -0,0 +1,56 @@
+"""
+Qt bridge for audio device hotplug notifications
+"""
+import os
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+# ALSA device nodes; they appear and disappear with USB/Bluetooth devices
+_ALSA_DEV_DIR = '/dev/snd'
+
+
+class DeviceMonitor(QObject):
+    """
+    Emits devices_changed on the GUI thread when audio devices come or go.
+
+    On Windows the device manager receives IMMNotificationClient callbacks
+    on its monitor thread; they are forwarded through a queued signal. On
+    Linux /dev/snd is watched instead and the device manager's polling
+    fallback is not started, so an idle application does not wake up to
+    enumerate devices. Elsewhere the device count is polled every 2 s.
+    """
+    devices_changed = pyqtSignal()
+    # Emitted from the monitor thread, delivered queued to this object
+    _device_event = pyqtSignal()
+
+    def __init__(self, routing_system, parent=None):
+        super().__init__(parent)
+        self.routing_system = routing_system
+        self._device_event.connect(self.devices_changed)
+        self._watcher = None
+        if os.path.isdir(_ALSA_DEV_DIR):
+            self._watcher = QFileSystemWatcher([_ALSA_DEV_DIR], self)
+            self._watcher.directoryChanged.connect(self._on_dev_dir_changed)
+        # One plug creates several device nodes; rescan once they settle
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(250)
+        self._rescan_timer.timeout.connect(self._rescan)
+        routing_system.add_device_change_listener(self._device_event.emit)
+        # The watcher covers hotplug; the polling thread would only add wakeups
+        routing_system.start_device_monitoring(poll=self._watcher is None)
+
+    def _on_dev_dir_changed(self, _path):
+        self._rescan_timer.start()
+
+    def _rescan(self):
+        # PortAudio only sees new nodes after it is re-initialized
+        self.routing_system.refresh_devices()
+        self.devices_changed.emit()
+
+    def stop(self):
+        """Stop watching for device changes"""
+        self._rescan_timer.stop()
+        self.routing_system.remove_device_change_listener(self._device_event.emit)
+        self.routing_system.stop_device_monitoring()
+        if self._watcher is not None:
+            self._watcher.removePath(_ALSA_DEV_DIR)
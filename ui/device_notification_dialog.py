@@ -1,3 +1,5 @@
+from html import escape
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QFrame)
 from PyQt5.QtCore import Qt
@@ -5,6 +7,53 @@ from PyQt5.QtGui import QFont, QIcon
 
 
 class DeviceNotificationDialog(QDialog):
+    _DEVICE_TYPE_TEXT = {
+        "input": "Input Device (Microphone)",
+        "output": "Output Device (Speaker/Headphones)",
+    }
+    _NEW_LABEL_TMPL = "<b>New {type}:</b><br>{name}"
+    _CURRENT_LABEL_TMPL = "<b>Currently Using:</b><br>{name}"
+    _QUESTION_TEXT = "Would you like to switch to the new device?"
+
+    # Button styles, set once on the dialog and matched by object name
+    _BUTTON_QSS = """
+        QPushButton#switchBtn, QPushButton#keepBtn {
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton#switchBtn {
+            background-color: #4CAF50;
+        }
+        QPushButton#switchBtn:hover {
+            background-color: #45a049;
+        }
+        QPushButton#keepBtn {
+            background-color: #f44336;
+        }
+        QPushButton#keepBtn:hover {
+            background-color: #da190b;
+        }
+    """
+
+    # Fonts shared by every dialog; QFont needs a running application, so
+    # they are made on first use rather than at import
+    _fonts = None
+
+    @classmethod
+    def _get_fonts(cls):
+        """Return the shared (title, bold) fonts"""
+        if cls._fonts is None:
+            title_font = QFont()
+            title_font.setBold(True)
+            title_font.setPointSize(12)
+            bold_font = QFont()
+            bold_font.setBold(True)
+            cls._fonts = (title_font, bold_font)
+        return cls._fonts
+
     def __init__(self, device_name, device_type, current_device, parent=None):
         super().__init__(parent)
         self.device_name = device_name
@@ -22,12 +71,11 @@ class DeviceNotificationDialog(QDialog):
         
         layout = QVBoxLayout()
         layout.setSpacing(15)
+        title_font, bold_font = self._get_fonts()
         
         # Title
         title_label = QLabel("🔊 New Audio Device Connected")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(12)
+        title_label.setTextFormat(Qt.PlainText)
         title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
@@ -41,17 +89,25 @@ class DeviceNotificationDialog(QDialog):
         # Device info
         info_layout = QVBoxLayout()
         
-        device_type_text = "Input Device (Microphone)" if self.device_type == "input" else "Output Device (Speaker/Headphones)"
+        device_type_text = self._DEVICE_TYPE_TEXT.get(self.device_type, self._DEVICE_TYPE_TEXT["output"])
         
-        new_device_label = QLabel(f"<b>New {device_type_text}:</b><br>{self.device_name}")
+        # Device names are shown literally, not interpreted as markup
+        new_device_label = QLabel(self._NEW_LABEL_TMPL.format(
+            type=device_type_text, name=escape(str(self.device_name))))
+        new_device_label.setTextFormat(Qt.RichText)
         new_device_label.setWordWrap(True)
         info_layout.addWidget(new_device_label)
         
-        current_device_label = QLabel(f"<b>Currently Using:</b><br>{self.current_device}")
+        current_device_label = QLabel(self._CURRENT_LABEL_TMPL.format(
+            name=escape(str(self.current_device))))
+        current_device_label.setTextFormat(Qt.RichText)
         current_device_label.setWordWrap(True)
         info_layout.addWidget(current_device_label)
         
-        question_label = QLabel("<b>Would you like to switch to the new device?</b>")
+        # Entirely bold, so a bold font does the job without HTML parsing
+        question_label = QLabel(self._QUESTION_TEXT)
+        question_label.setTextFormat(Qt.PlainText)
+        question_label.setFont(bold_font)
         question_label.setAlignment(Qt.AlignCenter)
         info_layout.addWidget(question_label)
         
@@ -61,35 +117,11 @@ class DeviceNotificationDialog(QDialog):
         button_layout = QHBoxLayout()
         
         switch_button = QPushButton("Switch to New Device")
-        switch_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        switch_button.setObjectName("switchBtn")
         switch_button.clicked.connect(self.switch_device)
         
         keep_button = QPushButton("Keep Current Device")
-        keep_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
+        keep_button.setObjectName("keepBtn")
         keep_button.clicked.connect(self.keep_current)
         
         button_layout.addWidget(switch_button)
@@ -97,6 +129,7 @@ class DeviceNotificationDialog(QDialog):
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
+        self.setStyleSheet(self._BUTTON_QSS)
         
     def switch_device(self):
         self.user_choice = "switch"
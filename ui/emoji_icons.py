@@ -0,0 +1,31 @@
+"""
+Emoji glyphs rendered as icons, shared across the UI
+"""
+from functools import lru_cache
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QIcon, QPainter, QPixmap, QTransform
+
+
+@lru_cache(maxsize=64)
+def emoji_icon(emoji, flipped=False):
+    """
+    Return emoji rendered as a 48x48 icon, mirrored horizontally if flipped.
+
+    Each (emoji, flipped) pair is painted once per process; later calls
+    return the same QIcon. Needs a QApplication, so nothing is rendered
+    at import time.
+    """
+    pix = QPixmap(48, 48)
+    pix.fill(Qt.transparent)
+    painter = QPainter(pix)
+    font = QFont()
+    font.setPointSize(28)
+    painter.setFont(font)
+    painter.drawText(pix.rect(), Qt.AlignCenter, emoji)
+    painter.end()
+    if flipped:
+        t = QTransform()
+        t.scale(-1, 1)
+        pix = pix.transformed(t)
+    return QIcon(pix)
@@ -1,38 +1,100 @@
 """
 Equalizer widget for audio enhancement with real-time frequency response visualization
 """
+from functools import lru_cache
+
 import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QSlider, QGroupBox, QPushButton, QComboBox,
-                            QCheckBox, QGridLayout, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPainter, QPen, QColor
+                            QCheckBox, QGridLayout, QFrame, QStyle, QStyleOption)
+from PyQt5.QtCore import Qt, QEvent, QPoint, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygon, QImage, QPixmap
+
+# Slider ranges moved by the Bass/Voice/Treble quick controls
+_QUICK_BANDS = {
+    "bass": slice(0, 3),    # Low frequencies
+    "voice": slice(3, 7),   # Mid frequencies
+    "treble": slice(7, 10), # High frequencies
+}
+
+@lru_cache(maxsize=16)
+def _band_frequencies(bands):
+    """Logarithmically spaced band centres from 20 Hz to 20 kHz (read-only, shared)"""
+    freqs = np.logspace(np.log10(20), np.log10(20000), bands)
+    freqs.setflags(write=False)
+    return freqs
 
 class FrequencyResponseView(QFrame):
     """Widget for displaying the frequency response curve"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Box | QFrame.Plain)
-        self.gains = [0] * 10
+        # paintEvent covers every pixel, so Qt need not erase the
+        # background (or paint the parent's) before each repaint
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.gains = np.zeros(10, dtype=np.float32)
         self.frequencies = []
+        self._curve = None  # QPolygon of the curve; rebuilt after gain or size changes
+        self._backdrop = None  # QPixmap of background and grid; redrawn after resizes
+        self._xs = None  # Band x positions; recomputed on resize or band count change
+        self._update_geometry()
         
     def update_response(self, gains, frequencies=None):
-        """Update the frequency response curve"""
-        self.gains = gains
+        """Update the frequency response curve (repaints only if it changed)"""
         if frequencies:
             self.frequencies = frequencies
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the frequency response curve"""
-        super().paintEvent(event)
-        if not self.gains:
+        # The curve only depends on the gains; a resize repaints by itself
+        if np.array_equal(gains, self.gains):
             return
-            
-        painter = QPainter(self)
+        # A copy, so later in-place edits by the caller are not mistaken
+        # for the curve already shown
+        gains = np.array(gains, dtype=np.float32)
+        if len(gains) != len(self.gains):
+            self._xs = None
+        self.gains = gains
+        self._curve = None
+        self.update()
+
+    def resizeEvent(self, event):
+        """Recompute the size-dependent drawing geometry"""
+        self._update_geometry()
+        super().resizeEvent(event)
+
+    def _update_geometry(self):
+        """Cache the curve's scale for the current size and drop size-dependent caches"""
+        self._plot_width = self.width() - 1
+        height = self.height() - 1
+        self._mid_height = height / 2
+        self._scale = height / 24  # Scale for ±12 dB range
+        self._xs = None
+        self._curve = None
+        self._backdrop = None
+
+    def changeEvent(self, event):
+        """Redraw the cached backdrop when the palette or style changes"""
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._backdrop = None
+        super().changeEvent(event)
+
+    def _build_backdrop(self):
+        """Render background, frame and dashed grid once for the current size"""
+        ratio = self.devicePixelRatioF()
+        # ARGB32 premultiplied is the format Qt's raster engine draws fastest
+        image = QImage(int(self.width() * ratio), int(self.height() * ratio),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        # Background: palette colour, then any stylesheet background on top
+        painter.fillRect(self.rect(), self.palette().window())
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw frame
+        painter.setPen(self.palette().windowText().color())
         painter.drawRect(0, 0, self.width() - 1, self.height() - 1)
         
         # Draw grid
@@ -51,35 +113,76 @@ class FrequencyResponseView(QFrame):
         for i in range(1, v_steps):
             x = int(self.width() * i / v_steps)
             painter.drawLine(x, 0, x, self.height())
+        painter.end()
+        return QPixmap.fromImage(image)
+
+    def _build_curve(self):
+        """Map the gains to widget coordinates as one polygon"""
+        if self._xs is None:
+            n = len(self.gains)
+            self._xs = (np.arange(n) * self._plot_width // max(n - 1, 1)).tolist()
+        ys = (self._mid_height - self.gains * self._scale).astype(np.int32).tolist()
+        return QPolygon([QPoint(x, y) for x, y in zip(self._xs, ys)])
+        
+    def paintEvent(self, event):
+        """Draw the frequency response curve"""
+        # The static parts are one blit; dashed lines are slow to rasterize
+        if self._backdrop is None:
+            self._backdrop = self._build_backdrop()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._backdrop)
+        painter.end()
+        super().paintEvent(event)
+        if not len(self.gains):
+            return
+            
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
             
         # Draw frequency response curve
         pen = QPen(QColor(0, 120, 255))
         pen.setWidth(2)
         painter.setPen(pen)
         
-        # Calculate points
-        points = []
-        width = self.width() - 1
-        height = self.height() - 1
-        mid_height = height / 2
-        scale = height / 24  # Scale for ±12 dB range
-        
-        for i, gain in enumerate(self.gains):
-            x = int(width * i / (len(self.gains) - 1))
-            y = int(mid_height - (gain * scale))
-            points.append((x, y))
-            
-        # Draw curve
-        for i in range(len(points) - 1):
-            x1, y1 = points[i]
-            x2, y2 = points[i + 1]
-            painter.drawLine(x1, y1, x2, y2)
+        # Draw curve: all segments in one call
+        if self._curve is None:
+            self._curve = self._build_curve()
+        painter.drawPolyline(self._curve)
 
 class EqualizerWidget(QWidget):
     """Widget for controlling the equalizer with frequency response visualization"""
     
     # Signal emitted when equalizer settings change 
     settings_changed = pyqtSignal()
+
+    # Presets with reasonable gain values (-12 to +12 dB range), one row per
+    # name. Shared by all widgets and read-only; float32 so a row can be
+    # handed to the DSP as-is
+    _PRESET_NAMES = (
+        "Flat", "Bass Boost", "Bass Cut", "Treble Boost", "Treble Cut",
+        "Voice Enhance", "Voice Cut", "Rock", "Pop", "Classical", "Jazz",
+        "Electronic", "Sub Bass", "Acoustic", "Vocal Clarity",
+    )
+    _PRESET_GAINS = np.array([
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [12, 9, 6, 3, 0, 0, 0, 0, 0, 0],
+        [-12, -9, -6, -3, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 3, 6, 9, 12],
+        [0, 0, 0, 0, 0, 0, -3, -6, -9, -12],
+        [-6, -3, 0, 6, 9, 9, 6, 0, -3, -6],
+        [6, 3, 0, -6, -9, -9, -6, 0, 3, 6],
+        [6, 4, 2, 0, -2, -2, 0, 2, 4, 6],
+        [-3, 0, 3, 6, 3, -3, -3, 0, 3, 6],
+        [4, 4, 0, 0, 0, 0, -2, -2, -2, -4],
+        [2, 4, 3, 2, -1, -2, 0, 1, 2, 3],
+        [4, 6, 3, 0, -2, 0, 2, 4, 6, 6],
+        [15, 9, 3, 0, 0, 0, 0, 0, 0, 0],
+        [3, 2, 0, 0, 0, 2, 4, 5, 5, 3],
+        [-3, -2, 0, 4, 6, 6, 4, 2, -2, -3],
+    ], dtype=np.float32)
+    _PRESET_GAINS.setflags(write=False)
+    _PRESET_ROWS = {name: row for row, name in enumerate(_PRESET_NAMES)}
+    _SORTED_PRESET_NAMES = tuple(sorted(_PRESET_NAMES))  # Preset combo order
     
     def __init__(self, equalizer_processor=None):
         super().__init__()
@@ -91,32 +194,23 @@ class EqualizerWidget(QWidget):
         
         # Define logarithmically spaced frequency bands
         self.frequencies = self._calculate_frequencies()
+        # Tooltip prefix per band, formatted once rather than per slider step
+        self._freq_texts = [f"{freq}Hz" if freq < 1000 else f"{freq/1000:.1f}kHz"
+                            for freq in self.frequencies]
+        # Slider gains in the float32 layout native_dsp takes without conversion
+        self._gains_buf = np.zeros(len(self.frequencies), dtype=np.float32)
         self.frequency_labels = []  # Added missing attribute
         self.band_labels = []
         self.band_sliders = []
         self.freq_response_curve = None
         self.freq_sliders = []  # Added missing attribute
         self.gain_labels = []   # Added missing attribute
-        
-        # Define presets with reasonable gain values (-12 to +12 dB range)
-        # Enhanced presets with additional controls
-        self.presets = {
-            "Flat": [0] * 10,
-            "Bass Boost": [12, 9, 6, 3, 0, 0, 0, 0, 0, 0],
-            "Bass Cut": [-12, -9, -6, -3, 0, 0, 0, 0, 0, 0],
-            "Treble Boost": [0, 0, 0, 0, 0, 0, 3, 6, 9, 12],
-            "Treble Cut": [0, 0, 0, 0, 0, 0, -3, -6, -9, -12],
-            "Voice Enhance": [-6, -3, 0, 6, 9, 9, 6, 0, -3, -6],
-            "Voice Cut": [6, 3, 0, -6, -9, -9, -6, 0, 3, 6],
-            "Rock": [6, 4, 2, 0, -2, -2, 0, 2, 4, 6],
-            "Pop": [-3, 0, 3, 6, 3, -3, -3, 0, 3, 6],
-            "Classical": [4, 4, 0, 0, 0, 0, -2, -2, -2, -4],
-            "Jazz": [2, 4, 3, 2, -1, -2, 0, 1, 2, 3],
-            "Electronic": [4, 6, 3, 0, -2, 0, 2, 4, 6, 6],
-            "Sub Bass": [15, 9, 3, 0, 0, 0, 0, 0, 0, 0],
-            "Acoustic": [3, 2, 0, 0, 0, 2, 4, 5, 5, 3],
-            "Vocal Clarity": [-3, -2, 0, 4, 6, 6, 4, 2, -2, -3]
-        }
+
+        # Slider drags emit a value per step; apply them at most every 16ms
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._update_equalizer)
         
         # Initialize the Rust-based equalizer
         self.eq_processor = None
@@ -170,7 +264,7 @@ class EqualizerWidget(QWidget):
         preset_layout = QHBoxLayout()
         preset_layout.addWidget(QLabel("Preset:"))
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems(sorted(self.presets.keys()))
+        self.preset_combo.addItems(self._SORTED_PRESET_NAMES)
         self.preset_combo.currentTextChanged.connect(self.on_preset_changed)
         self.preset_combo.setMinimumWidth(120)
         preset_layout.addWidget(self.preset_combo)
@@ -302,22 +396,30 @@ class EqualizerWidget(QWidget):
     def on_enable_toggled(self, enabled):
         """Handle enable/disable checkbox toggle"""
         if self.equalizer:
-            self.equalizer.set_enabled(enabled)
+            if enabled:
+                self.equalizer.enable()
+            else:
+                self.equalizer.disable()
+        
+        # Enable/disable the band controls with it
+        for slider in self.freq_sliders:
+            slider.setEnabled(enabled)
+        self.preset_combo.setEnabled(enabled)
         self.settings_changed.emit()
             
     def on_preset_changed(self, preset):
         """Handle preset selection"""
-        gains = self.presets.get(preset, [0] * 10)
-        for i, (slider, gain, label) in enumerate(zip(self.freq_sliders, gains, self.gain_labels)):
-            slider.setValue(gain)
-            label.setText(f"{gain:+d} dB")
+        # Unknown presets fall back to Flat; rows are views, not copies
+        gains = self._PRESET_GAINS[self._PRESET_ROWS.get(preset, 0)]
+        # Move the sliders silently; the preset is applied, drawn and
+        # announced once below instead of once per slider
+        self._set_sliders_silently(gains.tolist())
             
         if self.equalizer:
-            # Update each band individually
-            for i, gain in enumerate(gains):
-                self.equalizer.set_gain(i, gain)
-        elif hasattr(self, 'eq_processor') and self.eq_processor is not None:
-            self.eq_processor.set_gains([float(g) for g in gains])
+            self.equalizer.set_gains(gains)
+        elif self.eq_processor is not None:
+            # Preset rows are float32 already; native_dsp borrows them as-is
+            self.eq_processor.set_gains(gains)
             
         # Update visualization
         if self.response_view:
@@ -332,37 +434,30 @@ class EqualizerWidget(QWidget):
             slider_idx (int): Index of the slider that changed
             value (int): New value of the slider
         """
-        # Update gain label
-        gain_text = f"{value:+d} dB"
-        self.gain_labels[slider_idx].setText(gain_text)
-        
-        # Update tooltip
-        freq = self.frequencies[slider_idx]
-        freq_text = f"{freq}Hz" if freq < 1000 else f"{freq/1000:.1f}kHz"
-        self.freq_sliders[slider_idx].setToolTip(f"{freq_text}: {gain_text}")
+        self._show_gain(slider_idx, value)
         
-        # Update gains and process
-        self._update_equalizer()
+        # Update gains and process (coalesced, see _update_timer)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
         
+    def _show_gain(self, slider_idx, value):
+        """Update a band's gain label and slider tooltip"""
+        gain_text = f"{value:+d} dB"
+        self.gain_labels[slider_idx].setText(gain_text)
+        self.freq_sliders[slider_idx].setToolTip(f"{self._freq_texts[slider_idx]}: {gain_text}")
+
     def _update_equalizer(self):
         """Update equalizer with current gain values"""
-        gains = [slider.value() for slider in self.freq_sliders]
+        # Filled in place; receivers copy what they keep
+        gains = self._gains_buf
+        for i, slider in enumerate(self.freq_sliders):
+            gains[i] = slider.value()
         
         # Update the equalizer
         if self.eq_processor is not None:
-            self.eq_processor.set_gains([float(g) for g in gains])
+            self.eq_processor.set_gains(gains)
         elif self.equalizer:
-            # Update each band individually if using the Python equalizer
-            for i, gain in enumerate(gains):
-                self.equalizer.set_gain(i, gain)
-            
-        # Update frequency response visualization
-        if self.response_view:
-            self.response_view.update_response(gains)
-            
-        self.settings_changed.emit()
-        if self.eq_processor is not None:
-            self.eq_processor.set_gains([float(g) for g in gains])
+            self.equalizer.set_gains(gains)
             
         # Update frequency response visualization
         if self.response_view:
@@ -379,9 +474,7 @@ class EqualizerWidget(QWidget):
         if hasattr(self, 'eq_processor') and self.eq_processor is not None:
             self.eq_processor.reset()
         elif self.equalizer:
-            # Reset each band individually
-            for i in range(len(self.freq_sliders)):
-                self.equalizer.set_gain(i, 0)
+            self._set_equalizer_gains(np.zeros(len(self.freq_sliders), dtype=np.float32))
         self.settings_changed.emit()
         
     def quick_adjust(self, band_type, amount):
@@ -391,21 +484,19 @@ class EqualizerWidget(QWidget):
             band_type (str): 'bass', 'voice', or 'treble'
             amount (int): Amount to adjust by (-3 or +3 typically)
         """
-        if band_type == "bass":
-            # Adjust the first 3 bands (low frequencies)
-            for i in range(3):
-                current = self.freq_sliders[i].value()
-                self.freq_sliders[i].setValue(max(-12, min(12, current + amount)))
-        elif band_type == "voice":
-            # Adjust the middle 4 bands (mid frequencies)
-            for i in range(3, 7):
-                current = self.freq_sliders[i].value()
-                self.freq_sliders[i].setValue(max(-12, min(12, current + amount)))
-        elif band_type == "treble":
-            # Adjust the last 3 bands (high frequencies)
-            for i in range(7, 10):
-                current = self.freq_sliders[i].value()
-                self.freq_sliders[i].setValue(max(-12, min(12, current + amount)))
+        bands = _QUICK_BANDS.get(band_type)
+        if bands is None:
+            return
+        values = np.fromiter((slider.value() for slider in self.freq_sliders), dtype=np.int32)
+        values[bands] = np.clip(values[bands] + amount, -12, 12)
+        # Move the sliders silently, then apply all of them in one update
+        for i in range(*bands.indices(len(self.freq_sliders))):
+            slider = self.freq_sliders[i]
+            slider.blockSignals(True)
+            slider.setValue(int(values[i]))
+            slider.blockSignals(False)
+            self._show_gain(i, int(values[i]))
+        self._update_equalizer()
         
     def clear_layout(self, layout):
         """Recursively clear a QLayout of all child widgets and layouts"""
@@ -435,31 +526,6 @@ class EqualizerWidget(QWidget):
                 self.band_sliders[i].setValue(int(gain * 10))  # Convert to slider scale
                 self.band_labels[i].setText(f"{gain:.1f} dB")
     
-    def on_enable_toggled(self, enabled):
-        """Handle equalizer enable/disable"""
-        if self.equalizer:
-            if enabled:
-                self.equalizer.enable()
-            else:
-                self.equalizer.disable()
-        
-        # Enable/disable all controls
-        for slider in self.band_sliders:
-            slider.setEnabled(enabled)
-        self.preset_combo.setEnabled(enabled)
-        # Bands selection is managed in Settings panel
-        
-        self.settings_changed.emit()
-    
-    def on_preset_changed(self, preset_name):
-        """Handle preset selection"""
-        if preset_name in self.presets:
-            gains = self.presets[preset_name]
-            for i, gain in enumerate(gains):
-                if i < len(self.band_sliders):
-                    self.band_sliders[i].setValue(int(gain * 10))
-                    self.on_band_changed(i, int(gain * 10))
-    
     def on_bands_selector_changed(self, bands_str):
         """Handle changes to the number of bands."""
         bands = int(bands_str)
@@ -470,33 +536,42 @@ class EqualizerWidget(QWidget):
 
     def rebuild_bands_ui(self, bands):
         """Rebuild the UI sliders for the specified number of bands."""
-        # Clear existing sliders and labels
-        for slider in self.band_sliders:
-            slider.deleteLater()
-        for label in self.band_labels:
-            label.deleteLater()
-        for freq_label in self.frequency_labels:
-            freq_label.deleteLater()
-        self.band_sliders.clear()
-        self.band_labels.clear()
-        self.frequency_labels.clear()
+        # The band grid already shows this many bands; loading saved
+        # settings asks for the same count every time
+        if bands == len(self.freq_sliders):
+            return
 
-        # Create new sliders and labels
-        for i in range(bands):
-            freq_label = QLabel(f"Band {i + 1}")
-            self.frequency_labels.append(freq_label)
-            self.eq_group.layout().addWidget(freq_label)
+        # Swap the controls with painting off, so the widget is laid out
+        # and repainted once at the end instead of once per added control
+        self.setUpdatesEnabled(False)
+        try:
+            # Clear existing sliders and labels
+            for widget in (*self.band_sliders, *self.band_labels, *self.frequency_labels):
+                widget.deleteLater()
+            self.band_sliders.clear()
+            self.band_labels.clear()
+            self.frequency_labels.clear()
 
-            slider = QSlider(Qt.Vertical)
-            slider.setRange(-120, 120)
-            slider.setValue(0)
-            slider.valueChanged.connect(self.on_band_gain_changed)
-            self.band_sliders.append(slider)
-            self.eq_group.layout().addWidget(slider)
+            # Create new sliders and labels
+            layout = self.eq_group.layout()
+            for i in range(bands):
+                freq_label = QLabel(f"Band {i + 1}")
+                self.frequency_labels.append(freq_label)
+                layout.addWidget(freq_label)
 
-            gain_label = QLabel("0.0 dB")
-            self.band_labels.append(gain_label)
-            self.eq_group.layout().addWidget(gain_label)
+                slider = QSlider(Qt.Vertical)
+                slider.setRange(-120, 120)
+                slider.setValue(0)
+                # Connected after the initial value, so it does not fire
+                slider.valueChanged.connect(self.on_band_gain_changed)
+                self.band_sliders.append(slider)
+                layout.addWidget(slider)
+
+                gain_label = QLabel("0.0 dB")
+                self.band_labels.append(gain_label)
+                layout.addWidget(gain_label)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def create_band_controls(self):
         """Create sliders and labels for each frequency band."""
@@ -513,7 +588,7 @@ class EqualizerWidget(QWidget):
         self.frequency_labels.clear()
 
         # Define frequency ranges for the bands
-        frequencies = np.logspace(np.log10(20), np.log10(20000), self.current_bands, dtype=int)
+        frequencies = _band_frequencies(self.current_bands).astype(int)
 
         for i, freq in enumerate(frequencies):
             # Create a vertical layout for each band
@@ -556,12 +631,6 @@ class EqualizerWidget(QWidget):
             self.band_labels[i].setText(f"{gain:.1f} dB")
         self.settings_changed.emit()
     
-    def reset_equalizer(self):
-        """Reset all bands to 0 dB"""
-        for slider in self.band_sliders:
-            slider.setValue(0)
-        self.preset_combo.setCurrentText("Flat")
-    
     def get_settings(self):
         """Get current equalizer settings"""
         settings = {
@@ -571,8 +640,8 @@ class EqualizerWidget(QWidget):
             'gains': []
         }
         
-        for slider in self.band_sliders:
-            settings['gains'].append(slider.value() / 10.0)
+        for slider in self.freq_sliders:
+            settings['gains'].append(float(slider.value()))
         
         return settings
     
@@ -588,10 +657,34 @@ class EqualizerWidget(QWidget):
             self.rebuild_bands_ui(settings['bands'])
         
         if 'gains' in settings:
-            for i, gain in enumerate(settings['gains']):
-                if i < len(self.band_sliders):
-                    self.band_sliders[i].setValue(int(gain * 10))
-                    self.on_band_changed(i, int(gain * 10))
+            self._load_gains(settings['gains'])
+            self.settings_changed.emit()
+
+    def _load_gains(self, gains):
+        """Show gains (dB) on the band sliders and apply them in one call"""
+        gains = gains[:len(self.freq_sliders)]
+        # The caller announces the change once, not once per slider
+        self._set_sliders_silently(gains)
+        self._set_equalizer_gains(gains)
+        if self.response_view:
+            self.response_view.update_response([slider.value() for slider in self.freq_sliders])
+
+    def _set_sliders_silently(self, gains):
+        """Move the band sliders to gains (dB) without emitting valueChanged"""
+        for i, (slider, gain) in enumerate(zip(self.freq_sliders, gains)):
+            slider.blockSignals(True)
+            slider.setValue(int(round(gain)))
+            slider.blockSignals(False)
+            self._show_gain(i, slider.value())
+
+    def _set_equalizer_gains(self, gains):
+        """Hand all band gains (dB) to the equalizer at once, not band by band"""
+        if not self.equalizer or not len(gains):
+            return
+        try:
+            self.equalizer.set_gains(np.asarray(gains, dtype=np.float32)[:self.equalizer.bands])
+        except Exception:
+            pass
     
     def on_band_changed(self, band_index, value):
         """Update processor gain and UI when a band slider changes."""
@@ -645,7 +738,7 @@ class EqualizerWidget(QWidget):
         if self.equalizer and hasattr(self.equalizer, 'frequencies'):
             freqs = self.equalizer.frequencies
         else:
-            freqs = np.logspace(np.log10(20), np.log10(20000), getattr(self, 'current_bands', 10))
+            freqs = _band_frequencies(getattr(self, 'current_bands', 10))
         # compute delta in slider units (+/-)
         delta = int(db_change * 10)
         for i, f in enumerate(freqs[:len(self.band_sliders)]):
@@ -8,7 +8,8 @@ from ui.audio_type_widget import AudioTypeWidget
 from ui.mixer_widget import MixerWidget
 from ui.config_panel import ConfigPanel
 from ui.theme_manager import ThemeManager
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QFont
+from PyQt5.QtGui import QIcon
+from ui.emoji_icons import emoji_icon
 
 class MainWindow(QMainWindow):
     """Main application window with tabs for different audio types"""
@@ -19,8 +20,10 @@ class MainWindow(QMainWindow):
         self.routing_system = routing_system
         self.processors = {}
         
-        # Initialize theme manager
+        # Initialize theme manager; it styles this window and the tray menu
+        # rather than the whole application
         self.theme_manager = ThemeManager()
+        self.theme_manager.register_widget(self)
         
         # Set up UI
         self.setWindowTitle("Audio Enhancement Software")
@@ -47,23 +50,9 @@ class MainWindow(QMainWindow):
         self.tab_widget.setIconSize(QSize(24, 24))
         self.main_layout.addWidget(self.tab_widget)
         
-        # Helper to create emoji icons, flipped when tabs are on the left
+        # Emoji icons, flipped when tabs are on the left so they face inward
         def make_emoji_icon(emoji: str) -> QIcon:
-            pix = QPixmap(48, 48)
-            pix.fill(Qt.transparent)
-            painter = QPainter(pix)
-            font = QFont()
-            font.setPointSize(28)
-            painter.setFont(font)
-            painter.drawText(pix.rect(), Qt.AlignCenter, emoji)
-            painter.end()
-            # Flip horizontally for West-positioned tabs so icons face inward
-            if self.tab_widget.tabPosition() == QTabWidget.West:
-                from PyQt5.QtGui import QTransform
-                t = QTransform()
-                t.scale(-1, 1)
-                pix = pix.transformed(t)
-            return QIcon(pix)
+            return emoji_icon(emoji, self.tab_widget.tabPosition() == QTabWidget.West)
         
         # Add Mixer tab first (emoji icon as tab icon)
         self.mixer_widget = MixerWidget(self.routing_system)
@@ -71,8 +60,12 @@ class MainWindow(QMainWindow):
         self.tab_widget.setTabIcon(mixer_index, make_emoji_icon("🎛️"))
         self.tab_widget.setTabToolTip(mixer_index, "Mixer")
         
-        # Add audio type tabs with emoji icons
+        # Add audio type tabs with emoji icons. Each tab starts as an empty
+        # page and gets its AudioTypeWidget the first time it is shown, see
+        # _ensure_tab; audio_tabs only holds the widgets built so far
         self.audio_tabs = {}
+        self._tab_builders = {}
+        self._bands = None  # Band count to apply to tabs built later
         icon_map = {
             'game': ("🎮", "Game"),
             'others': ("📦", "Others"),
@@ -81,13 +74,15 @@ class MainWindow(QMainWindow):
             'microphone': ("🎙️", "Mic"),
         }
         for audio_type in ['game', 'others', 'system', 'chat', 'microphone']:
-            widget = AudioTypeWidget(audio_type, self.routing_system)
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
             icon_text, tooltip = icon_map.get(audio_type, (audio_type.title(), audio_type.title()))
-            idx = self.tab_widget.addTab(widget, "")
+            idx = self.tab_widget.addTab(page, "")
             self.tab_widget.setTabIcon(idx, make_emoji_icon(icon_text))
             self.tab_widget.setTabToolTip(idx, tooltip)
-            self.audio_tabs[audio_type] = widget
+            self._tab_builders[idx] = (page, audio_type)
             # Volume/device controls are removed from these tabs; no signals to connect
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
             
         # Add Settings tab using embedded ConfigPanel (emoji icon)
         self.settings_panel = ConfigPanel(self.routing_system)
@@ -112,23 +107,46 @@ class MainWindow(QMainWindow):
         self.tray_icon = QSystemTrayIcon(make_emoji_icon("🎧"), self)
         self.tray_icon.setToolTip("Audio Enhancement — running")
         self._tray_menu = QMenu()
+        self.theme_manager.register_widget(self._tray_menu)
         self.tray_icon.setContextMenu(self._tray_menu)
         self.tray_icon.activated.connect(self._on_tray_activated)
-        self._build_tray_menu()
+        self._init_tray_menu()
+        self._refresh_tray_menu()
         self.tray_icon.show()
 
+    def _ensure_tab(self, index):
+        """Build an audio type tab's widget the first time the tab is shown"""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        page, audio_type = entry
+        widget = AudioTypeWidget(audio_type, self.routing_system)
+        # Catch up on what the built tabs were given while this one waited
+        if self.processors:
+            widget.set_processors(self.processors)
+        if self._bands is not None:
+            widget.update_equalizer_bands(self._bands)
+        page.layout().addWidget(widget)
+        self.audio_tabs[audio_type] = widget
+
     def register_processors(self, processors):
-        """Register audio processors with the UI"""
-        self.processors = processors
+        """Register audio processors with the UI (a no-op if none changed)"""
+        previous = self.processors
+        if processors.keys() == previous.keys() and all(
+                previous[name] is proc for name, proc in processors.items()):
+            return
+        self.processors = dict(processors)
         # Make equalizer available to Settings panel
-        try:
-            self.settings_panel.equalizer_widget.set_equalizer(processors.get('equalizer'))
-        except Exception:
-            pass
+        if previous.get('equalizer') is not processors.get('equalizer'):
+            try:
+                self.settings_panel.equalizer_widget.set_equalizer(processors.get('equalizer'))
+            except Exception:
+                pass
         
-        # Make processors available to all tabs
+        # Make processors available to the built tabs; the rest pick them
+        # up in _ensure_tab
         for tab in self.audio_tabs.values():
-            tab.set_processors(processors)
+            tab.set_processors(self.processors)
             
     def set_theme(self, theme_name):
         """Set the application theme"""
@@ -140,7 +158,7 @@ class MainWindow(QMainWindow):
         self.mixer_widget.refresh_category_devices()
         # Rebuild tray menu to reflect new device selections
         try:
-            self._build_tray_menu()
+            self._refresh_tray_menu()
         except Exception:
             pass
     
@@ -150,19 +168,22 @@ class MainWindow(QMainWindow):
         for widget in self.audio_tabs.values():
             if hasattr(widget, 'load_equalizer_settings'):
                 widget.load_equalizer_settings()
-        # Update tray menu checkmark
+        # Update tray menu checkmark (and profile list, which may be new)
+        self._profile_items = (None, [])
         try:
-            self._build_tray_menu()
+            self._refresh_tray_menu()
         except Exception:
             pass
     
     def on_bands_changed(self, bands):
         """Update all audio tabs when bands setting changes"""
+        self._bands = bands
         for audio_type, widget in self.audio_tabs.items():
             widget.update_equalizer_bands(bands)
     
     def on_save_profile_requested(self):
         """Persist current equalizer settings from all category tabs to config"""
+        self._profile_items = (None, [])
         for audio_type, widget in self.audio_tabs.items():
             if hasattr(widget, 'save_current_profile'):
                 widget.save_current_profile()
@@ -227,55 +248,82 @@ class MainWindow(QMainWindow):
             self.raise_()
             self.activateWindow()
 
-    def _build_tray_menu(self):
+    def _init_tray_menu(self):
+        """Create the tray menu's fixed actions and (empty) submenus once"""
         from PyQt5.QtWidgets import QAction, QMenu
-        self._tray_menu.clear()
+        self._profile_items = (None, [])  # (profiles key, submenu items)
         # Open
         open_action = QAction("Open", self)
         open_action.triggered.connect(lambda: (self.showNormal(), self.raise_(), self.activateWindow()))
         self._tray_menu.addAction(open_action)
-        # Switch Profile submenu
-        profiles_menu = QMenu("Switch Profile", self)
+        # Switch Profile / device submenus, filled by _refresh_tray_menu
+        self._profiles_menu = QMenu("Switch Profile", self)
+        self._tray_menu.addMenu(self._profiles_menu)
+        self._out_menu = QMenu("Output Device", self)
+        self._tray_menu.addMenu(self._out_menu)
+        self._in_menu = QMenu("Input Device", self)
+        self._tray_menu.addMenu(self._in_menu)
+        # Exit
+        exit_action = QAction("Exit", self)
+        exit_action.triggered.connect(self._exit_app)
+        self._tray_menu.addAction(exit_action)
+
+    def _refresh_tray_menu(self):
+        """Bring the tray submenus in line with the current profiles and devices"""
         eq_settings = (self.settings_panel.config.get("equalizer_settings") or {})
-        profiles = list((eq_settings.get("profiles") or {}).keys()) or ["Default"]
+        profiles = eq_settings.get("profiles") or {}
+        # Profiles rarely change between refreshes; reuse the item list
+        # while it is the same dict with the same number of entries
+        key = (id(profiles), len(profiles))
+        if self._profile_items[0] != key:
+            self._profile_items = (key, [(name, name) for name in profiles] or [("Default", "Default")])
         active = eq_settings.get("active_profile", "Default")
-        for name in profiles:
-            act = QAction(name, self, checkable=True, checked=(name == active))
-            act.triggered.connect(lambda chk, n=name: self._switch_profile(n))
-            profiles_menu.addAction(act)
-        self._tray_menu.addMenu(profiles_menu)
-        # Output devices submenu
-        out_menu = QMenu("Output Device", self)
+        self._refresh_submenu(self._profiles_menu, self._profile_items[1],
+                              active, self._switch_profile)
         try:
             out_devs = self.routing_system.get_output_devices() or []
         except Exception:
             out_devs = []
-        current_out_id = self.settings_panel.output_device_combo.currentData()
-        for dev in out_devs:
-            name = dev.get("name") or f"Device {dev.get('index')}"
-            idx = dev.get("index")
-            act = QAction(name, self, checkable=True, checked=(idx == current_out_id))
-            act.triggered.connect(lambda chk, did=idx: self._switch_output_device(did))
-            out_menu.addAction(act)
-        self._tray_menu.addMenu(out_menu)
-        # Input devices submenu
-        in_menu = QMenu("Input Device", self)
+        self._refresh_submenu(self._out_menu, self._device_items(out_devs),
+                              self.settings_panel.output_device_combo.currentData(),
+                              self._switch_output_device)
         try:
             in_devs = self.routing_system.get_input_devices() or []
         except Exception:
             in_devs = []
-        current_in_id = self.settings_panel.input_device_combo.currentData()
-        for dev in in_devs:
-            name = dev.get("name") or f"Device {dev.get('index')}"
-            idx = dev.get("index")
-            act = QAction(name, self, checkable=True, checked=(idx == current_in_id))
-            act.triggered.connect(lambda chk, did=idx: self._switch_input_device(did))
-            in_menu.addAction(act)
-        self._tray_menu.addMenu(in_menu)
-        # Exit
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self._exit_app)
-        self._tray_menu.addAction(exit_action)
+        self._refresh_submenu(self._in_menu, self._device_items(in_devs),
+                              self.settings_panel.input_device_combo.currentData(),
+                              self._switch_input_device)
+
+    @staticmethod
+    def _device_items(devices):
+        """(label, device index) pairs for a device submenu"""
+        return [(dev.get("name") or f"Device {dev.get('index')}", dev.get("index"))
+                for dev in devices]
+
+    def _refresh_submenu(self, menu, items, current, callback):
+        """
+        Show items as checkable actions in menu, checking the one whose data
+        is current. If the menu already lists the same items only the check
+        marks are updated; otherwise its actions are rebuilt.
+
+        Args:
+            items (list): (label, data) pairs; data is passed to callback
+                when the action is triggered.
+        """
+        from PyQt5.QtWidgets import QAction
+        actions = menu.actions()
+        if [(act.text(), act.data()) for act in actions] != items:
+            menu.clear()
+            actions = []
+            for label, data in items:
+                act = QAction(label, menu, checkable=True)
+                act.setData(data)
+                act.triggered.connect(lambda chk, d=data: callback(d))
+                actions.append(act)
+            menu.addActions(actions)
+        for act in actions:
+            act.setChecked(act.data() == current)
 
     def _switch_profile(self, profile_name: str):
         try:
@@ -284,31 +332,27 @@ class MainWindow(QMainWindow):
                 self.settings_panel.profile_combo.setCurrentIndex(idx)
             else:
                 self.settings_panel.on_profile_changed(profile_name)
-            self._build_tray_menu()
+            self._refresh_tray_menu()
         except Exception:
             pass
 
     def _switch_output_device(self, device_id: int | None):
         try:
-            combo = self.settings_panel.output_device_combo
-            for i in range(combo.count()):
-                if combo.itemData(i) == device_id:
-                    combo.setCurrentIndex(i)
-                    break
+            idx = self.settings_panel.output_device_row(device_id)
+            if idx >= 0:
+                self.settings_panel.output_device_combo.setCurrentIndex(idx)
             self.settings_panel.apply_device_configuration()
-            self._build_tray_menu()
+            self._refresh_tray_menu()
         except Exception:
             pass
 
     def _switch_input_device(self, device_id: int | None):
         try:
-            combo = self.settings_panel.input_device_combo
-            for i in range(combo.count()):
-                if combo.itemData(i) == device_id:
-                    combo.setCurrentIndex(i)
-                    break
+            idx = self.settings_panel.input_device_row(device_id)
+            if idx >= 0:
+                self.settings_panel.input_device_combo.setCurrentIndex(idx)
             self.settings_panel.apply_device_configuration()
-            self._build_tray_menu()
+            self._refresh_tray_menu()
         except Exception:
             pass
 
@@ -1,5 +1,139 @@
+import re
+import struct
+import time
+from functools import lru_cache
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+# Programs auto-categorized as chat, matched against lowercased session names
+_CHAT_RE = re.compile(r"discord|whatsapp|telegram|skype|zoom")
+
+
+@lru_cache(maxsize=512)
+def _category_for_name(lname):
+    """Auto category for a lowercased session name; names repeat across refreshes"""
+    if "system" in lname:
+        return "system"
+    if _CHAT_RE.search(lname):
+        return "chat"
+    return "others"
+
+
+# Refreshes this close together reuse the last session enumeration
+_SESSIONS_TTL = 0.25
+
+# MIME type carrying a dragged session: the pid as a little-endian int64
+# followed by the UTF-8 name
+SESSION_MIME_TYPE = "application/x-audio-session"
+_PID = struct.Struct("<q")
+
+
+def session_mime(pid, name):
+    """Build drag data for a session"""
+    mime = QtCore.QMimeData()
+    mime.setData(SESSION_MIME_TYPE, QtCore.QByteArray(_PID.pack(pid) + name.encode("utf-8")))
+    return mime
+
+
+def read_session_mime(mime):
+    """Return (pid, name) from drag data made by session_mime, or None"""
+    if mime is None or not mime.hasFormat(SESSION_MIME_TYPE):
+        return None
+    data = bytes(mime.data(SESSION_MIME_TYPE))
+    pid, = _PID.unpack_from(data)
+    return pid, data[_PID.size:].decode("utf-8") or "Unknown"
+
+
+# Item data role holding a session row's category key
+_CATEGORY_ROLE = QtCore.Qt.UserRole + 1
+
+# Dynamic property naming the category a session list viewport drops into
+_DROP_CATEGORY_PROPERTY = "session_category"
+
+_DRAG_EVENTS = frozenset((QtCore.QEvent.DragEnter, QtCore.QEvent.DragMove, QtCore.QEvent.Drop))
+
+
+class _SessionListModel(QtCore.QAbstractListModel):
+    """
+    Active sessions as plain {"pid", "name", "category"} dicts.
+
+    DisplayRole is the name, ToolTipRole the pid and name, UserRole the row
+    dict and _CATEGORY_ROLE its category key (None: All Sounds only).
+    """
+    _FLAGS = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsDragEnabled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else QtCore.Qt.NoItemFlags
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return row["name"]
+        if role == _CATEGORY_ROLE:
+            return row["category"]
+        if role == QtCore.Qt.UserRole:
+            return row
+        if role == QtCore.Qt.ToolTipRole:
+            return f"PID: {row['pid']}\n{row['name']}"
+        return None
+
+    def set_sessions(self, rows):
+        """Replace all rows, resetting attached views once; no-op if unchanged"""
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def set_category(self, pid, category):
+        """Move pid's rows to category; returns False if pid is not listed"""
+        found = False
+        for i, row in enumerate(self._rows):
+            if row["pid"] == pid:
+                found = True
+                if row["category"] != category:
+                    row["category"] = category
+                    index = self.index(i)
+                    self.dataChanged.emit(index, index, [_CATEGORY_ROLE])
+        return found
+
+
+class _CategoryFilter(QtCore.QSortFilterProxyModel):
+    """Shows the session rows assigned to one category"""
+    def __init__(self, category, parent=None):
+        super().__init__(parent)
+        self._category = category
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return index.data(_CATEGORY_ROLE) == self._category
+
+
+class _SessionListView(QtWidgets.QListView):
+    """Session list that drags its current row as session MIME data"""
+    def startDrag(self, supportedActions):
+        index = self.currentIndex()
+        if not index.isValid():
+            return
+        # Build MIME from stored UserRole data so visible text can be just name
+        data = index.data(QtCore.Qt.UserRole) or {}
+        pid = data.get("pid")
+        name = data.get("name") or index.data()
+        if pid is None:
+            return
+        drag = QtGui.QDrag(self)
+        drag.setMimeData(session_mime(pid, name))
+        drag.exec_(supportedActions)
+
+
 class MixerWidget(QtWidgets.QWidget):
     session_reroute_requested = QtCore.pyqtSignal(int, int)  # pid, device_index
 
@@ -7,6 +141,14 @@ class MixerWidget(QtWidgets.QWidget):
         super().__init__(parent)
         self.routing_system = routing_system
         self.output_devices = []
+        self._pending_refresh = False  # Refresh requested while hidden
+        self._sessions_cache = (0.0, [])  # (monotonic time, sessions)
+        # Slider drags emit every step; apply volumes at most every 30ms
+        self._pending_volumes = {}  # category -> latest slider value
+        self._volume_timer = QtCore.QTimer(self)
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(30)
+        self._volume_timer.timeout.connect(self._apply_volumes)
         self._build_ui()
         self._connect_signals()
         # Remove master device selection; Active Programs moved to Settings
@@ -55,27 +197,20 @@ class MixerWidget(QtWidgets.QWidget):
         grid = QtWidgets.QGridLayout(prog_group)
         prog_group.setMaximumHeight(230)
 
-        class DraggableListWidget(QtWidgets.QListWidget):
-            def startDrag(self, supportedActions):
-                item = self.currentItem()
-                if not item:
-                    return
-                # Build MIME from stored UserRole data so visible text can be just name
-                data = item.data(QtCore.Qt.UserRole) or {}
-                pid = data.get("pid")
-                name = data.get("name") or item.text()
-                if pid is None:
-                    return
-                drag = QtGui.QDrag(self)
-                mime = QtCore.QMimeData()
-                mime.setText(f"pid:{pid}|name:{name}")
-                drag.setMimeData(mime)
-                drag.exec_(supportedActions)
-
-        def make_list(title, draggable=True):
+        # One model holds every session row; All shows it directly and each
+        # category list shows it through a filter on the row's category
+        self._sessions_model = _SessionListModel(self)
+
+        def make_list(title, category):
             box = QtWidgets.QGroupBox(title)
             v = QtWidgets.QVBoxLayout(box)
-            lst = DraggableListWidget() if draggable else QtWidgets.QListWidget()
+            lst = _SessionListView()
+            if category == "all":
+                lst.setModel(self._sessions_model)
+            else:
+                proxy = _CategoryFilter(category, lst)
+                proxy.setSourceModel(self._sessions_model)
+                lst.setModel(proxy)
             lst.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
             lst.setFixedSize(120, 120)
             lst.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
@@ -85,11 +220,11 @@ class MixerWidget(QtWidgets.QWidget):
             return box, lst
 
         # 1x5 layout: All + System + Others + Game + Chat (equal height/width)
-        all_box, all_list = make_list("All Sounds", draggable=True)
-        system_box, system_list = make_list("System", draggable=True)
-        others_box, others_list = make_list("Others", draggable=True)
-        game_box, game_list = make_list("Game", draggable=True)
-        chat_box, chat_list = make_list("Chat", draggable=True)
+        all_box, all_list = make_list("All Sounds", "all")
+        system_box, system_list = make_list("System", "system")
+        others_box, others_list = make_list("Others", "others")
+        game_box, game_list = make_list("Game", "game")
+        chat_box, chat_list = make_list("Chat", "chat")
 
         # Arrange in a single row with five squares
         grid.addWidget(all_box,    0, 0)
@@ -116,20 +251,24 @@ class MixerWidget(QtWidgets.QWidget):
         }
 
         # Enable drag-and-drop to categorize sessions (not for All as target)
+        # Item views get drag events on their viewport; this widget filters
+        # them for all four lists, see eventFilter
         for category, lst in self.session_lists.items():
             if category != "all":
                 lst.setAcceptDrops(True)
-                lst.dragEnterEvent = self._make_drop_handler(category)
-                lst.dropEvent = self._make_drop_handler(category)
+                viewport = lst.viewport()
+                viewport.setProperty(_DROP_CATEGORY_PROPERTY, category)
+                viewport.installEventFilter(self)
 
     def _connect_signals(self):
         # Category sliders
         for key, controls in self.category_controls.items():
-            controls["slider"].valueChanged.connect(lambda v, k=key: self._on_category_volume_changed(k, v))
+            controls["slider"].valueChanged.connect(
+                lambda v, k=key, label=controls["value_label"]: self._on_category_volume_changed(k, v, label))
         # Connect clicks for session lists to choose category
         for lst in getattr(self, "session_lists", {}).values():
-            lst.itemClicked.connect(self.on_session_item_clicked)
-            lst.itemDoubleClicked.connect(self.on_session_item_clicked)
+            lst.clicked.connect(self.on_session_item_clicked)
+            lst.doubleClicked.connect(self.on_session_item_clicked)
 
     def refresh_category_devices(self):
         # Device name is no longer shown in Mixer category rows
@@ -139,54 +278,50 @@ class MixerWidget(QtWidgets.QWidget):
     def refresh_sessions(self):
         self.refresh_sessions_ui()
 
-    # Build drag/drop handlers copied from Settings implementation
-    def _make_drop_handler(self, category):
-        def handler(event):
-            try:
-                md = event.mimeData()
-                text = md.text() if md and md.hasText() else ""
-                pid = -1
-                name = "Unknown"
-                if text.startswith("pid:"):
-                    parts = text.split("|")
-                    pid_part = parts[0].split(":")[1]
-                    name_part = parts[1].split(":")[1] if len(parts) > 1 else "Unknown"
-                    pid = int(pid_part) if pid_part.isdigit() else -1
-                    name = name_part
-                if event.type() == QtCore.QEvent.DragEnter:
+    def eventFilter(self, obj, event):
+        """Handle session drops on the category lists' viewports"""
+        etype = event.type()
+        if etype not in _DRAG_EVENTS:
+            return super().eventFilter(obj, event)
+        category = obj.property(_DROP_CATEGORY_PROPERTY)
+        if category is None:
+            return super().eventFilter(obj, event)
+        try:
+            if etype != QtCore.QEvent.Drop:
+                # Enter/move: take session drags, whatever the list's model says
+                if event.mimeData().hasFormat(SESSION_MIME_TYPE):
                     event.acceptProposedAction()
-                    return
-                # Drop
-                if pid != -1:
-                    self.on_session_dropped(pid, name, category)
-                event.acceptProposedAction()
-            except Exception:
-                event.ignore()
-        return handler
+                else:
+                    event.ignore()
+                return True
+            session = read_session_mime(event.mimeData())
+            if session is not None and session[0] != -1:
+                self.on_session_dropped(*session, category)
+            event.acceptProposedAction()
+        except Exception:
+            event.ignore()
+        return True
 
-    def _add_item(self, lst: QtWidgets.QListWidget, name: str, pid: int):
-        # Show only program name in list; encode pid/name in UserRole and tooltip
-        item = QtWidgets.QListWidgetItem(name)
-        item.setToolTip(f"PID: {pid}\n{name}")
-        item.setData(QtCore.Qt.UserRole, {"pid": pid, "name": name})
-        item.setFlags(item.flags() | QtCore.Qt.ItemIsEnabled)
-        lst.addItem(item)
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_refresh:
+            self.refresh_sessions_ui()
 
     def refresh_sessions_ui(self):
-        # Clear lists
-        for lst in self.session_lists.values():
-            lst.clear()
-        sessions = []
-        try:
-            sessions = self.routing_system.list_active_sessions() or []
-        except Exception:
-            sessions = []
-        # Populate All and categories with auto-categorization
+        # Nobody sees the lists while the tab is hidden; refresh once shown
+        if not self.isVisible():
+            self._pending_refresh = True
+            return
+        self._pending_refresh = False
+        sessions = self._list_sessions()
+        rows = []
+        # Build all rows first and swap them in at once, so the lists and
+        # their filters update once rather than per session. The usual
+        # refresh finds the same sessions in the same categories and leaves
+        # the views untouched
         for sess in sessions:
             name = sess.get("name") or sess.get("display_name") or "Unknown"
-            pid = sess.get("pid") or sess.get("process_id") or -1
-            # Always list in All Sounds
-            self._add_item(self.session_lists["all"], name, pid)
+            pid = sess["pid"]
             # Use existing assignment if present; otherwise auto-categorize
             assigned = None
             try:
@@ -194,36 +329,55 @@ class MixerWidget(QtWidgets.QWidget):
             except Exception:
                 assigned = None
             cat = assigned if assigned in self.session_lists and assigned != "all" else self._determine_category(name, pid)
-            if cat in self.session_lists and cat != "all":
-                self._add_item(self.session_lists[cat], name, pid)
+            if cat not in self.session_lists or cat == "all":
+                cat = None  # Listed in All Sounds only
+            elif not assigned:
                 # Record inferred auto-assignment the first time only
-                if not assigned:
-                    try:
-                        self.routing_system.set_session_category(pid, cat)
-                    except Exception:
-                        pass
+                try:
+                    self.routing_system.set_session_category(pid, cat)
+                except Exception:
+                    pass
+            rows.append({"pid": pid, "name": name, "category": cat})
+        self._sessions_model.set_sessions(rows)
+
+    def _list_sessions(self):
+        """Active sessions, enumerated at most once per _SESSIONS_TTL"""
+        now = time.monotonic()
+        stamp, sessions = self._sessions_cache
+        if sessions and now - stamp < _SESSIONS_TTL:
+            return sessions
+        try:
+            sessions = self.routing_system.list_active_sessions() or []
+        except Exception:
+            sessions = []
+        self._sessions_cache = (now, sessions)
+        return sessions
+
+    def _invalidate_sessions_cache(self):
+        self._sessions_cache = (0.0, [])
 
     def _determine_category(self, name: str, pid: int) -> str:
-        lname = (name or "").lower()
         # Auto rules and potential overrides
-        if pid == -1 or "system" in lname:
+        if pid == -1:
             return "system"
-        if any(x in lname for x in ["discord", "whatsapp", "telegram", "skype", "zoom"]):
-            return "chat"
-        return "others"
+        return _category_for_name((name or "").lower())
 
     def on_session_dropped(self, pid: int, name: str, category: str):
         try:
             self.routing_system.set_session_category(pid, category)
         except Exception:
             pass
-        self.refresh_sessions_ui()
+        # Move the rows; the category filters pick up the change themselves
+        if not self._sessions_model.set_category(pid, category):
+            # Not listed yet; re-read the sessions
+            self._invalidate_sessions_cache()
+            self.refresh_sessions_ui()
 
-    def on_session_item_clicked(self, item: QtWidgets.QListWidgetItem):
+    def on_session_item_clicked(self, index: QtCore.QModelIndex):
         try:
-            data = item.data(QtCore.Qt.UserRole) or {}
-            pid = int(data.get("pid") or -1)
-            name = data.get("name") or item.text() or "Unknown"
+            data = index.data(QtCore.Qt.UserRole) or {}
+            pid = int(data.get("pid", -1))
+            name = data.get("name") or index.data() or "Unknown"
             # Menu order: System, Others, Game, Chat
             display_options = ["System", "Others", "Game", "Chat"]
             key_map = {"System": "system", "Others": "others", "Game": "game", "Chat": "chat"}
@@ -233,12 +387,19 @@ class MixerWidget(QtWidgets.QWidget):
         except Exception:
             pass
 
-    def _on_category_volume_changed(self, audio_type, value):
-        controls = self.category_controls.get(audio_type)
-        if controls:
-            controls["value_label"].setText(f"{value}%")
-        try:
-            # Output categories: adjust per-session volume; microphone adjusts endpoint
-            self.routing_system.set_category_volume(audio_type, value)
-        except Exception:
-            pass
+    def _on_category_volume_changed(self, audio_type, value, label):
+        label.setText(f"{value}%")
+        # Applied in _apply_volumes (coalesced, see _volume_timer)
+        self._pending_volumes[audio_type] = value
+        if not self._volume_timer.isActive():
+            self._volume_timer.start()
+
+    def _apply_volumes(self):
+        """Set the latest volume of each category moved since the last call"""
+        pending, self._pending_volumes = self._pending_volumes, {}
+        for audio_type, value in pending.items():
+            try:
+                # Output categories: adjust per-session volume; microphone adjusts endpoint
+                self.routing_system.set_category_volume(audio_type, value)
+            except Exception:
+                pass
@@ -1,8 +1,200 @@
 """
 Theme manager for the audio enhancement application
 """
+import os
+import re
+import weakref
+from functools import lru_cache
+from pathlib import Path
+
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QDir, QObject, QTimer, pyqtSignal
+
+# Stylesheets refer to the images in ui/icons as "icons:<file>"
+QDir.addSearchPath("icons", os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons"))
+
+# Whitespace runs, space around braces/separators and after colons; none
+# of it is significant in the theme stylesheets (no quoted text contains it)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_SPACE_RE = re.compile(r" ?([{};,]) ?")
+_COLON_SPACE_RE = re.compile(r": ")
+
+# Stylesheet shared by all themes, with %(name)s fields filled from
+# _PALETTES (%-formatting keeps the CSS braces literal). Kept as a .qss
+# file so it can be edited as CSS and is only read when a theme is built
+_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes", "base.qss")
+
+# Colors of each theme, plus "extra" rules only that theme has
+_PALETTES = {
+    "Light": {
+        "bg": "#ffffff",
+        "fg": "#000000",
+        "group_border": "#cccccc",
+        "group_bg": "#f8f9fa",
+        "control_bg": "#f0f0f0",
+        "field_bg": "#ffffff",
+        "panel_bg": "#ffffff",
+        "border": "#cccccc",
+        "hover_bg": "#e0e0e0",
+        "hover_border": "#999999",
+        "hover_fg": "#000000",
+        "pressed_bg": "#d0d0d0",
+        "pressed_border": "#666666",
+        "pressed_fg": "#000000",
+        "disabled_bg": "#f5f5f5",
+        "disabled_fg": "#999999",
+        "disabled_border": "#e0e0e0",
+        "arrow": "#666666",
+        "accent": "#0078d4",
+        "accent_border": "#005a9e",
+        "accent_hover": "#106ebe",
+        "checked_bg": "#0078d4",
+        "checked_border": "#0078d4",
+        "check_icon": "check_white.svg",
+        "tab_hover_bg": "#e8e8e8",
+        "label_fg": "#333333",
+        "scroll_handle": "#cccccc",
+        "scroll_handle_hover": "#999999",
+        "extra": "",
+    },
+    "Dark": {
+        "bg": "#1e1e1e",
+        "fg": "#ffffff",
+        "group_border": "#404040",
+        "group_bg": "#2d2d30",
+        "control_bg": "#404040",
+        "field_bg": "#404040",
+        "panel_bg": "#2d2d30",
+        "border": "#555555",
+        "hover_bg": "#505050",
+        "hover_border": "#666666",
+        "hover_fg": "#ffffff",
+        "pressed_bg": "#353535",
+        "pressed_border": "#777777",
+        "pressed_fg": "#ffffff",
+        "disabled_bg": "#2a2a2a",
+        "disabled_fg": "#666666",
+        "disabled_border": "#333333",
+        "arrow": "#ffffff",
+        "accent": "#0078d4",
+        "accent_border": "#005a9e",
+        "accent_hover": "#106ebe",
+        "checked_bg": "#0078d4",
+        "checked_border": "#0078d4",
+        "check_icon": "check_white.svg",
+        "tab_hover_bg": "#505050",
+        "label_fg": "#ffffff",
+        "scroll_handle": "#666666",
+        "scroll_handle_hover": "#777777",
+        "extra": """
+QComboBox QAbstractItemView {
+    background-color: #404040;
+    border: 1px solid #555555;
+    selection-background-color: #0078d4;
+    color: #ffffff;
+}
+""",
+    },
+    # Dark grey backgrounds with green accents
+    "Green Matrix": {
+        "bg": "#1a1a1a",
+        "fg": "#00ff41",
+        "group_border": "#00cc33",
+        "group_bg": "#2a2a2a",
+        "control_bg": "#333333",
+        "field_bg": "#333333",
+        "panel_bg": "#2a2a2a",
+        "border": "#00cc33",
+        "hover_bg": "#404040",
+        "hover_border": "#00ff41",
+        "hover_fg": "#ffffff",
+        "pressed_bg": "#00cc33",
+        "pressed_border": "#00ff41",
+        "pressed_fg": "#000000",
+        "disabled_bg": "#2a2a2a",
+        "disabled_fg": "#666666",
+        "disabled_border": "#444444",
+        "arrow": "#00ff41",
+        "accent": "#00ff41",
+        "accent_border": "#00cc33",
+        "accent_hover": "#33ff66",
+        "checked_bg": "#00cc33",
+        "checked_border": "#00ff41",
+        "check_icon": "check_black.svg",
+        "tab_hover_bg": "#404040",
+        "label_fg": "#00ff41",
+        "scroll_handle": "#00cc33",
+        "scroll_handle_hover": "#00ff41",
+        "extra": """
+QComboBox QAbstractItemView {
+    background-color: #333333;
+    border: 1px solid #00cc33;
+    selection-background-color: #00cc33;
+    selection-color: #000000;
+    color: #00ff41;
+}
+
+QListWidget {
+    background-color: #2a2a2a;
+    border: 1px solid #00cc33;
+    border-radius: 4px;
+    color: #00ff41;
+    selection-background-color: #00cc33;
+    selection-color: #000000;
+}
+
+QListWidget::item {
+    padding: 4px;
+    border-bottom: 1px solid #333333;
+}
+
+QListWidget::item:hover {
+    background-color: #404040;
+    color: #ffffff;
+}
+
+QListWidget::item:selected {
+    background-color: #00cc33;
+    color: #000000;
+}
+
+QMessageBox {
+    background-color: #1a1a1a;
+    color: #00ff41;
+}
+
+QMessageBox QPushButton {
+    min-width: 80px;
+}
+""",
+    },
+}
+
+
+def _minify_css(css):
+    """Drop the whitespace Qt's stylesheet parser would otherwise tokenize"""
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_SPACE_RE.sub(r"\1", css)
+    return _COLON_SPACE_RE.sub(":", css).replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=1)
+def _template():
+    """The stylesheet template, read on first use"""
+    return Path(_TEMPLATE_PATH).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=8)
+def _stylesheet(theme_name):
+    """
+    Minified stylesheet of a theme, formatted the first time it is asked
+    for, so themes that are never used are never built. Unknown names get Light;
+    "System" is empty and keeps the OS default look.
+    """
+    if theme_name == "System":
+        return ""
+    return _minify_css(_template() % _PALETTES.get(theme_name, _PALETTES["Light"]))
+
 
 class ThemeManager(QObject):
     """Manages application themes and styling"""
@@ -12,619 +204,103 @@ class ThemeManager(QObject):
     def __init__(self):
         super().__init__()
         self.current_theme = "Light"
+        self._applied_theme = self.current_theme  # Last theme announced
+        self._theme_listeners = []
+        self._targets = weakref.WeakSet()  # Widgets styled by the theme
+
+        # Calls made in one pass of the event loop are applied once, for
+        # the last theme asked for (see _apply_theme)
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(0)
+        self._apply_timer.timeout.connect(self._apply_theme)
         
     def set_theme(self, theme_name):
-        """Set the application theme"""
+        """Set the application theme (applied on the next event loop pass)"""
         self.current_theme = theme_name
+        self._apply_timer.start()
+
+    def _apply_theme(self):
+        """Apply and announce current_theme (a no-op if it is already applied)"""
+        theme_name = self.current_theme
         stylesheet = self.get_theme_stylesheet(theme_name)
         
-        app = QApplication.instance()
-        if app:
-            app.setStyleSheet(stylesheet)
+        # Setting a stylesheet re-parses it and repolishes every widget it
+        # covers, so only do it where the sheet differs from the applied one
+        if not self._apply_stylesheet(stylesheet) and theme_name == self._applied_theme:
+            return
             
-        self.theme_changed.emit(theme_name)
+        self._applied_theme = theme_name
+        # Nothing connects to it in this app; skip the metacall if so
+        if self.receivers(self.theme_changed) > 0:
+            self.theme_changed.emit(theme_name)
+        for callback in list(self._theme_listeners):
+            try:
+                callback(theme_name)
+            except Exception as e:
+                print(f"Error in theme listener: {e}")
+
+    def _apply_stylesheet(self, stylesheet):
+        """
+        Set stylesheet on the registered widgets, or the whole app if none are.
+
+        Returns:
+            bool: Whether anything was restyled.
+        """
+        targets = list(self._targets) or [QApplication.instance()]
+        changed = False
+        for target in targets:
+            if target is not None and target.styleSheet() != stylesheet:
+                target.setStyleSheet(stylesheet)
+                changed = True
+        return changed
+
+    def register_widget(self, widget):
+        """
+        Style widget (and its children) with the theme instead of the whole
+        application; register before the first theme is applied.
+
+        Once widgets are registered, a theme change only repolishes their
+        trees. Top-level widgets without a parent, such as a tray menu,
+        have to be registered themselves. Widgets are held weakly.
+        """
+        self._targets.add(widget)
+
+    def add_theme_listener(self, callback):
+        """
+        Register callback(theme_name), called directly after a theme is applied.
+
+        Cheaper than connecting to theme_changed for plain Python code that
+        only needs to drop theme-dependent caches; it always runs on the
+        GUI thread.
+        """
+        self._theme_listeners.append(callback)
+
+    def remove_theme_listener(self, callback):
+        """Unregister a callback added with add_theme_listener"""
+        if callback in self._theme_listeners:
+            self._theme_listeners.remove(callback)
         
     def get_current_theme(self):
         """Get the current theme name"""
         return self.current_theme
         
     def get_theme_stylesheet(self, theme_name):
-        """Get the complete stylesheet for a theme"""
-        if theme_name == "Dark":
-            return self.get_dark_theme()
-        elif theme_name == "Green Matrix":
-            return self.get_green_matrix_theme()
-        elif theme_name == "System":
-            return self.get_system_theme()
-        else:
-            return self.get_light_theme()
-            
+        """Get the complete stylesheet for a theme (unknown names get Light)"""
+        return _stylesheet(theme_name)
+
     def get_light_theme(self):
         """Light theme stylesheet"""
-        return """
-        QMainWindow {
-            background-color: #ffffff;
-            color: #000000;
-        }
-        
-        QWidget {
-            background-color: #ffffff;
-            color: #000000;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 9pt;
-        }
-        
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #cccccc;
-            border-radius: 8px;
-            margin-top: 1ex;
-            padding-top: 15px;
-            background-color: #f8f9fa;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 15px;
-            padding: 0 8px 0 8px;
-            background-color: #ffffff;
-        }
-        
-        QPushButton {
-            background-color: #f0f0f0;
-            border: 1px solid #cccccc;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #e0e0e0;
-            border-color: #999999;
-        }
-        
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-            border-color: #666666;
-        }
-        
-        QPushButton:disabled {
-            background-color: #f5f5f5;
-            color: #999999;
-            border-color: #e0e0e0;
-        }
-        
-        QComboBox {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
-            padding: 6px 12px;
-            border-radius: 4px;
-            min-width: 120px;
-        }
-        
-        QComboBox:hover {
-            border-color: #999999;
-        }
-        
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left: 1px solid #cccccc;
-        }
-        
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 4px solid #666666;
-        }
-        
-        QSlider::groove:horizontal {
-            border: 1px solid #cccccc;
-            height: 6px;
-            background: #f0f0f0;
-            border-radius: 3px;
-        }
-        
-        QSlider::handle:horizontal {
-            background: #0078d4;
-            border: 1px solid #005a9e;
-            width: 16px;
-            margin: -6px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::handle:horizontal:hover {
-            background: #106ebe;
-        }
-        
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #ffffff;
-            border: 2px solid #cccccc;
-            border-radius: 3px;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #0078d4;
-            border: 2px solid #0078d4;
-            border-radius: 3px;
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #cccccc;
-            background-color: #ffffff;
-            border-radius: 4px;
-        }
-        
-        QTabBar::tab {
-            background-color: #f0f0f0;
-            border: 1px solid #cccccc;
-            padding: 8px 16px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #ffffff;
-            border-bottom: 1px solid #ffffff;
-        }
-        
-        QTabBar::tab:hover:!selected {
-            background-color: #e8e8e8;
-        }
-        
-        QLabel {
-            color: #333333;
-            background-color: transparent;
-        }
-        
-        QScrollArea {
-            border: 1px solid #cccccc;
-            border-radius: 4px;
-            background-color: #ffffff;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #f0f0f0;
-            width: 12px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #cccccc;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #999999;
-        }
-        """
+        return _stylesheet("Light")
         
     def get_dark_theme(self):
         """Dark theme stylesheet"""
-        return """
-        QMainWindow {
-            background-color: #1e1e1e;
-            color: #ffffff;
-        }
-        
-        QWidget {
-            background-color: #1e1e1e;
-            color: #ffffff;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 9pt;
-        }
-        
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #404040;
-            border-radius: 8px;
-            margin-top: 1ex;
-            padding-top: 15px;
-            background-color: #2d2d30;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 15px;
-            padding: 0 8px 0 8px;
-            background-color: #1e1e1e;
-            color: #ffffff;
-        }
-        
-        QPushButton {
-            background-color: #404040;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            border-radius: 4px;
-            color: #ffffff;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #505050;
-            border-color: #666666;
-        }
-        
-        QPushButton:pressed {
-            background-color: #353535;
-            border-color: #777777;
-        }
-        
-        QPushButton:disabled {
-            background-color: #2a2a2a;
-            color: #666666;
-            border-color: #333333;
-        }
-        
-        QComboBox {
-            background-color: #404040;
-            border: 1px solid #555555;
-            padding: 6px 12px;
-            border-radius: 4px;
-            color: #ffffff;
-            min-width: 120px;
-        }
-        
-        QComboBox:hover {
-            border-color: #666666;
-        }
-        
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left: 1px solid #555555;
-        }
-        
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 4px solid #ffffff;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #404040;
-            border: 1px solid #555555;
-            selection-background-color: #0078d4;
-            color: #ffffff;
-        }
-        
-        QSlider::groove:horizontal {
-            border: 1px solid #555555;
-            height: 6px;
-            background: #404040;
-            border-radius: 3px;
-        }
-        
-        QSlider::handle:horizontal {
-            background: #0078d4;
-            border: 1px solid #005a9e;
-            width: 16px;
-            margin: -6px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::handle:horizontal:hover {
-            background: #106ebe;
-        }
-        
-        QCheckBox {
-            color: #ffffff;
-        }
-        
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #404040;
-            border: 2px solid #555555;
-            border-radius: 3px;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #0078d4;
-            border: 2px solid #0078d4;
-            border-radius: 3px;
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            background-color: #2d2d30;
-            border-radius: 4px;
-        }
-        
-        QTabBar::tab {
-            background-color: #404040;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            margin-right: 2px;
-            color: #ffffff;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #2d2d30;
-            border-bottom: 1px solid #2d2d30;
-        }
-        
-        QTabBar::tab:hover:!selected {
-            background-color: #505050;
-        }
-        
-        QLabel {
-            color: #ffffff;
-            background-color: transparent;
-        }
-        
-        QScrollArea {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            background-color: #2d2d30;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #404040;
-            width: 12px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #666666;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #777777;
-        }
-        
-        QDialog {
-            background-color: #1e1e1e;
-        }
-        """
+        return _stylesheet("Dark")
         
     def get_green_matrix_theme(self):
         """Green Matrix theme - dark grey backgrounds with green accents"""
-        return """
-        QMainWindow {
-            background-color: #1a1a1a;
-            color: #00ff41;
-        }
-        
-        QWidget {
-            background-color: #1a1a1a;
-            color: #00ff41;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 9pt;
-        }
-        
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #00cc33;
-            border-radius: 8px;
-            margin-top: 1ex;
-            padding-top: 15px;
-            background-color: #2a2a2a;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 15px;
-            padding: 0 8px 0 8px;
-            background-color: #1a1a1a;
-            color: #00ff41;
-        }
-        
-        QPushButton {
-            background-color: #333333;
-            border: 1px solid #00cc33;
-            padding: 8px 16px;
-            border-radius: 4px;
-            color: #00ff41;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #404040;
-            border-color: #00ff41;
-            color: #ffffff;
-        }
-        
-        QPushButton:pressed {
-            background-color: #00cc33;
-            border-color: #00ff41;
-            color: #000000;
-        }
-        
-        QPushButton:disabled {
-            background-color: #2a2a2a;
-            color: #666666;
-            border-color: #444444;
-        }
-        
-        QComboBox {
-            background-color: #333333;
-            border: 1px solid #00cc33;
-            padding: 6px 12px;
-            border-radius: 4px;
-            color: #00ff41;
-            min-width: 120px;
-        }
-        
-        QComboBox:hover {
-            border-color: #00ff41;
-        }
-        
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left: 1px solid #00cc33;
-        }
-        
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 4px solid #00ff41;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #333333;
-            border: 1px solid #00cc33;
-            selection-background-color: #00cc33;
-            selection-color: #000000;
-            color: #00ff41;
-        }
-        
-        QSlider::groove:horizontal {
-            border: 1px solid #00cc33;
-            height: 6px;
-            background: #333333;
-            border-radius: 3px;
-        }
-        
-        QSlider::handle:horizontal {
-            background: #00ff41;
-            border: 1px solid #00cc33;
-            width: 16px;
-            margin: -6px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::handle:horizontal:hover {
-            background: #33ff66;
-        }
-        
-        QCheckBox {
-            color: #00ff41;
-        }
-        
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #333333;
-            border: 2px solid #00cc33;
-            border-radius: 3px;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #00cc33;
-            border: 2px solid #00ff41;
-            border-radius: 3px;
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0iYmxhY2siIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #00cc33;
-            background-color: #2a2a2a;
-            border-radius: 4px;
-        }
-        
-        QTabBar::tab {
-            background-color: #333333;
-            border: 1px solid #00cc33;
-            padding: 8px 16px;
-            margin-right: 2px;
-            color: #00ff41;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #2a2a2a;
-            border-bottom: 1px solid #2a2a2a;
-            color: #00ff41;
-        }
-        
-        QTabBar::tab:hover:!selected {
-            background-color: #404040;
-            color: #ffffff;
-        }
-        
-        QLabel {
-            color: #00ff41;
-            background-color: transparent;
-        }
-        
-        QScrollArea {
-            border: 1px solid #00cc33;
-            border-radius: 4px;
-            background-color: #2a2a2a;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #333333;
-            width: 12px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #00cc33;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #00ff41;
-        }
-        
-        QListWidget {
-            background-color: #2a2a2a;
-            border: 1px solid #00cc33;
-            border-radius: 4px;
-            color: #00ff41;
-            selection-background-color: #00cc33;
-            selection-color: #000000;
-        }
-        
-        QListWidget::item {
-            padding: 4px;
-            border-bottom: 1px solid #333333;
-        }
-        
-        QListWidget::item:hover {
-            background-color: #404040;
-            color: #ffffff;
-        }
-        
-        QListWidget::item:selected {
-            background-color: #00cc33;
-            color: #000000;
-        }
-        
-        QDialog {
-            background-color: #1a1a1a;
-        }
-        
-        QMessageBox {
-            background-color: #1a1a1a;
-            color: #00ff41;
-        }
-        
-        QMessageBox QPushButton {
-            min-width: 80px;
-        }
-        """
+        return _stylesheet("Green Matrix")
         
     def get_system_theme(self):
         """System theme - uses OS default"""
-        return ""  # Empty stylesheet uses system default
\ No newline at end of file
+        return _stylesheet("System")
\ No newline at end of file